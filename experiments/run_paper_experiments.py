@@ -18,7 +18,8 @@ import sys
 import os
 from pathlib import Path
 import time
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -31,6 +32,40 @@ from src.simulation import (
 from src.visualization.static_plots import create_all_paper_figures
 
 
+def _run_algorithm(
+    physical_network,
+    slice_requests,
+    algorithm: str,
+    verbose: bool = False
+) -> Tuple[Dict, float]:
+    """
+    Simulate one algorithm on its own copy of the physical network.
+
+    Args:
+        physical_network: Physical network (copied, not modified)
+        slice_requests: Slice requests to simulate
+        algorithm: Algorithm name
+        verbose: Print simulation progress
+
+    Returns:
+        Tuple of (simulation results, elapsed seconds)
+    """
+    start_time = time.time()
+
+    # Create simulator
+    simulator = SliceProvisioningSimulator(
+        physical_network=physical_network.copy(),
+        algorithm=algorithm,
+        verbose=verbose
+    )
+
+    # Add requests and run
+    simulator.add_slice_requests(slice_requests)
+    result = simulator.run()
+
+    return result, time.time() - start_time
+
+
 def run_single_experiment(
     num_nodes: int,
     num_requests: int,
@@ -38,7 +73,8 @@ def run_single_experiment(
     connection_probability: float,
     algorithms: List[str],
     random_seed: int = 42,
-    verbose: bool = False
+    verbose: bool = False,
+    workers: Optional[int] = None
 ) -> Dict[str, Dict]:
     """
     Run a single experiment configuration with multiple algorithms.
@@ -51,6 +87,10 @@ def run_single_experiment(
         algorithms: List of algorithms to compare
         random_seed: Random seed for reproducibility
         verbose: Print simulation progress
+        workers: Number of worker processes running the algorithms
+            (None for one per algorithm up to the CPU count, 1 runs
+            sequentially in-process). Verbose runs are always sequential,
+            so their progress output does not interleave
 
     Returns:
         Dictionary mapping algorithm_name -> results
@@ -74,27 +114,39 @@ def run_single_experiment(
         random_seed=random_seed
     )
 
+    if verbose:
+        workers = 1
+    elif workers is None:
+        workers = min(len(algorithms), os.cpu_count() or 1)
+
     results = {}
 
-    for algorithm in algorithms:
-        print(f"    Running {algorithm}...", end=" ", flush=True)
-        start_time = time.time()
+    if workers <= 1:
+        for algorithm in algorithms:
+            print(f"    Running {algorithm}...", end=" ", flush=True)
+            result, elapsed = _run_algorithm(physical_network, slice_requests, algorithm, verbose)
+            results[algorithm] = result
 
-        # Create simulator
-        simulator = SliceProvisioningSimulator(
-            physical_network=physical_network.copy(),
-            algorithm=algorithm,
-            verbose=verbose
-        )
+            acceptance = result['metrics']['acceptance_ratio']
+            print(f"Done! (Acceptance: {acceptance:.2%}, Time: {elapsed:.1f}s)")
+
+        return results
+
+    # Algorithms are independent simulations: run them in parallel
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            algorithm: executor.submit(
+                _run_algorithm, physical_network, slice_requests, algorithm, verbose
+            )
+            for algorithm in algorithms
+        }
 
-        # Add requests and run
-        simulator.add_slice_requests(slice_requests)
-        result = simulator.run()
-        results[algorithm] = result
+        for algorithm in algorithms:
+            result, elapsed = futures[algorithm].result()
+            results[algorithm] = result
 
-        elapsed = time.time() - start_time
-        acceptance = result['metrics']['acceptance_ratio']
-        print(f"Done! (Acceptance: {acceptance:.2%}, Time: {elapsed:.1f}s)")
+            acceptance = result['metrics']['acceptance_ratio']
+            print(f"    {algorithm} done! (Acceptance: {acceptance:.2%}, Time: {elapsed:.1f}s)")
 
     return results
 
@@ -20,6 +20,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/SliceResourceUtilization",
     packages=find_packages(),
+    package_data={"src.visualization.dashboard": ["assets/*.css"]},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Science/Research",
@@ -49,6 +50,21 @@ setup(
             "sphinx>=7.0.0",
             "sphinx-rtd-theme>=1.3.0",
         ],
+        "fast": [
+            "numba>=0.58.0",
+        ],
+        "graphblas": [
+            "python-graphblas>=2023.1.0",
+        ],
+        "compress": [
+            "flask-compress>=1.13",
+        ],
+        "cache": [
+            "flask-caching>=2.0",
+        ],
+        "json": [
+            "orjson>=3.9",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -7,9 +7,11 @@ Based on Equations 16-19 from the paper.
 """
 
 from typing import Dict, List, Tuple, Optional
+import numpy as np
 from ..graph.network_graph import NetworkGraph
 from ..graph.physical_network import PhysicalNetwork
 from ..graph.slice_request import SliceRequest
+from ..graph.csr_cache import get_csr_adjacency, get_hop_distances
 from ..metrics.resource_attributes import local_resource, global_resource
 from ..metrics.topology_attributes import degree_centrality, closeness_centrality
 
@@ -143,13 +145,20 @@ class NodeRanker:
 
         total_hops = 0
 
+        # Hop counts come from the cached all-pairs BFS distance matrix
+        node_to_idx = get_csr_adjacency(physical_network).node_to_idx
+        distances = get_hop_distances(physical_network)
+        candidate_idx = node_to_idx.get(candidate_node)
+
         for neighbor_node in mapped_neighbors:
-            # Get shortest path
-            path = physical_network.shortest_path(candidate_node, neighbor_node)
+            neighbor_idx = node_to_idx.get(neighbor_node)
+
+            if candidate_idx is not None and neighbor_idx is not None:
+                hops = int(distances[candidate_idx, neighbor_idx])
+            else:
+                hops = -1
 
-            if path:
-                # Hop count is number of links (len(path) - 1)
-                hops = len(path) - 1
+            if hops >= 0:
                 total_hops += hops
             else:
                 # No path exists, use large penalty
@@ -226,22 +235,24 @@ class NodeRanker:
         expected_location = slice_request.get_node_expected_location(slice_node_id)
         max_deviation = slice_request.get_node_max_deviation(slice_node_id)
 
+        # Check location constraint (Equations 4-5) for all nodes at once
+        if expected_location is not None:
+            node_ids, locations = physical_network.get_location_array()
+            dx = locations[:, 0] - expected_location[0]
+            dy = locations[:, 1] - expected_location[1]
+            within = np.flatnonzero(np.sqrt(dx * dx + dy * dy) <= max_deviation)
+            physical_nodes = [node_ids[row] for row in within.tolist()]
+        else:
+            physical_nodes = physical_network.get_all_nodes()
+
         candidates = []
 
-        for physical_node in physical_network.get_all_nodes():
+        for physical_node in physical_nodes:
             # Check CPU constraint (Equation 3)
             available_cpu = physical_network.get_node_cpu_available(physical_node)
             if available_cpu < cpu_demand:
                 continue
 
-            # Check location constraint (Equations 4-5)
-            if expected_location is not None:
-                distance = physical_network.distance_to_location(
-                    physical_node, expected_location
-                )
-                if distance > max_deviation:
-                    continue
-
             candidates.append(physical_node)
 
         return candidates
@@ -0,0 +1,583 @@
+"""
+CSR Adjacency Module
+
+Provides a compressed sparse row (CSR) view of a network topology together
+with BFS kernels that operate on it. The CSR arrays are cached on the graph
+and rebuilt only when its topology changes.
+
+The kernels are compiled with Numba when it is installed and run as plain
+Python otherwise, so Numba remains an optional dependency.
+"""
+
+from typing import Dict, List, NamedTuple, Tuple
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+class CSRAdjacency(NamedTuple):
+    """
+    CSR adjacency of an undirected graph.
+
+    The neighbors of node index i are indices[indptr[i]:indptr[i + 1]].
+    Every undirected link occupies one slot in each direction; slot_of maps
+    each directed (u_idx, v_idx) link to its slot.
+    """
+    node_ids: List[str]
+    node_to_idx: Dict[str, int]
+    indptr: np.ndarray
+    indices: np.ndarray
+    slot_of: Dict[Tuple[int, int], int]
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes."""
+        return len(self.node_ids)
+
+    def edge_slot(self, u: int, v: int) -> int:
+        """
+        Get the CSR slot of the directed link u -> v.
+
+        Args:
+            u: Source node index
+            v: Destination node index
+
+        Returns:
+            Slot position in indices, or -1 if the link does not exist
+        """
+        return self.slot_of.get((u, v), -1)
+
+
+def get_csr_adjacency(graph) -> CSRAdjacency:
+    """
+    Get the CSR adjacency of a NetworkGraph, cached per topology version.
+
+    Args:
+        graph: NetworkGraph instance
+
+    Returns:
+        CSRAdjacency (shared, do not mutate)
+    """
+    return graph.get_cached_topology_data(('csr',), lambda: build_csr_adjacency(graph))
+
+
+def build_csr_adjacency(graph) -> CSRAdjacency:
+    """
+    Build the CSR adjacency of a NetworkGraph (uncached).
+
+    Args:
+        graph: NetworkGraph instance
+
+    Returns:
+        CSRAdjacency
+    """
+    node_ids = graph.get_all_nodes()
+    node_to_idx = {node_id: i for i, node_id in enumerate(node_ids)}
+
+    indptr = np.zeros(len(node_ids) + 1, dtype=np.int32)
+    indices = []
+    slot_of = {}
+    for i, node_id in enumerate(node_ids):
+        for neighbor in graph.graph.neighbors(node_id):
+            j = node_to_idx[neighbor]
+            slot_of[i, j] = len(indices)
+            indices.append(j)
+        indptr[i + 1] = len(indices)
+
+    return CSRAdjacency(
+        node_ids=node_ids,
+        node_to_idx=node_to_idx,
+        indptr=indptr,
+        indices=np.asarray(indices, dtype=np.int32),
+        slot_of=slot_of
+    )
+
+
+def get_slot_edge_data(graph, csr: CSRAdjacency) -> Tuple[List[dict], np.ndarray]:
+    """
+    Get the link attribute dicts behind the CSR slots, cached per topology.
+
+    networkx keeps one attribute dict per undirected link, shared by both
+    directions and updated in place by set_link_attribute, so the dicts
+    stay valid until the topology changes.
+
+    Args:
+        graph: NetworkGraph instance
+        csr: CSR adjacency of the graph
+
+    Returns:
+        Tuple of (one attribute dict per undirected link, int array mapping
+        each CSR slot to its link's position in that list)
+    """
+    def compute():
+        adjacency = graph.graph.adj
+        node_ids = csr.node_ids
+        edge_data = []
+        slot_to_edge = np.empty(len(csr.indices), dtype=np.int64)
+
+        for (u, v), slot in csr.slot_of.items():
+            if u < v:
+                slot_to_edge[slot] = len(edge_data)
+                slot_to_edge[csr.slot_of[v, u]] = len(edge_data)
+                edge_data.append(adjacency[node_ids[u]][node_ids[v]])
+
+        slot_to_edge.flags.writeable = False
+        return edge_data, slot_to_edge
+
+    return graph.get_cached_topology_data(('csr_edge_data',), compute)
+
+
+def get_edge_attribute_array(
+    graph,
+    csr: CSRAdjacency,
+    attribute: str,
+    default: float = 0.0
+) -> np.ndarray:
+    """
+    Gather a link attribute into an array aligned with the CSR slots.
+
+    Link attributes such as available bandwidth change without a topology
+    change, so this array is built per call rather than cached. Each
+    undirected link is read once and scattered to both of its slots.
+
+    Args:
+        graph: NetworkGraph instance
+        csr: CSR adjacency of the graph
+        attribute: Link attribute name
+        default: Value used when the attribute is missing
+
+    Returns:
+        Float array with one entry per CSR slot
+    """
+    edge_data, slot_to_edge = get_slot_edge_data(graph, csr)
+    values = np.fromiter(
+        (data.get(attribute, default) for data in edge_data),
+        dtype=np.float64,
+        count=len(edge_data)
+    )
+
+    return values[slot_to_edge]
+
+
+def get_cached_edge_attribute_array(
+    graph,
+    csr: CSRAdjacency,
+    attribute: str,
+    default: float = 0.0
+) -> np.ndarray:
+    """
+    Get a link attribute array aligned with the CSR slots, cached on the graph.
+
+    The array is reused until the topology changes or any link attribute
+    is set (e.g. bandwidth is allocated or released).
+
+    Args:
+        graph: NetworkGraph instance
+        csr: CSR adjacency of the graph
+        attribute: Link attribute name
+        default: Value used when the attribute is missing
+
+    Returns:
+        Read-only float array with one entry per CSR slot
+    """
+    def compute() -> np.ndarray:
+        values = get_edge_attribute_array(graph, csr, attribute, default)
+        values.flags.writeable = False
+        return values
+
+    return graph.get_cached_link_data(('edge_attribute', attribute, default), compute)
+
+
+@njit(cache=True)
+def bfs_distances(indptr: np.ndarray, indices: np.ndarray, source: int) -> np.ndarray:
+    """
+    Hop distances from source to every node (CSR BFS).
+
+    Args:
+        indptr: CSR row pointer array
+        indices: CSR column index array
+        source: Source node index
+
+    Returns:
+        int32 array of hop counts, -1 for unreachable nodes
+    """
+    num_nodes = indptr.shape[0] - 1
+    distance = np.full(num_nodes, -1, dtype=np.int32)
+    queue = np.empty(num_nodes, dtype=np.int32)
+
+    distance[source] = 0
+    queue[0] = source
+    head = 0
+    tail = 1
+
+    while head < tail:
+        node = queue[head]
+        head += 1
+        next_distance = distance[node] + 1
+        for slot in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[slot]
+            if distance[neighbor] < 0:
+                distance[neighbor] = next_distance
+                queue[tail] = neighbor
+                tail += 1
+
+    return distance
+
+
+@njit(cache=True)
+def all_pairs_bfs_distances(indptr: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Hop distances between every pair of nodes (one CSR BFS per source).
+
+    Args:
+        indptr: CSR row pointer array
+        indices: CSR column index array
+
+    Returns:
+        int32 |V|×|V| array of hop counts, -1 for unreachable pairs
+    """
+    num_nodes = indptr.shape[0] - 1
+    distances = np.empty((num_nodes, num_nodes), dtype=np.int32)
+
+    for source in range(num_nodes):
+        distances[source] = bfs_distances(indptr, indices, source)
+
+    return distances
+
+
+def get_hop_distances(graph) -> np.ndarray:
+    """
+    Get the all-pairs hop distance matrix of a NetworkGraph, cached per
+    topology version.
+
+    Rows and columns follow the node order of get_csr_adjacency(graph).
+
+    Args:
+        graph: NetworkGraph instance
+
+    Returns:
+        Read-only int32 |V|×|V| array, -1 for unreachable pairs
+    """
+    def compute() -> np.ndarray:
+        csr = get_csr_adjacency(graph)
+        distances = all_pairs_bfs_distances(csr.indptr, csr.indices)
+        distances.flags.writeable = False
+        return distances
+
+    return graph.get_cached_topology_data(('hop_distances',), compute)
+
+
+@njit(cache=True)
+def _bfs_parents(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    source: int,
+    target: int,
+    blocked_nodes: np.ndarray,
+    blocked_slots: np.ndarray
+):
+    """
+    BFS from source until target is reached, skipping blocked nodes and slots.
+
+    Returns:
+        Tuple of (parent, parent_slot, found) where parent[v] is the node
+        preceding v on the BFS tree and parent_slot[v] the CSR slot of that link
+    """
+    num_nodes = indptr.shape[0] - 1
+    parent = np.full(num_nodes, -1, dtype=np.int32)
+    parent_slot = np.full(num_nodes, -1, dtype=np.int32)
+
+    if blocked_nodes[source] or blocked_nodes[target]:
+        return parent, parent_slot, False
+
+    visited = np.zeros(num_nodes, dtype=np.uint8)
+    queue = np.empty(num_nodes, dtype=np.int32)
+
+    visited[source] = 1
+    queue[0] = source
+    head = 0
+    tail = 1
+    found = source == target
+
+    while head < tail and not found:
+        node = queue[head]
+        head += 1
+        for slot in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[slot]
+            if visited[neighbor] or blocked_nodes[neighbor] or blocked_slots[slot]:
+                continue
+            visited[neighbor] = 1
+            parent[neighbor] = node
+            parent_slot[neighbor] = slot
+            if neighbor == target:
+                found = True
+                break
+            queue[tail] = neighbor
+            tail += 1
+
+    return parent, parent_slot, found
+
+
+@njit(cache=True)
+def bfs_path(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    source: int,
+    target: int,
+    blocked_nodes: np.ndarray,
+    blocked_slots: np.ndarray
+) -> np.ndarray:
+    """
+    Minimum-hop path from source to target avoiding blocked nodes and links.
+
+    Args:
+        indptr: CSR row pointer array
+        indices: CSR column index array
+        source: Source node index
+        target: Target node index
+        blocked_nodes: uint8 mask over nodes (1 = excluded)
+        blocked_slots: uint8 mask over CSR slots (1 = link excluded)
+
+    Returns:
+        int32 array of node indices from source to target (empty if no path)
+    """
+    parent, parent_slot, found = _bfs_parents(
+        indptr, indices, source, target, blocked_nodes, blocked_slots
+    )
+
+    if not found:
+        return np.empty(0, dtype=np.int32)
+
+    # Walk the parent pointers back from the target
+    length = 1
+    node = target
+    while node != source:
+        node = parent[node]
+        length += 1
+
+    path = np.empty(length, dtype=np.int32)
+    node = target
+    for position in range(length - 1, -1, -1):
+        path[position] = node
+        node = parent[node]
+
+    return path
+
+
+@njit(cache=True)
+def bfs_path_slots(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    source: int,
+    target: int,
+    blocked_nodes: np.ndarray,
+    blocked_slots: np.ndarray
+):
+    """
+    Minimum-hop path plus the CSR slots of its links.
+
+    The slot array lets callers gather per-link values (bandwidth, weight)
+    for the whole path with a single vectorized index.
+
+    Args:
+        indptr: CSR row pointer array
+        indices: CSR column index array
+        source: Source node index
+        target: Target node index
+        blocked_nodes: uint8 mask over nodes (1 = excluded)
+        blocked_slots: uint8 mask over CSR slots (1 = link excluded)
+
+    Returns:
+        Tuple of (int32 node index array, int32 slot array with one entry
+        per link); both are empty if no path exists
+    """
+    parent, parent_slot, found = _bfs_parents(
+        indptr, indices, source, target, blocked_nodes, blocked_slots
+    )
+
+    if not found:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+
+    length = 1
+    node = target
+    while node != source:
+        node = parent[node]
+        length += 1
+
+    path = np.empty(length, dtype=np.int32)
+    slots = np.empty(length - 1, dtype=np.int32)
+    node = target
+    for position in range(length - 1, -1, -1):
+        path[position] = node
+        if position > 0:
+            slots[position - 1] = parent_slot[node]
+        node = parent[node]
+
+    return path, slots
+
+
+@njit(cache=True)
+def _expand_level(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    queue: np.ndarray,
+    head: int,
+    tail: int,
+    side: np.ndarray,
+    own_side: int,
+    link: np.ndarray,
+    link_slot: np.ndarray,
+    blocked_nodes: np.ndarray,
+    blocked_slots: np.ndarray
+):
+    """
+    Expand one full BFS level of one side of a bidirectional search.
+
+    Returns:
+        Tuple of (head, tail, meet_own, meet_other, meet_slot); meet_slot is
+        -1 unless a link to a node reached by the other side was found
+    """
+    level_end = tail
+
+    while head < level_end:
+        node = queue[head]
+        head += 1
+        for slot in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[slot]
+            if blocked_nodes[neighbor] or blocked_slots[slot]:
+                continue
+            if side[neighbor] == 0:
+                side[neighbor] = own_side
+                link[neighbor] = node
+                link_slot[neighbor] = slot
+                queue[tail] = neighbor
+                tail += 1
+            elif side[neighbor] != own_side:
+                return head, tail, node, neighbor, slot
+
+    return head, tail, -1, -1, -1
+
+
+@njit(cache=True)
+def bidirectional_bfs_path_slots(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    source: int,
+    target: int,
+    blocked_nodes: np.ndarray,
+    blocked_slots: np.ndarray
+):
+    """
+    Minimum-hop path found by a bidirectional BFS, plus its link slots.
+
+    Both searches advance one full level at a time, always expanding the
+    smaller frontier, and stop at the first link joining them. This visits
+    roughly 2·b^(d/2) nodes instead of b^d for a one-sided BFS.
+
+    The graph is undirected, so blocked_slots must mark both directions of
+    a blocked link, and the returned slots of the target-side half refer
+    to the reverse direction of each link (which carries the same values).
+
+    Args:
+        indptr: CSR row pointer array
+        indices: CSR column index array
+        source: Source node index
+        target: Target node index
+        blocked_nodes: uint8 mask over nodes (1 = excluded)
+        blocked_slots: uint8 mask over CSR slots (1 = link excluded)
+
+    Returns:
+        Tuple of (int32 node index array, int32 slot array with one entry
+        per link); both are empty if no path exists
+    """
+    if blocked_nodes[source] or blocked_nodes[target]:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+
+    if source == target:
+        path = np.empty(1, dtype=np.int32)
+        path[0] = source
+        return path, np.empty(0, dtype=np.int32)
+
+    num_nodes = indptr.shape[0] - 1
+
+    # side: 0 = unvisited, 1 = reached from source, 2 = reached from target
+    side = np.zeros(num_nodes, dtype=np.uint8)
+    parent = np.full(num_nodes, -1, dtype=np.int32)
+    parent_slot = np.full(num_nodes, -1, dtype=np.int32)
+    child = np.full(num_nodes, -1, dtype=np.int32)
+    child_slot = np.full(num_nodes, -1, dtype=np.int32)
+    forward_queue = np.empty(num_nodes, dtype=np.int32)
+    backward_queue = np.empty(num_nodes, dtype=np.int32)
+
+    side[source] = 1
+    side[target] = 2
+    forward_queue[0] = source
+    backward_queue[0] = target
+    forward_head, forward_tail = 0, 1
+    backward_head, backward_tail = 0, 1
+
+    meet_slot = -1
+    forward_meet = -1
+    backward_meet = -1
+
+    while forward_head < forward_tail and backward_head < backward_tail:
+        if forward_tail - forward_head <= backward_tail - backward_head:
+            forward_head, forward_tail, forward_meet, backward_meet, meet_slot = _expand_level(
+                indptr, indices, forward_queue, forward_head, forward_tail,
+                side, 1, parent, parent_slot, blocked_nodes, blocked_slots
+            )
+        else:
+            backward_head, backward_tail, backward_meet, forward_meet, meet_slot = _expand_level(
+                indptr, indices, backward_queue, backward_head, backward_tail,
+                side, 2, child, child_slot, blocked_nodes, blocked_slots
+            )
+        if meet_slot >= 0:
+            break
+
+    if meet_slot < 0:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+
+    # Hops from source to the forward meeting node and from the backward one to target
+    forward_length = 0
+    node = forward_meet
+    while node != source:
+        node = parent[node]
+        forward_length += 1
+
+    backward_length = 0
+    node = backward_meet
+    while node != target:
+        node = child[node]
+        backward_length += 1
+
+    length = forward_length + backward_length + 2
+    path = np.empty(length, dtype=np.int32)
+    slots = np.empty(length - 1, dtype=np.int32)
+
+    node = forward_meet
+    for position in range(forward_length, -1, -1):
+        path[position] = node
+        if position > 0:
+            slots[position - 1] = parent_slot[node]
+        node = parent[node]
+
+    slots[forward_length] = meet_slot
+
+    node = backward_meet
+    for position in range(forward_length + 1, length):
+        path[position] = node
+        if node != target:
+            slots[position] = child_slot[node]
+        node = child[node]
+
+    return path, slots
@@ -7,7 +7,7 @@ Uses NetworkX for graph operations.
 
 import networkx as nx
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Any, Callable, Dict, List, Tuple, Optional, Set
 from abc import ABC, abstractmethod
 
 
@@ -23,6 +23,16 @@ class NetworkGraph(ABC):
         self._node_attributes = {}
         self._link_attributes = {}
 
+        # Topology version, bumped on every structural change
+        self._version = 0
+        # Cache for topology-derived metrics (e.g. centralities)
+        self._centrality_cache = {}
+
+        # Link attribute version, bumped whenever a link attribute is set
+        self._link_version = 0
+        # Cache for data derived from link attributes (e.g. bandwidth arrays)
+        self._link_cache = {}
+
     def add_node(self, node_id: str, **attributes) -> None:
         """
         Add a node to the graph with attributes.
@@ -33,6 +43,7 @@ class NetworkGraph(ABC):
         """
         self.graph.add_node(node_id, **attributes)
         self._node_attributes[node_id] = attributes
+        self.bump_version()
 
     def add_link(self, source: str, dest: str, **attributes) -> None:
         """
@@ -47,6 +58,64 @@ class NetworkGraph(ABC):
         # Store link in both directions for undirected graph
         link_id = self._get_link_id(source, dest)
         self._link_attributes[link_id] = attributes
+        self.bump_version()
+
+    def bump_version(self) -> None:
+        """
+        Mark the graph topology as changed.
+
+        Invalidates all cached topology metrics. Called automatically by
+        add_node/add_link; call it manually after mutating self.graph directly.
+        """
+        self._version += 1
+        self._centrality_cache.clear()
+        self._link_cache.clear()
+
+    def get_cached_topology_data(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Get topology-derived data from the cache, computing it on a miss.
+
+        Entries are keyed by the topology version and node count, so they are
+        invalidated whenever the topology changes. The link count is left out
+        of the key: networkx counts links by summing all degrees, which is too
+        slow for a lookup made on every ranking call. Only data that depends
+        on the topology alone (not on mutable resource attributes) belongs here.
+
+        Args:
+            key: Hashable identifier of the cached data
+            compute: Function producing the data on a cache miss
+
+        Returns:
+            Cached data (shared, do not mutate)
+        """
+        cache_key = (key, self._version, self.num_nodes())
+
+        if cache_key not in self._centrality_cache:
+            self._centrality_cache[cache_key] = compute()
+
+        return self._centrality_cache[cache_key]
+
+    def get_cached_link_data(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Get link-attribute-derived data from the cache, computing it on a miss.
+
+        Entries are invalidated whenever the topology changes or a link
+        attribute is updated through set_link_attribute (e.g. on bandwidth
+        allocation).
+
+        Args:
+            key: Hashable identifier of the cached data
+            compute: Function producing the data on a cache miss
+
+        Returns:
+            Cached data (shared, do not mutate)
+        """
+        cache_key = (key, self._version, self._link_version)
+
+        if cache_key not in self._link_cache:
+            self._link_cache[cache_key] = compute()
+
+        return self._link_cache[cache_key]
 
     def get_node_attribute(self, node_id: str, attribute: str):
         """
@@ -106,6 +175,9 @@ class NetworkGraph(ABC):
             if link_id in self._link_attributes:
                 self._link_attributes[link_id][attribute] = value
 
+            self._link_version += 1
+            self._link_cache.clear()
+
     def get_all_nodes(self) -> List[str]:
         """
         Get list of all node IDs.
@@ -301,6 +373,21 @@ class NetworkGraph(ABC):
         """
         return list(nx.connected_components(self.graph))
 
+    def num_connected_components(self) -> int:
+        """
+        Get the number of connected components.
+
+        Returns:
+            Component count
+
+        Note:
+            Cached until the topology changes; no component lists are kept.
+        """
+        return self.get_cached_topology_data(
+            ('num_components',),
+            lambda: sum(1 for _ in nx.connected_components(self.graph))
+        )
+
     def subgraph(self, nodes: List[str]) -> nx.Graph:
         """
         Extract a subgraph containing the specified nodes.
@@ -367,6 +454,7 @@ class NetworkGraph(ABC):
         self.graph.clear()
         self._node_attributes.clear()
         self._link_attributes.clear()
+        self.bump_version()
 
         # Add nodes
         for node_data in data.get('nodes', []):
@@ -8,6 +8,7 @@ Manages resource allocation and availability.
 from typing import Dict, List, Tuple, Optional
 from .network_graph import NetworkGraph
 import math
+import numpy as np
 
 
 class PhysicalNetwork(NetworkGraph):
@@ -20,11 +21,20 @@ class PhysicalNetwork(NetworkGraph):
     - Resource allocation and deallocation for slices
     """
 
+    # Positions of each tracked attribute in the resource totals list
+    _NODE_TOTAL_SLOTS = {'cpu_initial': 0, 'cpu_used': 1}
+    _LINK_TOTAL_SLOTS = {'bandwidth_initial': 2, 'bandwidth_used': 3}
+
     def __init__(self):
         """Initialize an empty physical network."""
         super().__init__()
         self._slice_allocations = {}  # Maps slice_id -> resource allocation details
 
+        # Network-wide resource totals as (topology version, [cpu_initial,
+        # cpu_used, bw_initial, bw_used]); kept up to date on every resource
+        # attribute update and rebuilt lazily after a topology change
+        self._resource_totals: Optional[Tuple[int, List[float]]] = None
+
     def add_physical_node(
         self,
         node_id: str,
@@ -96,6 +106,29 @@ class PhysicalNetwork(NetworkGraph):
         """Get location coordinates of a node (loc)."""
         return self.get_node_attribute(node_id, 'location')
 
+    def get_location_array(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Get the locations of all nodes as one contiguous array.
+
+        Returns:
+            Tuple of (node IDs, (N, 2) array of (x, y) rows aligned with the
+            node IDs; inf for nodes without a location). Shared, do not mutate
+
+        Note:
+            Cached until the topology changes, so distance checks against
+            every node can be done in one vectorized pass.
+        """
+        def compute():
+            node_ids = self.get_all_nodes()
+            locations = np.full((len(node_ids), 2), np.inf)
+            for row, node_id in enumerate(node_ids):
+                location = self.get_node_location(node_id)
+                if location is not None:
+                    locations[row] = location
+            return node_ids, locations
+
+        return self.get_cached_topology_data(('locations',), compute)
+
     def get_link_bandwidth_initial(self, source: str, dest: str) -> float:
         """Get initial bandwidth of a link (b0)."""
         return self.get_link_attribute(source, dest, 'bandwidth_initial') or 0.0
@@ -158,6 +191,73 @@ class PhysicalNetwork(NetworkGraph):
             (node_loc[1] - location[1]) ** 2
         )
 
+    def set_node_attribute(self, node_id: str, attribute: str, value) -> None:
+        """
+        Set a specific attribute of a node.
+
+        Args:
+            node_id: Node identifier
+            attribute: Attribute name
+            value: New value
+
+        Note:
+            CPU capacity/usage changes are applied to the cached resource totals.
+            Location changes drop the cached topology data (location array).
+        """
+        slot = self._NODE_TOTAL_SLOTS.get(attribute)
+        if slot is not None and self._resource_totals_valid():
+            old = self.get_node_attribute(node_id, attribute) or 0.0
+            self._resource_totals[1][slot] += value - old
+        elif attribute == 'location':
+            self._centrality_cache.clear()
+
+        super().set_node_attribute(node_id, attribute, value)
+
+    def set_link_attribute(self, source: str, dest: str, attribute: str, value) -> None:
+        """
+        Set a specific attribute of a link.
+
+        Args:
+            source: Source node ID
+            dest: Destination node ID
+            attribute: Attribute name
+            value: New value
+
+        Note:
+            Bandwidth capacity/usage changes are applied to the cached
+            resource totals.
+        """
+        slot = self._LINK_TOTAL_SLOTS.get(attribute)
+        if slot is not None and self._resource_totals_valid() and self.graph.has_edge(source, dest):
+            old = self.get_link_attribute(source, dest, attribute) or 0.0
+            self._resource_totals[1][slot] += value - old
+
+        super().set_link_attribute(source, dest, attribute, value)
+
+    def _resource_totals_valid(self) -> bool:
+        """Check whether the cached resource totals match the current topology."""
+        return self._resource_totals is not None and self._resource_totals[0] == self._version
+
+    def _get_resource_totals(self) -> List[float]:
+        """
+        Get [cpu_initial, cpu_used, bw_initial, bw_used] summed over the network.
+
+        Returns:
+            Resource totals (shared, do not mutate)
+        """
+        if not self._resource_totals_valid():
+            nodes = self.get_all_nodes()
+            links = self.get_all_links()
+            totals = [
+                sum(self.get_node_cpu_initial(node) for node in nodes),
+                sum(self.get_node_cpu_used(node) for node in nodes),
+                sum(self.get_link_bandwidth_initial(u, v) for u, v in links),
+                sum(self.get_link_bandwidth_used(u, v) for u, v in links)
+            ]
+            self._resource_totals = (self._version, totals)
+
+        return self._resource_totals[1]
+
     def allocate_node_resources(
         self,
         node_id: str,
@@ -392,19 +492,13 @@ class PhysicalNetwork(NetworkGraph):
 
         Returns:
             Dictionary with CPU and bandwidth utilization percentages
-        """
-        total_cpu_initial = sum(
-            self.get_node_cpu_initial(node) for node in self.get_all_nodes()
-        )
-        total_cpu_used = sum(
-            self.get_node_cpu_used(node) for node in self.get_all_nodes()
-        )
 
-        total_bw_initial = sum(
-            self.get_link_bandwidth_initial(u, v) for u, v in self.get_all_links()
-        )
-        total_bw_used = sum(
-            self.get_link_bandwidth_used(u, v) for u, v in self.get_all_links()
+        Note:
+            Totals are maintained incrementally on allocation/deallocation,
+            so this is O(1) between topology changes.
+        """
+        total_cpu_initial, total_cpu_used, total_bw_initial, total_bw_used = (
+            self._get_resource_totals()
         )
 
         cpu_util = (total_cpu_used / total_cpu_initial * 100) if total_cpu_initial > 0 else 0
@@ -441,6 +535,9 @@ class PhysicalNetwork(NetworkGraph):
             self.set_link_attribute(source, dest, 'bandwidth_available', initial_bw)
             self.set_link_attribute(source, dest, 'bandwidth_used', 0.0)
 
+        # Rebuild totals exactly rather than carrying incremental rounding
+        self._resource_totals = None
+
     def __repr__(self) -> str:
         """String representation."""
         util = self.get_resource_utilization()
@@ -4,7 +4,7 @@ Slice Request Module
 Represents a 5G core network slice request with virtual topology and resource demands.
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Hashable, List, Tuple, Optional
 from .network_graph import NetworkGraph
 import time
 
@@ -46,7 +46,7 @@ class SliceRequest(NetworkGraph):
 
     def add_slice_node(
         self,
-        node_id: str,
+        node_id: Hashable,
         cpu_demand: float,
         expected_location: Tuple[float, float],
         max_deviation: float
@@ -55,7 +55,8 @@ class SliceRequest(NetworkGraph):
         Add a slice node (virtual network function) to the request.
 
         Args:
-            node_id: Unique identifier for the slice node
+            node_id: Unique identifier for the slice node (generated
+                requests use ints 0..n-1)
             cpu_demand: Required CPU capacity c(v^S)
             expected_location: Expected deployment location loc(v^S)
             max_deviation: Maximum allowed deployment deviation r(v^S)
@@ -74,8 +75,8 @@ class SliceRequest(NetworkGraph):
 
     def add_slice_link(
         self,
-        source: str,
-        dest: str,
+        source: Hashable,
+        dest: Hashable,
         bandwidth_demand: float
     ) -> None:
         """
@@ -95,7 +96,7 @@ class SliceRequest(NetworkGraph):
             bandwidth_demand=bandwidth_demand
         )
 
-    def get_node_cpu_demand(self, node_id: str) -> float:
+    def get_node_cpu_demand(self, node_id: Hashable) -> float:
         """
         Get the CPU demand of a slice node.
 
@@ -107,7 +108,7 @@ class SliceRequest(NetworkGraph):
         """
         return self.get_node_attribute(node_id, 'cpu_demand') or 0.0
 
-    def get_node_expected_location(self, node_id: str) -> Optional[Tuple[float, float]]:
+    def get_node_expected_location(self, node_id: Hashable) -> Optional[Tuple[float, float]]:
         """
         Get the expected deployment location of a slice node.
 
@@ -119,7 +120,7 @@ class SliceRequest(NetworkGraph):
         """
         return self.get_node_attribute(node_id, 'expected_location')
 
-    def get_node_max_deviation(self, node_id: str) -> float:
+    def get_node_max_deviation(self, node_id: Hashable) -> float:
         """
         Get the maximum allowed deployment deviation.
 
@@ -131,7 +132,7 @@ class SliceRequest(NetworkGraph):
         """
         return self.get_node_attribute(node_id, 'max_deviation') or 0.0
 
-    def get_link_bandwidth_demand(self, source: str, dest: str) -> float:
+    def get_link_bandwidth_demand(self, source: Hashable, dest: Hashable) -> float:
         """
         Get the bandwidth demand of a slice link.
 
@@ -156,13 +157,7 @@ class SliceRequest(NetworkGraph):
         Returns:
             Total revenue
         """
-        node_revenue = sum(
-            self.get_node_cpu_demand(node) for node in self.get_all_nodes()
-        )
-
-        link_revenue = sum(
-            self.get_link_bandwidth_demand(u, v) for u, v in self.get_all_links()
-        )
+        node_revenue, link_revenue = self._get_demand_totals()
 
         return node_revenue + link_revenue
 
@@ -182,9 +177,7 @@ class SliceRequest(NetworkGraph):
             Total cost
         """
         # Node cost (same as revenue)
-        node_cost = sum(
-            self.get_node_cpu_demand(node) for node in self.get_all_nodes()
-        )
+        node_cost = self.get_total_cpu_demand()
 
         # Link cost (bandwidth × hop count)
         link_cost = 0.0
@@ -203,7 +196,7 @@ class SliceRequest(NetworkGraph):
         Returns:
             Sum of all CPU demands
         """
-        return sum(self.get_node_cpu_demand(node) for node in self.get_all_nodes())
+        return self._get_demand_totals()[0]
 
     def get_total_bandwidth_demand(self) -> float:
         """
@@ -212,9 +205,39 @@ class SliceRequest(NetworkGraph):
         Returns:
             Sum of all bandwidth demands
         """
-        return sum(
-            self.get_link_bandwidth_demand(u, v) for u, v in self.get_all_links()
-        )
+        return self._get_demand_totals()[1]
+
+    def _get_demand_totals(self) -> Tuple[float, float]:
+        """
+        Get the total CPU and bandwidth demands, cached until the slice changes.
+
+        Returns:
+            Tuple of (total_cpu_demand, total_bandwidth_demand)
+        """
+        def compute() -> Tuple[float, float]:
+            total_cpu = sum(self.get_node_cpu_demand(node) for node in self.get_all_nodes())
+            total_bandwidth = sum(
+                self.get_link_bandwidth_demand(u, v) for u, v in self.get_all_links()
+            )
+            return total_cpu, total_bandwidth
+
+        return self.get_cached_link_data(('demand_totals',), compute)
+
+    def set_node_attribute(self, node_id: Hashable, attribute: str, value) -> None:
+        """
+        Set a specific attribute of a slice node.
+
+        Args:
+            node_id: Slice node identifier
+            attribute: Attribute name
+            value: New value
+
+        Note:
+            Changing a CPU demand invalidates the cached demand totals.
+        """
+        super().set_node_attribute(node_id, attribute, value)
+        if attribute == 'cpu_demand':
+            self._link_cache.clear()
 
     def set_status(self, status: str) -> None:
         """
@@ -15,7 +15,9 @@ from .topology_attributes import (
     degree_centrality,
     closeness_centrality,
     calculate_all_degree_centralities,
-    calculate_all_closeness_centralities
+    calculate_all_closeness_centralities,
+    calculate_all_betweenness_centralities,
+    calculate_all_eigenvector_centralities
 )
 
 from .performance_metrics import (
@@ -35,5 +37,7 @@ __all__ = [
     'calculate_all_local_resources',
     'calculate_all_global_resources',
     'calculate_all_degree_centralities',
-    'calculate_all_closeness_centralities'
+    'calculate_all_closeness_centralities',
+    'calculate_all_betweenness_centralities',
+    'calculate_all_eigenvector_centralities'
 ]
@@ -5,9 +5,58 @@ Implements degree centrality and closeness centrality for node ranking.
 Based on Equations 14-15 from the paper.
 """
 
-from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
+import heapq
 from ..graph.network_graph import NetworkGraph
+from ..graph.csr_cache import bfs_distances, get_csr_adjacency
+from . import graphblas_centrality
 import networkx as nx
+import numpy as np
+
+
+# Backends accepted by the all-nodes closeness/betweenness calculators
+CENTRALITY_BACKENDS = ('default', 'graphblas')
+
+
+def _get_cached_metric(
+    graph: NetworkGraph,
+    metric: str,
+    compute: Callable[[], Dict[str, float]]
+) -> Dict[str, float]:
+    """
+    Get a per-node metric dictionary from the graph's centrality cache.
+
+    Args:
+        graph: Network graph
+        metric: Metric name (e.g. 'dc', 'cc')
+        compute: Function computing the metric dictionary on a cache miss
+
+    Returns:
+        Cached dictionary mapping node_id -> metric value (do not mutate)
+    """
+    return graph.get_cached_topology_data((metric,), compute)
+
+
+def _check_backend(backend: str) -> None:
+    """Validate a centrality backend name and that its package is installed."""
+    if backend not in CENTRALITY_BACKENDS:
+        raise ValueError(
+            f"Unknown centrality backend '{backend}', expected one of {CENTRALITY_BACKENDS}"
+        )
+    if backend == 'graphblas':
+        graphblas_centrality._require_graphblas()
+
+
+def _backend_metric(metric: str, backend: str) -> str:
+    """
+    Cache slot of a metric computed by a backend.
+
+    Only default-backend results go into the slot that NodeRanker and the
+    single-node functions read; other backends keep their own slot.
+    """
+    return metric if backend == 'default' else f"{metric}-{backend}"
 
 
 def degree_centrality(node_id: str, graph: NetworkGraph) -> float:
@@ -73,25 +122,21 @@ def closeness_centrality(node_id: str, graph: NetworkGraph) -> float:
     """
     num_nodes = graph.num_nodes()
 
-    if num_nodes <= 1:
+    if num_nodes <= 1 or not graph.has_node(node_id):
         return 0.0
 
-    # Calculate shortest path distances to all other nodes
-    total_distance = 0.0
-    reachable_nodes = 0
-
-    for target_node in graph.get_all_nodes():
-        if target_node == node_id:
-            continue
-
-        distance = graph.shortest_path_length(node_id, target_node)
+    # Isolated node: no paths exist, skip the BFS
+    if graph.degree(node_id) == 0:
+        return 0.0
 
-        if distance != float('inf'):
-            total_distance += distance
-            reachable_nodes += 1
+    # Single BFS over the cached CSR adjacency gives all hop distances
+    csr = get_csr_adjacency(graph)
+    total_distance = _distance_sum(
+        bfs_distances(csr.indptr, csr.indices, csr.node_to_idx[node_id])
+    )
 
     # If node is isolated or no paths exist
-    if total_distance == 0 or reachable_nodes == 0:
+    if total_distance == 0:
         return 0.0
 
     # CC = (|V| - 1) / ∑ distances
@@ -113,12 +158,15 @@ def betweenness_centrality(node_id: str, graph: NetworkGraph) -> float:
 
     Returns:
         Normalized betweenness centrality
+
+    Note:
+        Reads from the cached result of calculate_all_betweenness_centralities,
+        so ranking all nodes costs a single NetworkX computation.
     """
-    try:
-        betweenness = nx.betweenness_centrality(graph.graph)
-        return betweenness.get(node_id, 0.0)
-    except:
-        return 0.0
+    betweenness = _get_cached_metric(
+        graph, 'bc', lambda: _compute_betweenness_centralities(graph)
+    )
+    return betweenness.get(node_id, 0.0)
 
 
 def eigenvector_centrality(node_id: str, graph: NetworkGraph) -> float:
@@ -134,22 +182,91 @@ def eigenvector_centrality(node_id: str, graph: NetworkGraph) -> float:
 
     Returns:
         Eigenvector centrality value
+
+    Note:
+        Reads from the cached result of calculate_all_eigenvector_centralities,
+        so ranking all nodes costs a single NetworkX computation.
+    """
+    # Isolated nodes are never in the largest connected component
+    if not graph.has_node(node_id) or graph.degree(node_id) == 0:
+        return 0.0
+
+    eigenvector = _get_cached_metric(
+        graph, 'ev', lambda: _compute_eigenvector_centralities(graph)
+    )
+    return eigenvector.get(node_id, 0.0)
+
+
+def calculate_all_betweenness_centralities(
+    graph: NetworkGraph,
+    backend: str = 'default'
+) -> Dict[str, float]:
+    """
+    Calculate betweenness centrality for all nodes in the graph.
+
+    Args:
+        graph: Network graph
+        backend: 'default' (NetworkX) or 'graphblas' (python-graphblas,
+            batched matrix BFS; faster on large topologies)
+
+    Returns:
+        Dictionary mapping node_id -> betweenness value
+
+    Raises:
+        ValueError: If backend is unknown
+        ImportError: If the graphblas backend is requested but not installed
+    """
+    _check_backend(backend)
+
+    def compute() -> Dict[str, float]:
+        if backend == 'graphblas':
+            return graphblas_centrality.compute_betweenness_centralities(graph)
+        return _compute_betweenness_centralities(graph)
+
+    return dict(_get_cached_metric(graph, _backend_metric('bc', backend), compute))
+
+
+def calculate_all_eigenvector_centralities(graph: NetworkGraph) -> Dict[str, float]:
+    """
+    Calculate eigenvector centrality for all nodes in the graph.
+
+    Nodes outside the largest connected component get a value of 0.
+
+    Args:
+        graph: Network graph
+
+    Returns:
+        Dictionary mapping node_id -> eigenvector centrality value
     """
+    return dict(_get_cached_metric(graph, 'ev', lambda: _compute_eigenvector_centralities(graph)))
+
+
+def _compute_betweenness_centralities(graph: NetworkGraph) -> Dict[str, float]:
+    """Compute betweenness centrality for all nodes (uncached)."""
+    try:
+        return nx.betweenness_centrality(graph.graph)
+    except Exception:
+        return {}
+
+
+def _compute_eigenvector_centralities(graph: NetworkGraph) -> Dict[str, float]:
+    """Compute eigenvector centrality for all nodes (uncached)."""
     try:
         if not graph.is_connected():
             # Eigenvector centrality requires connected graph
             # Use largest connected component
             largest_cc = max(nx.connected_components(graph.graph), key=len)
-            if node_id not in largest_cc:
-                return 0.0
             subgraph = graph.graph.subgraph(largest_cc)
             eigenvector = nx.eigenvector_centrality(subgraph, max_iter=1000)
         else:
             eigenvector = nx.eigenvector_centrality(graph.graph, max_iter=1000)
+    except Exception:
+        return {}
 
-        return eigenvector.get(node_id, 0.0)
-    except:
-        return 0.0
+    return {
+        node_id: eigenvector.get(node_id, 0.0)
+        for node_id in graph.get_all_nodes()
+    }
 
 
 def get_topology_score(
@@ -175,8 +292,8 @@ def get_topology_score(
     if use_degree_only:
         return dc
 
-    cc = closeness_centrality(node_id, graph)
-    return alpha * dc + (1 - alpha) * cc
+    cc = _get_cached_metric(graph, 'cc', lambda: _compute_closeness_centralities(graph))
+    return alpha * dc + (1 - alpha) * cc[node_id]
 
 
 def calculate_all_degree_centralities(graph: NetworkGraph) -> Dict[str, float]:
@@ -189,28 +306,149 @@ def calculate_all_degree_centralities(graph: NetworkGraph) -> Dict[str, float]:
     Returns:
         Dictionary mapping node_id -> DC value
     """
-    return {
-        node_id: degree_centrality(node_id, graph)
-        for node_id in graph.get_all_nodes()
-    }
+    return dict(_get_cached_metric(graph, 'dc', lambda: _compute_degree_centralities(graph)))
 
 
-def calculate_all_closeness_centralities(graph: NetworkGraph) -> Dict[str, float]:
+def calculate_all_closeness_centralities(
+    graph: NetworkGraph,
+    workers: int = 1,
+    backend: str = 'default'
+) -> Dict[str, float]:
     """
     Calculate closeness centrality for all nodes in the graph.
 
     Args:
         graph: Network graph
+        workers: Number of worker processes (1 computes in-process)
+        backend: 'default' (CSR BFS) or 'graphblas' (python-graphblas,
+            batched matrix BFS; faster on large topologies)
+
+    Returns:
+        Dictionary mapping node_id -> CC value
+
+    Raises:
+        ValueError: If backend is unknown
+        ImportError: If the graphblas backend is requested but not installed
+
+    Note:
+        Results are cached on the graph per backend and reused until its
+        topology changes.
+    """
+    _check_backend(backend)
+
+    def compute() -> Dict[str, float]:
+        if backend == 'graphblas':
+            return graphblas_centrality.compute_closeness_centralities(graph)
+        if workers > 1:
+            return _compute_closeness_centralities_parallel(graph, workers)
+        return _compute_closeness_centralities(graph)
+
+    return dict(_get_cached_metric(graph, _backend_metric('cc', backend), compute))
+
+
+def _compute_degree_centralities(graph: NetworkGraph) -> Dict[str, float]:
+    """Compute degree centrality for all nodes (uncached)."""
+    num_nodes = graph.num_nodes()
+
+    if num_nodes <= 1:
+        return {node_id: 0.0 for node_id in graph.get_all_nodes()}
+
+    # One pass over the degree view instead of a lookup per node
+    return {node_id: degree / (num_nodes - 1) for node_id, degree in graph.graph.degree()}
+
+
+def _compute_closeness_centralities(graph: NetworkGraph) -> Dict[str, float]:
+    """Compute closeness centrality for all nodes (uncached)."""
+    csr = get_csr_adjacency(graph)
+    num_nodes = csr.num_nodes
+
+    if num_nodes <= 1:
+        return {node_id: 0.0 for node_id in csr.node_ids}
+
+    result = {}
+    for i, node_id in enumerate(csr.node_ids):
+        # Isolated node: no paths exist, skip the BFS
+        if csr.indptr[i] == csr.indptr[i + 1]:
+            result[node_id] = 0.0
+            continue
+
+        total_distance = _distance_sum(bfs_distances(csr.indptr, csr.indices, i))
+        result[node_id] = (num_nodes - 1) / total_distance if total_distance > 0 else 0.0
+
+    return result
+
+
+def _distance_sum(distances: np.ndarray) -> int:
+    """Sum of hop distances to reachable nodes (unreachable nodes are -1)."""
+    return int(distances[distances > 0].sum())
+
+
+def _compute_closeness_centralities_parallel(
+    graph: NetworkGraph,
+    workers: int
+) -> Dict[str, float]:
+    """
+    Compute closeness centrality for all nodes using a process pool.
+
+    The adjacency is converted once to CSR form and shipped to each worker
+    through the pool initializer; workers run one BFS per source node over
+    their chunk of sources and return the per-source distance sums.
+
+    Args:
+        graph: Network graph
+        workers: Number of worker processes
 
     Returns:
         Dictionary mapping node_id -> CC value
     """
+    csr = get_csr_adjacency(graph)
+    node_ids = csr.node_ids
+    num_nodes = csr.num_nodes
+
+    if num_nodes <= 1:
+        return {node_id: 0.0 for node_id in node_ids}
+
+    sources = list(range(num_nodes))
+    chunksize = max(1, num_nodes // (workers * 4))
+    chunks = [sources[i:i + chunksize] for i in range(0, num_nodes, chunksize)]
+
+    total_distances = [0] * num_nodes
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_closeness_worker,
+        initargs=(csr.indptr, csr.indices)
+    ) as executor:
+        for partial_sums in executor.map(_closeness_distance_sums, chunks):
+            for source, total_distance in partial_sums:
+                total_distances[source] = total_distance
+
+    # CC = (|V| - 1) / ∑ distances (0 for isolated nodes)
     return {
-        node_id: closeness_centrality(node_id, graph)
-        for node_id in graph.get_all_nodes()
+        node_ids[i]: (num_nodes - 1) / total_distances[i] if total_distances[i] > 0 else 0.0
+        for i in range(num_nodes)
     }
 
 
+# Per-process CSR adjacency, set by the pool initializer
+_worker_adjacency = None
+
+
+def _init_closeness_worker(indptr: np.ndarray, indices: np.ndarray) -> None:
+    """Store the CSR adjacency in a worker process."""
+    global _worker_adjacency
+    _worker_adjacency = (indptr, indices)
+
+
+def _closeness_distance_sums(sources: List[int]) -> List[Tuple[int, int]]:
+    """Compute BFS distance sums for a chunk of sources (worker side)."""
+    indptr, indices = _worker_adjacency
+    return [
+        (source, _distance_sum(bfs_distances(indptr, indices, source)))
+        for source in sources
+    ]
+
+
 def calculate_all_centralities(graph: NetworkGraph) -> Dict[str, Dict[str, float]]:
     """
     Calculate all centrality metrics for all nodes.
@@ -221,26 +459,44 @@ def calculate_all_centralities(graph: NetworkGraph) -> Dict[str, Dict[str, float
     Returns:
         Dictionary mapping node_id -> {metric_name: value}
     """
-    all_nodes = graph.get_all_nodes()
-
-    # Calculate basic centralities
-    dc_values = calculate_all_degree_centralities(graph)
-    cc_values = calculate_all_closeness_centralities(graph)
+    # Read the cached metric dicts directly (no per-metric copies); the
+    # closeness BFS runs at most once per topology version
+    dc_values = _get_cached_metric(graph, 'dc', lambda: _compute_degree_centralities(graph))
+    cc_values = _get_cached_metric(graph, 'cc', lambda: _compute_closeness_centralities(graph))
 
-    # Combine into single dictionary
-    result = {}
-    for node_id in all_nodes:
-        result[node_id] = {
-            'degree_centrality': dc_values[node_id],
+    # Combine into single dictionary in one pass over the nodes
+    return {
+        node_id: {
+            'degree_centrality': dc,
             'closeness_centrality': cc_values[node_id]
         }
+        for node_id, dc in dc_values.items()
+    }
 
-    return result
+
+def _rank_items(
+    values: Dict[str, float],
+    descending: bool,
+    top_k: Optional[int]
+) -> List[Tuple[str, float]]:
+    """
+    Sort (node_id, value) items, optionally keeping only the first top_k.
+
+    For small top_k a heap selection (O(V log k)) replaces the full sort;
+    both keep the original order among equal values.
+    """
+    if top_k is not None and top_k < len(values) / 2:
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return select(top_k, values.items(), key=itemgetter(1))
+
+    ranked = sorted(values.items(), key=itemgetter(1), reverse=descending)
+    return ranked if top_k is None else ranked[:top_k]
 
 
 def rank_nodes_by_degree_centrality(
     graph: NetworkGraph,
-    descending: bool = True
+    descending: bool = True,
+    top_k: Optional[int] = None
 ) -> List[Tuple[str, float]]:
     """
     Rank all nodes by their degree centrality.
@@ -248,17 +504,19 @@ def rank_nodes_by_degree_centrality(
     Args:
         graph: Network graph
         descending: If True, rank from highest to lowest
+        top_k: If given, only return the first top_k nodes
 
     Returns:
         List of (node_id, DC_value) tuples, sorted
     """
     dc_values = calculate_all_degree_centralities(graph)
-    return sorted(dc_values.items(), key=lambda x: x[1], reverse=descending)
+    return _rank_items(dc_values, descending, top_k)
 
 
 def rank_nodes_by_closeness_centrality(
     graph: NetworkGraph,
-    descending: bool = True
+    descending: bool = True,
+    top_k: Optional[int] = None
 ) -> List[Tuple[str, float]]:
     """
     Rank all nodes by their closeness centrality.
@@ -266,12 +524,13 @@ def rank_nodes_by_closeness_centrality(
     Args:
         graph: Network graph
         descending: If True, rank from highest to lowest
+        top_k: If given, only return the first top_k nodes
 
     Returns:
         List of (node_id, CC_value) tuples, sorted
     """
     cc_values = calculate_all_closeness_centralities(graph)
-    return sorted(cc_values.items(), key=lambda x: x[1], reverse=descending)
+    return _rank_items(cc_values, descending, top_k)
 
 
 def normalize_centrality_metrics(metrics: Dict[str, float]) -> Dict[str, float]:
@@ -287,25 +546,24 @@ def normalize_centrality_metrics(metrics: Dict[str, float]) -> Dict[str, float]:
     if not metrics:
         return {}
 
-    values = list(metrics.values())
-    min_val = min(values)
-    max_val = max(values)
+    values = np.fromiter(metrics.values(), dtype=np.float64, count=len(metrics))
+    min_val = values.min()
+    max_val = values.max()
 
     if max_val == min_val:
         # All values are the same
         return {node_id: 1.0 for node_id in metrics.keys()}
 
-    normalized = {}
-    for node_id, value in metrics.items():
-        normalized[node_id] = (value - min_val) / (max_val - min_val)
+    normalized = (values - min_val) / (max_val - min_val)
 
-    return normalized
+    return dict(zip(metrics.keys(), normalized.tolist()))
 
 
 def get_node_importance_ranking(
     graph: NetworkGraph,
     dc_weight: float = 0.5,
-    cc_weight: float = 0.5
+    cc_weight: float = 0.5,
+    top_k: Optional[int] = None
 ) -> List[Tuple[str, float]]:
     """
     Rank nodes by a weighted combination of degree and closeness centrality.
@@ -314,6 +572,7 @@ def get_node_importance_ranking(
         graph: Network graph
         dc_weight: Weight for degree centrality
         cc_weight: Weight for closeness centrality
+        top_k: If given, only return the first top_k nodes
 
     Returns:
         List of (node_id, combined_score) tuples, sorted descending
@@ -326,4 +585,4 @@ def get_node_importance_ranking(
         score = dc_weight * dc_values[node_id] + cc_weight * cc_values[node_id]
         combined_scores[node_id] = score
 
-    return sorted(combined_scores.items(), key=lambda x: x[1], reverse=True)
+    return _rank_items(combined_scores, True, top_k)
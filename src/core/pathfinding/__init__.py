@@ -6,6 +6,7 @@ Implements k-shortest path algorithm for link provisioning.
 
 from .k_shortest_path import (
     Path,
+    PathList,
     yen_k_shortest_paths,
     k_shortest_paths_with_bandwidth,
     get_shortest_path
@@ -13,6 +14,7 @@ from .k_shortest_path import (
 
 __all__ = [
     'Path',
+    'PathList',
     'yen_k_shortest_paths',
     'k_shortest_paths_with_bandwidth',
     'get_shortest_path'
@@ -8,9 +8,16 @@ Reference: Yen, J.Y. (1971). Finding the k shortest loopless paths in a network.
 Time Complexity: O(k|V|(|E| + |V|log|V|))
 """
 
-from typing import List, Tuple, Optional
+from array import array
+from typing import List, Tuple, Optional, Sequence
+import heapq
 import networkx as nx
+import numpy as np
 from ..graph.physical_network import PhysicalNetwork
+from ..graph.csr_cache import (
+    CSRAdjacency, bidirectional_bfs_path_slots, get_cached_edge_attribute_array,
+    get_csr_adjacency
+)
 
 
 class Path:
@@ -21,9 +28,16 @@ class Path:
         nodes: List of node IDs in the path
         cost: Total cost (e.g., hop count, weighted distance)
         bandwidth: Minimum bandwidth along the path
+        indices: int32 CSR node indices of the path (None if built from IDs)
     """
 
-    def __init__(self, nodes: List[str], cost: float = 0.0, bandwidth: float = float('inf')):
+    def __init__(
+        self,
+        nodes: List[str],
+        cost: float = 0.0,
+        bandwidth: float = float('inf'),
+        indices: Optional[np.ndarray] = None
+    ):
         """
         Initialize a path.
 
@@ -31,10 +45,17 @@ class Path:
             nodes: List of node IDs forming the path
             cost: Total path cost
             bandwidth: Minimum bandwidth in the path
+            indices: CSR node indices matching nodes, if known
         """
         self.nodes = nodes
         self.cost = cost
         self.bandwidth = bandwidth
+        self.indices = indices
+
+        # Identity key for hashing and equality, built once: comparing and
+        # hashing one bytes object avoids per-call tuple allocation
+        self._key = "\x00".join(map(str, nodes)).encode()
+        self._hash = hash(self._key)
 
     @property
     def links(self) -> List[Tuple[str, str]]:
@@ -52,11 +73,11 @@ class Path:
 
     def __eq__(self, other: 'Path') -> bool:
         """Check if two paths are equal."""
-        return isinstance(other, Path) and self.nodes == other.nodes
+        return isinstance(other, Path) and self._key == other._key
 
     def __hash__(self) -> int:
         """Hash based on nodes."""
-        return hash(tuple(self.nodes))
+        return self._hash
 
     def __repr__(self) -> str:
         """String representation."""
@@ -67,6 +88,118 @@ class Path:
         return " -> ".join(self.nodes)
 
 
+class PathList:
+    """
+    Struct-of-arrays collection of paths over CSR node indices.
+
+    Path i occupies flat_nodes[offsets[i]:offsets[i + 1]]. Paths are only
+    materialized as Path objects (with node IDs) through as_path(), so the
+    search itself never allocates per-path objects or compares strings.
+
+    Attributes:
+        node_ids: Node ID for each node index
+        offsets: Start offset of each path in flat_nodes, plus an end sentinel
+        flat_nodes: Concatenated node indices of all paths
+    """
+
+    def __init__(self, node_ids: List[str]):
+        """
+        Initialize an empty path list.
+
+        Args:
+            node_ids: Node ID for each node index
+        """
+        self.node_ids = node_ids
+        self.offsets = [0]
+        self.flat_nodes = array('i')
+        self._costs = []
+        self._bandwidths = []
+
+    def __len__(self) -> int:
+        """Number of paths."""
+        return len(self._costs)
+
+    @property
+    def costs(self) -> np.ndarray:
+        """Cost of each path."""
+        return np.asarray(self._costs, dtype=np.float64)
+
+    @property
+    def bandwidths(self) -> np.ndarray:
+        """Bottleneck bandwidth of each path."""
+        return np.asarray(self._bandwidths, dtype=np.float64)
+
+    def append(self, nodes: array, cost: float, bandwidth: float) -> int:
+        """
+        Append a path.
+
+        Args:
+            nodes: Node indices of the path
+            cost: Total path cost
+            bandwidth: Minimum bandwidth along the path
+
+        Returns:
+            Index of the new path
+        """
+        self.flat_nodes.extend(nodes)
+        self.offsets.append(len(self.flat_nodes))
+        self._costs.append(cost)
+        self._bandwidths.append(bandwidth)
+        return len(self._costs) - 1
+
+    def nodes(self, i: int) -> array:
+        """Node indices of path i."""
+        return self.flat_nodes[self.offsets[i]:self.offsets[i + 1]]
+
+    def cost(self, i: int) -> float:
+        """Cost of path i."""
+        return self._costs[i]
+
+    def bandwidth(self, i: int) -> float:
+        """Bottleneck bandwidth of path i."""
+        return self._bandwidths[i]
+
+    def contains(self, nodes: array) -> bool:
+        """
+        Check whether a path with the given node indices is present.
+
+        Args:
+            nodes: Node indices (array('i'))
+
+        Returns:
+            True if an identical path is stored
+        """
+        flat_nodes = self.flat_nodes
+        offsets = self.offsets
+        length = len(nodes)
+
+        for i in range(len(self._costs)):
+            start = offsets[i]
+            if offsets[i + 1] - start == length and flat_nodes[start:start + length] == nodes:
+                return True
+
+        return False
+
+    def as_path(self, i: int) -> Path:
+        """
+        Materialize path i as a Path object.
+
+        Args:
+            i: Path index
+
+        Returns:
+            Path with node IDs, cost and bandwidth
+        """
+        node_ids = self.node_ids
+        indices = self.nodes(i)
+        return Path(
+            [node_ids[idx] for idx in indices],
+            self._costs[i],
+            self._bandwidths[i],
+            indices=np.array(indices, dtype=np.int32)
+        )
+
+
 def yen_k_shortest_paths(
     physical_network: PhysicalNetwork,
     source: str,
@@ -94,6 +227,11 @@ def yen_k_shortest_paths(
     Returns:
         List of Path objects, sorted by cost (up to k paths)
 
+    Note:
+        The physical network is only read, never copied or modified: removed
+        nodes and links are expressed as masks over the cached CSR adjacency
+        (or a restricted view for weighted searches).
+
     Reference:
         Yen, J.Y. (1971). "Finding the k shortest loopless paths in a network."
         Management Science, 17(11), 712-716.
@@ -104,171 +242,256 @@ def yen_k_shortest_paths(
     if not physical_network.has_node(source) or not physical_network.has_node(target):
         return []
 
-    # Graph for shortest path computation
-    graph = physical_network.graph.copy()
+    paths = _yen_path_list(physical_network, source, target, k, min_bandwidth, weight)
+
+    return [paths.as_path(i) for i in range(len(paths))]
+
+
+def _yen_path_list(
+    physical_network: PhysicalNetwork,
+    source: str,
+    target: str,
+    k: int,
+    min_bandwidth: float,
+    weight: Optional[str]
+) -> PathList:
+    """
+    Run Yen's algorithm on CSR node indices.
+
+    Args:
+        physical_network: Physical network graph
+        source: Source node ID
+        target: Target node ID
+        k: Number of paths to find
+        min_bandwidth: Minimum bandwidth required
+        weight: Edge attribute to use as weight (None for hop count)
+
+    Returns:
+        PathList of up to k paths, sorted by cost
+    """
+    csr = get_csr_adjacency(physical_network)
+    search = _SpurSearch(physical_network, csr, weight)
+    target_idx = csr.node_to_idx[target]
 
     # A: List of k shortest paths
-    A = []
+    A = PathList(csr.node_ids)
 
-    # B: Heap of potential k shortest paths
+    # B: Heap of (cost, index) of potential k shortest paths in candidates
+    candidates = PathList(csr.node_ids)
     B = []
 
-    try:
-        # Find the first shortest path
-        if weight:
-            first_path_nodes = nx.dijkstra_path(graph, source, target, weight=weight)
-            first_cost = nx.dijkstra_path_length(graph, source, target, weight=weight)
-        else:
-            first_path_nodes = nx.shortest_path(graph, source, target)
-            first_cost = len(first_path_nodes) - 1  # Hop count
-
-        # Calculate minimum bandwidth
-        first_bandwidth = _calculate_path_bandwidth(physical_network, first_path_nodes)
+    # Find the first shortest path
+    first = search.find(csr.node_to_idx[source], target_idx, (), ())
+    if first is None:
+        return A
 
-        # Check bandwidth constraint
-        if first_bandwidth >= min_bandwidth:
-            first_path = Path(first_path_nodes, first_cost, first_bandwidth)
-            A.append(first_path)
+    first_path_nodes, first_cost, first_bandwidth = first
 
-    except (nx.NetworkXNoPath, nx.NodeNotFound):
-        return []
+    # Check bandwidth constraint
+    if first_bandwidth >= min_bandwidth:
+        A.append(first_path_nodes, first_cost, first_bandwidth)
 
     # Find k-1 more paths
     for k_iter in range(1, k):
-        if not A:
+        if not len(A):
             break
 
         # The (k-1)th path
-        prev_path = A[-1]
+        prev_path_nodes = A.nodes(len(A) - 1)
+
+        # Cost and bottleneck bandwidth of the root path, extended per spur node
+        root_cost = 0
+        root_bandwidth = float('inf')
 
         # Iterate through each node in the previous path except the target
-        for i in range(len(prev_path.nodes) - 1):
+        for i in range(len(prev_path_nodes) - 1):
             # Spur node: node from which to find deviation
-            spur_node = prev_path.nodes[i]
+            spur_node = prev_path_nodes[i]
 
             # Root path: portion from source to spur node
-            root_path = prev_path.nodes[:i + 1]
+            root_path = prev_path_nodes[:i + 1]
 
-            # Create a copy of the graph for this iteration
-            temp_graph = graph.copy()
+            if i > 0:
+                link_cost, link_bandwidth = search.link_metrics(prev_path_nodes[i - 1], spur_node)
+                root_cost += link_cost
+                root_bandwidth = min(root_bandwidth, link_bandwidth)
 
-            # Remove links that are part of the previous shortest paths
+            # Links from the spur node used by previous shortest paths
             # sharing the same root path
-            for path in A:
-                if len(path.nodes) > i and path.nodes[:i + 1] == root_path:
-                    # Remove the link from spur node to next node in this path
-                    if len(path.nodes) > i + 1:
-                        spur_next = path.nodes[i + 1]
-                        if temp_graph.has_edge(spur_node, spur_next):
-                            temp_graph.remove_edge(spur_node, spur_next)
-
-            # Remove nodes in root path (except spur node) to ensure loop-free
-            for node in root_path[:-1]:
-                if temp_graph.has_node(node):
-                    temp_graph.remove_node(node)
-
-            # Find shortest path from spur node to target in modified graph
-            try:
-                if weight:
-                    spur_path_nodes = nx.dijkstra_path(temp_graph, spur_node, target, weight=weight)
-                    spur_cost = nx.dijkstra_path_length(temp_graph, spur_node, target, weight=weight)
-                else:
-                    spur_path_nodes = nx.shortest_path(temp_graph, spur_node, target)
-                    spur_cost = len(spur_path_nodes) - 1
-
-                # Combine root path and spur path
-                total_path_nodes = root_path[:-1] + spur_path_nodes
-
-                # Calculate cost
-                if weight:
-                    total_cost = _calculate_path_cost(graph, total_path_nodes, weight)
-                else:
-                    total_cost = len(total_path_nodes) - 1
-
-                # Calculate bandwidth
-                total_bandwidth = _calculate_path_bandwidth(physical_network, total_path_nodes)
+            removed_edges = []
+            for j in range(len(A)):
+                path_nodes = A.nodes(j)
+                if len(path_nodes) > i + 1 and path_nodes[:i + 1] == root_path:
+                    removed_edges.append((spur_node, path_nodes[i + 1]))
+
+            # Nodes in root path (except spur node) are excluded to ensure loop-free
+            removed_nodes = root_path[:-1]
+
+            # Find shortest path from spur node to target avoiding removed elements;
+            # its cost and bandwidth are accumulated during the search
+            spur = search.find(spur_node, target_idx, removed_nodes, removed_edges, root_cost)
+            if spur is None:
+                continue
 
-                # Check bandwidth constraint
-                if total_bandwidth >= min_bandwidth:
-                    total_path = Path(total_path_nodes, total_cost, total_bandwidth)
+            spur_path_nodes, total_cost, spur_bandwidth = spur
+            total_bandwidth = min(root_bandwidth, spur_bandwidth)
 
-                    # Add to potential paths if not already found
-                    if total_path not in A and total_path not in B:
-                        B.append(total_path)
+            # Check bandwidth constraint
+            if total_bandwidth >= min_bandwidth:
+                # Combine root path and spur path
+                total_path_nodes = removed_nodes + spur_path_nodes
 
-            except (nx.NetworkXNoPath, nx.NodeNotFound):
-                continue
+                # Add to potential paths if not already found
+                if not A.contains(total_path_nodes) and not candidates.contains(total_path_nodes):
+                    index = candidates.append(total_path_nodes, total_cost, total_bandwidth)
+                    heapq.heappush(B, (total_cost, index))
 
         if not B:
             break
 
-        # Sort B by cost and add the shortest to A
-        B.sort(key=lambda p: p.cost)
-        A.append(B.pop(0))
+        # Add the cheapest candidate to A (ties go to the earliest found)
+        _, index = heapq.heappop(B)
+        A.append(candidates.nodes(index), candidates.cost(index), candidates.bandwidth(index))
 
     return A
 
 
-def _calculate_path_bandwidth(
-    physical_network: PhysicalNetwork,
-    path_nodes: List[str]
-) -> float:
+class _SpurSearch:
     """
-    Calculate the minimum bandwidth along a path.
+    Shortest path search with temporarily removed nodes and links.
 
-    Args:
-        physical_network: Physical network
-        path_nodes: List of node IDs in the path
+    Hop-count searches run a bidirectional BFS kernel over the cached CSR
+    adjacency with reusable node and link masks; weighted searches run
+    Dijkstra on a restricted view. Neither copies the graph. Link bandwidth
+    (and weights) are read from arrays indexed by CSR slot that are cached
+    on the network until a link attribute changes, so consecutive searches
+    between allocations share one snapshot.
 
-    Returns:
-        Minimum bandwidth (bottleneck bandwidth)
+    Attributes:
+        slot_bandwidth: Available bandwidth per CSR slot
+        slot_weight: Weight per CSR slot (None for hop count)
     """
-    if len(path_nodes) < 2:
-        return float('inf')
-
-    min_bandwidth = float('inf')
 
-    for i in range(len(path_nodes) - 1):
-        source, dest = path_nodes[i], path_nodes[i + 1]
-        bandwidth = physical_network.get_link_bandwidth_available(source, dest)
+    def __init__(self, physical_network: PhysicalNetwork, csr: CSRAdjacency, weight: Optional[str]):
+        """
+        Initialize the search.
 
-        if bandwidth is not None:
-            min_bandwidth = min(min_bandwidth, bandwidth)
+        Args:
+            physical_network: Physical network
+            csr: CSR adjacency of the physical network
+            weight: Edge attribute to use as weight (None for hop count)
+        """
+        self.physical_network = physical_network
+        self.csr = csr
+        self.weight = weight
+        self.blocked_nodes = np.zeros(csr.num_nodes, dtype=np.uint8)
+        self.blocked_slots = np.zeros(len(csr.indices), dtype=np.uint8)
+
+        self.slot_of = csr.slot_of
+        self.slot_bandwidth = get_cached_edge_attribute_array(
+            physical_network, csr, 'bandwidth_available', 0.0
+        )
+        self.slot_weight = (
+            get_cached_edge_attribute_array(physical_network, csr, weight, 1.0)
+            if weight else None
+        )
+
+    def link_metrics(self, u: int, v: int) -> Tuple[float, float]:
+        """
+        Get the cost and available bandwidth of link u -> v.
 
-    return min_bandwidth if min_bandwidth != float('inf') else 0.0
+        Args:
+            u: Source node index
+            v: Destination node index
 
+        Returns:
+            Tuple of (cost, bandwidth)
+        """
+        slot = self.slot_of[u, v]
+        cost = float(self.slot_weight[slot]) if self.slot_weight is not None else 1
+        return cost, float(self.slot_bandwidth[slot])
+
+    def find(
+        self,
+        source: int,
+        target: int,
+        removed_nodes: Sequence[int],
+        removed_edges: Sequence[Tuple[int, int]],
+        base_cost: float = 0
+    ) -> Optional[Tuple[array, float, float]]:
+        """
+        Find a shortest path while ignoring some nodes and links.
 
-def _calculate_path_cost(
-    graph: nx.Graph,
-    path_nodes: List[str],
-    weight: Optional[str]
-) -> float:
+        Args:
+            source: Source node index
+            target: Target node index
+            removed_nodes: Node indices that may not be traversed
+            removed_edges: Links (either direction) that may not be traversed
+            base_cost: Cost already accumulated before source (root path)
+
+        Returns:
+            Tuple of (node indices from source to target, base_cost plus path
+            cost, bottleneck bandwidth), or None if no path exists
+        """
+        csr = self.csr
+
+        if self.weight:
+            node_ids = csr.node_ids
+            view = nx.restricted_view(
+                self.physical_network.graph,
+                [node_ids[u] for u in removed_nodes],
+                [(node_ids[u], node_ids[v]) for u, v in removed_edges]
+            )
+            try:
+                path = nx.dijkstra_path(view, node_ids[source], node_ids[target], weight=self.weight)
+            except (nx.NetworkXNoPath, nx.NodeNotFound):
+                return None
+            path_nodes = array('i', [csr.node_to_idx[node] for node in path])
+            slots = np.fromiter(
+                (self.slot_of[link] for link in zip(path_nodes, path_nodes[1:])),
+                dtype=np.int32,
+                count=len(path_nodes) - 1
+            )
+            cost = base_cost + float(self.slot_weight[slots].sum())
+            return path_nodes, cost, _bottleneck(self.slot_bandwidth, slots)
+
+        removed_slots = [self.slot_of[u, v] for u, v in removed_edges]
+        removed_slots.extend(self.slot_of[v, u] for u, v in removed_edges)
+
+        nodes = list(removed_nodes)
+        self.blocked_nodes[nodes] = 1
+        self.blocked_slots[removed_slots] = 1
+        try:
+            path, slots = bidirectional_bfs_path_slots(
+                csr.indptr, csr.indices, source, target,
+                self.blocked_nodes, self.blocked_slots
+            )
+        finally:
+            self.blocked_nodes[nodes] = 0
+            self.blocked_slots[removed_slots] = 0
+
+        if len(path) == 0:
+            return None
+
+        cost = base_cost + len(slots)  # Hop count
+        return array('i', path.tolist()), cost, _bottleneck(self.slot_bandwidth, slots)
+
+
+def _bottleneck(slot_bandwidth: np.ndarray, slots: np.ndarray) -> float:
     """
-    Calculate the total cost of a path.
+    Minimum bandwidth over the given CSR slots (inf for an empty path).
 
     Args:
-        graph: NetworkX graph
-        path_nodes: List of node IDs in the path
-        weight: Edge attribute to use as weight
+        slot_bandwidth: Available bandwidth per CSR slot
+        slots: CSR slots of the path links
 
     Returns:
-        Total path cost
+        Bottleneck bandwidth
     """
-    if len(path_nodes) < 2:
-        return 0.0
-
-    total_cost = 0.0
-
-    for i in range(len(path_nodes) - 1):
-        source, dest = path_nodes[i], path_nodes[i + 1]
-
-        if weight and graph.has_edge(source, dest):
-            edge_weight = graph[source][dest].get(weight, 1.0)
-            total_cost += edge_weight
-        else:
-            total_cost += 1.0  # Hop count
+    if len(slots) == 0:
+        return float('inf')
 
-    return total_cost
+    return float(np.minimum.reduce(slot_bandwidth[slots]))
 
 
 def k_shortest_paths_with_bandwidth(
@@ -7,11 +7,16 @@ Provides simulation framework for slice provisioning experiments.
 from .topology_generator import (
     generate_physical_network,
     generate_waxman_topology,
-    generate_erdos_renyi_topology
+    generate_erdos_renyi_topology,
+    generate_many,
+    generate_physical_network_cached,
+    clear_network_cache
 )
 
 from .request_generator import (
     generate_slice_requests,
+    generate_slice_requests_iter,
+    generate_slice_requests_cached,
     get_request_statistics
 )
 
@@ -25,7 +30,12 @@ __all__ = [
     'generate_physical_network',
     'generate_waxman_topology',
     'generate_erdos_renyi_topology',
+    'generate_many',
+    'generate_physical_network_cached',
+    'clear_network_cache',
     'generate_slice_requests',
+    'generate_slice_requests_iter',
+    'generate_slice_requests_cached',
     'get_request_statistics',
     'SliceProvisioningSimulator',
     'run_single_simulation',
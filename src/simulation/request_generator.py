@@ -5,11 +5,14 @@ Generates slice requests with Poisson arrivals and exponential lifetimes.
 Based on Table 2 parameters from the paper.
 """
 
+import pickle
 import random
-import math
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import Iterator, List, Tuple, Optional
 import networkx as nx
+import numpy as np
 from ..core.graph.slice_request import SliceRequest
+from ..utils.cache_keys import freeze_kwargs
 
 
 def generate_slice_requests(
@@ -22,7 +25,8 @@ def generate_slice_requests(
     bandwidth_range: Tuple[float, float] = (1, 20),
     area_size: Tuple[float, float] = (500, 500),
     max_location_deviation: float = 80,
-    random_seed: Optional[int] = None
+    random_seed: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None
 ) -> List[SliceRequest]:
     """
     Generate a list of slice requests with specified parameters.
@@ -41,6 +45,8 @@ def generate_slice_requests(
         area_size: (width, height) for expected locations
         max_location_deviation: Maximum allowed deployment deviation
         random_seed: Random seed for reproducibility
+        rng: Random number generator to draw from (overrides random_seed);
+            give each parallel run its own generator
 
     Returns:
         List of SliceRequest objects, sorted by arrival time
@@ -55,40 +61,131 @@ def generate_slice_requests(
         - bandwidth_range: (1, 20)
         - max_location_deviation: 80
     """
-    if random_seed is not None:
-        random.seed(random_seed)
+    return list(generate_slice_requests_iter(
+        num_requests=num_requests,
+        arrival_rate=arrival_rate,
+        avg_lifetime=avg_lifetime,
+        node_range=node_range,
+        connection_probability=connection_probability,
+        cpu_range=cpu_range,
+        bandwidth_range=bandwidth_range,
+        area_size=area_size,
+        max_location_deviation=max_location_deviation,
+        random_seed=random_seed,
+        rng=rng
+    ))
+
+
+def generate_slice_requests_cached(num_requests: int, **kwargs) -> List[SliceRequest]:
+    """
+    Generate slice requests, reusing earlier results for the same seeded
+    parameters.
 
-    requests = []
-    current_time = 0.0
+    Request lists are kept pickled in memory (LRU, 8 entries) and every call
+    returns a fresh copy, since the simulator updates each request's status.
+    Unpickling is about twice as fast as regenerating.
 
-    for i in range(num_requests):
-        # Generate arrival time using Poisson process
-        # Inter-arrival time follows exponential distribution
-        inter_arrival_time = random.expovariate(arrival_rate)
-        current_time += inter_arrival_time
+    Args:
+        num_requests: Total number of slice requests to generate
+        **kwargs: Other generate_slice_requests parameters
 
-        # Generate lifetime using exponential distribution
-        lifetime = random.expovariate(1.0 / avg_lifetime)
+    Returns:
+        List of SliceRequest objects, sorted by arrival time
 
-        # Generate slice topology
-        num_nodes = random.randint(node_range[0], node_range[1])
+    Note:
+        Calls without a random_seed, or with an explicit rng, are not
+        reproducible and bypass the cache.
+    """
+    if kwargs.get('random_seed') is None or kwargs.get('rng') is not None:
+        return generate_slice_requests(num_requests, **kwargs)
 
-        slice_request = _generate_single_slice_request(
+    frozen_kwargs = freeze_kwargs(kwargs)
+    try:
+        hash(frozen_kwargs)
+    except TypeError:
+        # Unhashable arguments (e.g. nested lists): no cache
+        return generate_slice_requests(num_requests, **kwargs)
+
+    return pickle.loads(_load_requests_pickle(num_requests, frozen_kwargs))
+
+
+@lru_cache(maxsize=8)
+def _load_requests_pickle(num_requests: int, frozen_kwargs: Tuple) -> bytes:
+    """Pickled request list for a parameter set."""
+    return pickle.dumps(
+        generate_slice_requests(num_requests, **dict(frozen_kwargs)),
+        protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+def generate_slice_requests_iter(
+    num_requests: int,
+    arrival_rate: float = 0.04,
+    avg_lifetime: float = 500,
+    node_range: Tuple[int, int] = (2, 10),
+    connection_probability: float = 0.5,
+    cpu_range: Tuple[float, float] = (1, 20),
+    bandwidth_range: Tuple[float, float] = (1, 20),
+    area_size: Tuple[float, float] = (500, 500),
+    max_location_deviation: float = 80,
+    random_seed: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None
+) -> Iterator[SliceRequest]:
+    """
+    Lazily generate slice requests in arrival order.
+
+    Arrival times, lifetimes and slice sizes are drawn up front as arrays;
+    each SliceRequest (and its topology) is only built when requested, so
+    callers that consume the stream incrementally never hold all requests
+    in memory. Yields the same requests as generate_slice_requests for the
+    same parameters and seed.
+
+    Args:
+        num_requests: Total number of slice requests to generate
+        arrival_rate: Mean arrival rate (requests per time unit)
+        avg_lifetime: Average lifetime of slices (time units)
+        node_range: (min, max) number of nodes in each slice
+        connection_probability: Probability of connecting two slice nodes
+        cpu_range: (min, max) CPU demand for slice nodes
+        bandwidth_range: (min, max) bandwidth demand for slice links
+        area_size: (width, height) for expected locations
+        max_location_deviation: Maximum allowed deployment deviation
+        random_seed: Random seed for reproducibility
+        rng: Random number generator to draw from (overrides random_seed)
+
+    Yields:
+        SliceRequest objects, in non-decreasing arrival time
+    """
+    if rng is None:
+        rng = np.random.default_rng(random_seed)
+
+    # Generate arrival times using Poisson process:
+    # inter-arrival times follow an exponential distribution
+    inter_arrival_times = rng.exponential(1.0 / arrival_rate, num_requests)
+    arrival_times = np.cumsum(inter_arrival_times).tolist()
+
+    # Generate lifetimes using exponential distribution
+    lifetimes = rng.exponential(avg_lifetime, num_requests).tolist()
+
+    # Number of nodes of each slice topology
+    num_nodes_per_request = rng.integers(
+        node_range[0], node_range[1] + 1, num_requests
+    ).tolist()
+
+    for i in range(num_requests):
+        yield _generate_single_slice_request(
             slice_id=f"SR{i}",
-            arrival_time=current_time,
-            lifetime=lifetime,
-            num_nodes=num_nodes,
+            arrival_time=arrival_times[i],
+            lifetime=lifetimes[i],
+            num_nodes=num_nodes_per_request[i],
             connection_probability=connection_probability,
             cpu_range=cpu_range,
             bandwidth_range=bandwidth_range,
             area_size=area_size,
-            max_location_deviation=max_location_deviation
+            max_location_deviation=max_location_deviation,
+            rng=rng
         )
 
-        requests.append(slice_request)
-
-    return requests
-
 
 def _generate_single_slice_request(
     slice_id: str,
@@ -99,7 +196,8 @@ def _generate_single_slice_request(
     cpu_range: Tuple[float, float],
     bandwidth_range: Tuple[float, float],
     area_size: Tuple[float, float],
-    max_location_deviation: float
+    max_location_deviation: float,
+    rng: np.random.Generator
 ) -> SliceRequest:
     """
     Generate a single slice request with random topology.
@@ -114,86 +212,161 @@ def _generate_single_slice_request(
         bandwidth_range: (min, max) bandwidth demand
         area_size: (width, height) for expected locations
         max_location_deviation: Maximum deployment deviation
+        rng: Random number generator
 
     Returns:
         SliceRequest instance
     """
     slice_request = SliceRequest(slice_id, arrival_time, lifetime)
 
-    # Generate slice nodes
-    for j in range(num_nodes):
-        node_id = f"{slice_id}_VN{j}"
-
-        # Random CPU demand
-        cpu_demand = random.uniform(cpu_range[0], cpu_range[1])
-
-        # Random expected location
-        expected_x = random.uniform(0, area_size[0])
-        expected_y = random.uniform(0, area_size[1])
-        expected_location = (expected_x, expected_y)
+    # Draw all random quantities first, then build the slice from plain arrays
+    cpu_demands, expected_xs, expected_ys, link_sources, link_targets, bandwidth_demands = (
+        _generate_slice_arrays(
+            num_nodes, connection_probability, cpu_range, bandwidth_range, area_size, rng
+        )
+    )
 
-        # Add slice node
+    # Generate slice nodes. Slice node IDs only need to be unique within
+    # the slice, so they are plain ints 0..num_nodes-1 (cheap to hash and
+    # identical to the array indices used below)
+    for j in range(num_nodes):
         slice_request.add_slice_node(
-            node_id,
-            cpu_demand,
-            expected_location,
+            j,
+            cpu_demands[j],
+            (expected_xs[j], expected_ys[j]),
             max_location_deviation
         )
 
-    # Generate slice links using Erdős-Rényi model
-    node_list = slice_request.get_all_nodes()
+    # Union-find over node indices tracks connectivity while links are added
+    parent = list(range(num_nodes))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]  # Path halving
+            node = parent[node]
+        return node
+
+    num_components = num_nodes
 
-    for i in range(len(node_list)):
-        for j in range(i + 1, len(node_list)):
-            # Connect with probability
-            if random.random() < connection_probability:
-                node1, node2 = node_list[i], node_list[j]
-                bandwidth_demand = random.uniform(bandwidth_range[0], bandwidth_range[1])
+    for i, j, bandwidth_demand in zip(link_sources, link_targets, bandwidth_demands):
+        slice_request.add_slice_link(i, j, bandwidth_demand)
 
-                slice_request.add_slice_link(node1, node2, bandwidth_demand)
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[root_j] = root_i
+            num_components -= 1
 
     # Ensure connectivity if not connected
-    if not slice_request.is_connected() and num_nodes > 1:
-        _ensure_slice_connectivity(slice_request, bandwidth_range)
+    if num_components > 1:
+        # Group nodes by root; components are ordered by their first node
+        components = {}
+        for j in range(num_nodes):
+            components.setdefault(find(j), []).append(j)
+
+        _ensure_slice_connectivity(
+            slice_request, list(components.values()), bandwidth_range, rng
+        )
 
     return slice_request
 
 
+def _generate_slice_arrays(
+    num_nodes: int,
+    connection_probability: float,
+    cpu_range: Tuple[float, float],
+    bandwidth_range: Tuple[float, float],
+    area_size: Tuple[float, float],
+    rng: np.random.Generator
+) -> Tuple[List[float], List[float], List[float], List[int], List[int], List[float]]:
+    """
+    Draw all random quantities of one slice topology as flat arrays.
+
+    Every array is drawn at its final size with a single Generator call.
+    Links follow the Erdős-Rényi model: one Bernoulli draw per node pair
+    (i < j), in row-major pair order.
+
+    Args:
+        num_nodes: Number of nodes in the slice
+        connection_probability: Probability of connecting two nodes
+        cpu_range: (min, max) CPU demand
+        bandwidth_range: (min, max) bandwidth demand
+        area_size: (width, height) for expected locations
+        rng: Random number generator
+
+    Returns:
+        Tuple of (cpu_demands, expected_xs, expected_ys, link_sources,
+        link_targets, bandwidth_demands); links are given as node indices
+    """
+    cpu_demands = rng.uniform(cpu_range[0], cpu_range[1], num_nodes)
+    expected_xs = rng.uniform(0, area_size[0], num_nodes)
+    expected_ys = rng.uniform(0, area_size[1], num_nodes)
+
+    pair_sources, pair_targets = _node_pairs(num_nodes)
+    connected = rng.random(pair_sources.size) < connection_probability
+
+    link_sources = pair_sources[connected]
+    link_targets = pair_targets[connected]
+    bandwidth_demands = rng.uniform(bandwidth_range[0], bandwidth_range[1], link_sources.size)
+
+    return (
+        cpu_demands.tolist(),
+        expected_xs.tolist(),
+        expected_ys.tolist(),
+        link_sources.tolist(),
+        link_targets.tolist(),
+        bandwidth_demands.tolist()
+    )
+
+
+@lru_cache(maxsize=None)
+def _node_pairs(num_nodes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Upper-triangle (i < j) node index pairs, cached per slice size."""
+    pair_sources, pair_targets = np.triu_indices(num_nodes, k=1)
+    pair_sources.flags.writeable = False
+    pair_targets.flags.writeable = False
+    return pair_sources, pair_targets
+
+
 def _ensure_slice_connectivity(
     slice_request: SliceRequest,
-    bandwidth_range: Tuple[float, float]
+    components: List[List[int]],
+    bandwidth_range: Tuple[float, float],
+    rng: np.random.Generator
 ) -> None:
     """
     Ensure slice topology connectivity by adding links.
 
     Args:
         slice_request: Slice request (may be disconnected)
+        components: Node IDs of each connected component
         bandwidth_range: (min, max) bandwidth for new links
+        rng: Random number generator
     """
-    components = list(slice_request.connected_components())
-
     if len(components) <= 1:
         return  # Already connected
 
-    # Connect components using MST approach
+    # Connect components using MST approach; the main component is a list
+    # extended in place so each pick is a single index draw
     main_component = components[0]
 
-    for component in components[1:]:
+    for c in range(1, len(components)):
+        component = components[c]
         # Pick random nodes from each component and connect them
-        node1 = random.choice(list(main_component))
-        node2 = random.choice(list(component))
+        node1 = main_component[rng.integers(len(main_component))]
+        node2 = component[rng.integers(len(component))]
 
-        bandwidth_demand = random.uniform(bandwidth_range[0], bandwidth_range[1])
+        bandwidth_demand = rng.uniform(bandwidth_range[0], bandwidth_range[1])
         slice_request.add_slice_link(node1, node2, bandwidth_demand)
 
         # Merge component
-        main_component.update(component)
+        main_component.extend(component)
 
 
 def generate_slice_requests_uniform_arrivals(
     num_requests: int,
     simulation_time: float,
     avg_lifetime: float = 500,
+    rng: Optional[np.random.Generator] = None,
     **kwargs
 ) -> List[SliceRequest]:
     """
@@ -205,6 +378,8 @@ def generate_slice_requests_uniform_arrivals(
         num_requests: Number of requests
         simulation_time: Total simulation time
         avg_lifetime: Average lifetime
+        rng: Random number generator (None seeds one from the random
+            module, so random.seed() keeps results reproducible)
         **kwargs: Other parameters for slice generation
 
     Returns:
@@ -213,23 +388,29 @@ def generate_slice_requests_uniform_arrivals(
     requests = []
     time_interval = simulation_time / num_requests
 
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+
+    # Exponential lifetimes as -log1p(-U) * mean, accurate for small U
+    lifetimes = (-np.log1p(-rng.random(num_requests)) * avg_lifetime).tolist()
+
+    min_nodes, max_nodes = kwargs.get('node_range', (2, 10))
+    num_nodes_per_request = rng.integers(min_nodes, max_nodes + 1, num_requests).tolist()
+
     for i in range(num_requests):
         arrival_time = i * time_interval
-        lifetime = random.expovariate(1.0 / avg_lifetime)
-
-        num_nodes = random.randint(kwargs.get('node_range', (2, 10))[0],
-                                   kwargs.get('node_range', (2, 10))[1])
 
         slice_request = _generate_single_slice_request(
             slice_id=f"SR{i}",
             arrival_time=arrival_time,
-            lifetime=lifetime,
-            num_nodes=num_nodes,
+            lifetime=lifetimes[i],
+            num_nodes=num_nodes_per_request[i],
             connection_probability=kwargs.get('connection_probability', 0.5),
             cpu_range=kwargs.get('cpu_range', (1, 20)),
             bandwidth_range=kwargs.get('bandwidth_range', (1, 20)),
             area_size=kwargs.get('area_size', (500, 500)),
-            max_location_deviation=kwargs.get('max_location_deviation', 80)
+            max_location_deviation=kwargs.get('max_location_deviation', 80),
+            rng=rng
         )
 
         requests.append(slice_request)
@@ -250,37 +431,41 @@ def get_request_statistics(requests: List[SliceRequest]) -> dict:
     if not requests:
         return {}
 
+    count = len(requests)
+
     # Timing statistics
-    arrival_times = [req.arrival_time for req in requests]
-    lifetimes = [req.lifetime for req in requests]
+    arrival_times = np.fromiter((req.arrival_time for req in requests), float, count=count)
+    lifetimes = np.fromiter((req.lifetime for req in requests), float, count=count)
 
     # Topology statistics
-    num_nodes_list = [req.num_nodes() for req in requests]
-    num_links_list = [req.num_links() for req in requests]
+    num_nodes_list = np.fromiter((req.num_nodes() for req in requests), np.int64, count=count)
+    num_links_list = np.fromiter((req.num_links() for req in requests), np.int64, count=count)
 
     # Resource statistics
-    cpu_demands = [req.get_total_cpu_demand() for req in requests]
-    bandwidth_demands = [req.get_total_bandwidth_demand() for req in requests]
-    revenues = [req.calculate_revenue() for req in requests]
+    cpu_demands = np.fromiter((req.get_total_cpu_demand() for req in requests), float, count=count)
+    bandwidth_demands = np.fromiter(
+        (req.get_total_bandwidth_demand() for req in requests), float, count=count
+    )
+    revenues = np.fromiter((req.calculate_revenue() for req in requests), float, count=count)
 
     return {
-        'num_requests': len(requests),
-        'avg_arrival_time': sum(arrival_times) / len(arrival_times),
-        'min_arrival_time': min(arrival_times),
-        'max_arrival_time': max(arrival_times),
-        'avg_lifetime': sum(lifetimes) / len(lifetimes),
-        'min_lifetime': min(lifetimes),
-        'max_lifetime': max(lifetimes),
-        'avg_num_nodes': sum(num_nodes_list) / len(num_nodes_list),
-        'min_num_nodes': min(num_nodes_list),
-        'max_num_nodes': max(num_nodes_list),
-        'avg_num_links': sum(num_links_list) / len(num_links_list),
-        'avg_cpu_demand': sum(cpu_demands) / len(cpu_demands),
-        'total_cpu_demand': sum(cpu_demands),
-        'avg_bandwidth_demand': sum(bandwidth_demands) / len(bandwidth_demands),
-        'total_bandwidth_demand': sum(bandwidth_demands),
-        'avg_revenue': sum(revenues) / len(revenues),
-        'total_revenue': sum(revenues)
+        'num_requests': count,
+        'avg_arrival_time': float(arrival_times.mean()),
+        'min_arrival_time': float(arrival_times.min()),
+        'max_arrival_time': float(arrival_times.max()),
+        'avg_lifetime': float(lifetimes.mean()),
+        'min_lifetime': float(lifetimes.min()),
+        'max_lifetime': float(lifetimes.max()),
+        'avg_num_nodes': float(num_nodes_list.mean()),
+        'min_num_nodes': int(num_nodes_list.min()),
+        'max_num_nodes': int(num_nodes_list.max()),
+        'avg_num_links': float(num_links_list.mean()),
+        'avg_cpu_demand': float(cpu_demands.mean()),
+        'total_cpu_demand': float(cpu_demands.sum()),
+        'avg_bandwidth_demand': float(bandwidth_demands.mean()),
+        'total_bandwidth_demand': float(bandwidth_demands.sum()),
+        'avg_revenue': float(revenues.mean()),
+        'total_revenue': float(revenues.sum())
     }
 
 
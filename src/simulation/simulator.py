@@ -6,46 +6,22 @@ Manages slice arrivals, departures, and performance tracking.
 """
 
 import heapq
-from typing import List, Dict, Optional, Tuple
-from enum import Enum
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
+import numpy as np
 from ..core.graph.physical_network import PhysicalNetwork
 from ..core.graph.slice_request import SliceRequest
 from ..core.algorithms.rt_csp import RTCSP, RTCSPPlus, ProvisioningResult
 from ..core.metrics.performance_metrics import PerformanceMetrics
 from .topology_generator import generate_physical_network
-from .request_generator import generate_slice_requests
+from .request_generator import generate_slice_requests_iter
 
 
-class EventType(Enum):
-    """Types of events in the simulation."""
-    ARRIVAL = "arrival"
-    DEPARTURE = "departure"
-
-
-class Event:
-    """Represents a simulation event."""
-
-    def __init__(self, time: float, event_type: EventType, slice_request: SliceRequest):
-        """
-        Initialize an event.
-
-        Args:
-            time: Event time
-            event_type: Type of event (arrival or departure)
-            slice_request: Associated slice request
-        """
-        self.time = time
-        self.event_type = event_type
-        self.slice_request = slice_request
-
-    def __lt__(self, other: 'Event') -> bool:
-        """Compare events by time (for priority queue)."""
-        return self.time < other.time
-
-    def __repr__(self) -> str:
-        """String representation."""
-        return (f"Event(time={self.time:.2f}, type={self.event_type.value}, "
-                f"slice={self.slice_request.slice_id})")
+# Plain int event codes used in the simulation loop (cheaper than Enum compares)
+_ARRIVAL = 0
+_DEPARTURE = 1
 
 
 class SliceProvisioningSimulator:
@@ -59,6 +35,15 @@ class SliceProvisioningSimulator:
         - Performance metric tracking
     """
 
+    # Initial length of the per-slice arrays (doubled as needed)
+    _INITIAL_CAPACITY = 1024
+
+    # Progress is logged every this many time units (verbose mode)
+    _LOG_INTERVAL = 1000
+
+    # Progress frames are reported every this many events (progress_callback)
+    _PROGRESS_EVENTS = 100
+
     def __init__(
         self,
         physical_network: PhysicalNetwork,
@@ -66,7 +51,9 @@ class SliceProvisioningSimulator:
         alpha: float = 0.5,
         beta: float = 0.5,
         k: int = 3,
-        verbose: bool = False
+        verbose: bool = False,
+        sample_interval: Optional[float] = None,
+        progress_callback: Optional[Callable[[Dict], None]] = None
     ):
         """
         Initialize the simulator.
@@ -78,10 +65,16 @@ class SliceProvisioningSimulator:
             beta: Weight for global attributes
             k: Number of shortest paths
             verbose: Print simulation progress
+            sample_interval: Record metric time points every this many time
+                units (None records one every 100 events)
+            progress_callback: Called with a progress frame (see
+                get_progress) every 100 events, e.g. to stream live metrics
         """
         self.physical_network = physical_network
         self.algorithm_name = algorithm
         self.verbose = verbose
+        self.sample_interval = float(sample_interval) if sample_interval is not None else None
+        self.progress_callback = progress_callback
 
         # Initialize provisioning algorithm
         if algorithm.upper() == "RT-CSP+":
@@ -89,37 +82,78 @@ class SliceProvisioningSimulator:
         else:
             self.algorithm = RTCSP(alpha=alpha, beta=beta, k=k)
 
-        # Event queue (priority queue)
-        self.event_queue: List[Event] = []
-
-        # Active slices: slice_id -> (SliceRequest, ProvisioningResult)
-        self.active_slices: Dict[str, Tuple[SliceRequest, ProvisioningResult]] = {}
+        # Pending arrivals: a lazy source in arrival order plus a
+        # one-element look-ahead holding the next request to arrive
+        self._arrival_source: Iterator[SliceRequest] = iter(())
+        self._next_arrival: Optional[SliceRequest] = None
+
+        # Departure events (priority queue) as plain (time, idx, slice_request)
+        # tuples; idx is unique, so ties never compare slice requests
+        self.departure_heap: List[Tuple[float, int, SliceRequest]] = []
+
+        # Active slices, indexed by arrival order (structure of arrays):
+        # active_mask[idx] and departure_times[idx] per slice, results only
+        # for slices currently active
+        self.active_mask = np.zeros(self._INITIAL_CAPACITY, dtype=bool)
+        self.departure_times = np.full(self._INITIAL_CAPACITY, np.inf)
+        self.result_by_idx: Dict[int, ProvisioningResult] = {}
+
+        # Per-request outcome records, indexed by arrival order (see
+        # get_request_records)
+        self.request_arrival_times = np.zeros(self._INITIAL_CAPACITY)
+        self.request_lifetimes = np.zeros(self._INITIAL_CAPACITY)
+        self.request_revenues = np.zeros(self._INITIAL_CAPACITY)
+        self.request_accepted = np.zeros(self._INITIAL_CAPACITY, dtype=bool)
 
         # Performance metrics
         self.metrics = PerformanceMetrics()
 
         # Current simulation time
         self.current_time = 0.0
+        self._last_log_time = 0.0
+
+        # Index of the next time-grid sample (when sample_interval is set)
+        self._next_sample = 0
 
         # Statistics
         self.total_arrivals = 0
         self.total_departures = 0
 
+    def set_arrival_source(self, slice_requests: Iterable[SliceRequest]) -> None:
+        """
+        Set the stream of slice requests to simulate.
+
+        Requests are pulled lazily as the simulation clock advances, so a
+        generator (e.g. generate_slice_requests_iter) is never materialized.
+        Replaces any pending arrivals.
+
+        Args:
+            slice_requests: Slice requests in non-decreasing arrival time
+        """
+        self._arrival_source = iter(slice_requests)
+        self._next_arrival = next(self._arrival_source, None)
+
     def add_slice_requests(self, slice_requests: List[SliceRequest]) -> None:
         """
-        Add slice requests to the event queue.
+        Add slice requests to the pending arrivals.
 
         Args:
             slice_requests: List of slice requests
+
+        Note:
+            The list is sorted by arrival time and lazily merged with any
+            arrivals already pending.
         """
-        for slice_request in slice_requests:
-            # Add arrival event
-            arrival_event = Event(
-                slice_request.arrival_time,
-                EventType.ARRIVAL,
-                slice_request
+        pending = sorted(slice_requests, key=lambda r: r.arrival_time)
+
+        if self._next_arrival is not None:
+            pending = heapq.merge(
+                chain((self._next_arrival,), self._arrival_source),
+                pending,
+                key=lambda r: r.arrival_time
             )
-            heapq.heappush(self.event_queue, arrival_event)
+
+        self.set_arrival_source(pending)
 
     def run(self, max_time: Optional[float] = None) -> Dict:
         """
@@ -135,40 +169,49 @@ class SliceProvisioningSimulator:
             print(f"Starting simulation with {self.algorithm_name}")
             print(f"Physical network: {self.physical_network.num_nodes()} nodes, "
                   f"{self.physical_network.num_links()} links")
-            print(f"Total requests: {len(self.event_queue)}")
             print("-" * 60)
 
         event_count = 0
-        last_log_time = 0.0
-        log_interval = 1000  # Log every 1000 time units
+        self._last_log_time = 0.0
+
+        departure_heap = self.departure_heap
 
-        while self.event_queue:
-            # Get next event
-            event = heapq.heappop(self.event_queue)
+        while self._next_arrival is not None or departure_heap:
+            next_arrival = self._next_arrival
+
+            # Next event: earliest of the look-ahead arrival and departure heap top.
+            # On equal times the arrival is processed first.
+            if departure_heap and (
+                next_arrival is None
+                or departure_heap[0][0] < next_arrival.arrival_time
+            ):
+                event_type = _DEPARTURE
+                event_time = departure_heap[0][0]
+            else:
+                event_type = _ARRIVAL
+                event_time = next_arrival.arrival_time
 
             # Check max time
-            if max_time is not None and event.time > max_time:
+            if max_time is not None and event_time > max_time:
                 break
 
+            # Time-grid samples reflect the state just before this event
+            if self.sample_interval is not None:
+                self._record_samples_until(event_time)
+
             # Update current time
-            self.current_time = event.time
+            self.current_time = event_time
 
             # Process event
-            if event.event_type == EventType.ARRIVAL:
-                self._process_arrival(event.slice_request)
-            elif event.event_type == EventType.DEPARTURE:
-                self._process_departure(event.slice_request)
+            if event_type == _ARRIVAL:
+                self._next_arrival = next(self._arrival_source, None)
+                self._process_arrival(next_arrival)
+            else:
+                _, idx, slice_request = heapq.heappop(departure_heap)
+                self._process_departure(slice_request, idx)
 
             event_count += 1
-
-            # Periodic logging
-            if self.verbose and self.current_time - last_log_time >= log_interval:
-                self._log_progress()
-                last_log_time = self.current_time
-
-            # Record metrics periodically
-            if event_count % 100 == 0:
-                self.metrics.record_time_point(self.current_time)
+            self._record_event(event_count)
 
         # Final metrics recording
         self.metrics.record_time_point(self.current_time)
@@ -180,6 +223,39 @@ class SliceProvisioningSimulator:
 
         return self._get_results()
 
+    def _record_event(self, event_count: int) -> None:
+        """
+        Periodic logging and metrics recording after a processed event.
+
+        Args:
+            event_count: Number of events processed so far
+        """
+        # Periodic logging
+        if self.verbose and self.current_time - self._last_log_time >= self._LOG_INTERVAL:
+            self._log_progress()
+            self._last_log_time = self.current_time
+
+        # Record metrics periodically (by event count without a time grid)
+        if self.sample_interval is None and event_count % 100 == 0:
+            self.metrics.record_time_point(self.current_time)
+
+        if self.progress_callback is not None and event_count % self._PROGRESS_EVENTS == 0:
+            self.progress_callback(self.get_progress())
+
+    def _record_samples_until(self, time: float) -> None:
+        """
+        Record metric time points for all grid sample times up to a time.
+
+        Args:
+            time: Time of the next event to process
+        """
+        sample_time = self._next_sample * self.sample_interval
+
+        while sample_time <= time:
+            self.metrics.record_time_point(sample_time)
+            self._next_sample += 1
+            sample_time = self._next_sample * self.sample_interval
+
     def _process_arrival(self, slice_request: SliceRequest) -> None:
         """
         Process a slice arrival event.
@@ -187,8 +263,14 @@ class SliceProvisioningSimulator:
         Args:
             slice_request: Arriving slice request
         """
+        idx = self.total_arrivals
         self.total_arrivals += 1
 
+        if idx >= len(self.active_mask):
+            self._grow_slice_arrays(idx + 1)
+        self.request_arrival_times[idx] = slice_request.arrival_time
+        self.request_lifetimes[idx] = slice_request.lifetime
+
         if self.verbose and self.total_arrivals % 100 == 0:
             print(f"[{self.current_time:.1f}] Processing arrival #{self.total_arrivals}: "
                   f"{slice_request.slice_id}")
@@ -201,15 +283,14 @@ class SliceProvisioningSimulator:
             slice_request.set_status("active")
 
             # Store active slice
-            self.active_slices[slice_request.slice_id] = (slice_request, result)
+            self.active_mask[idx] = True
+            self.departure_times[idx] = slice_request.departure_time
+            self.result_by_idx[idx] = result
 
             # Schedule departure event
-            departure_event = Event(
-                slice_request.departure_time,
-                EventType.DEPARTURE,
-                slice_request
+            heapq.heappush(
+                self.departure_heap, (slice_request.departure_time, idx, slice_request)
             )
-            heapq.heappush(self.event_queue, departure_event)
 
             # Record metrics
             physical_mapping = {
@@ -218,6 +299,9 @@ class SliceProvisioningSimulator:
             }
             self.metrics.record_request(slice_request, accepted=True, physical_mapping=physical_mapping)
 
+            self.request_accepted[idx] = True
+            self.request_revenues[idx] = slice_request.calculate_revenue()
+
         else:
             # Provisioning failed
             slice_request.set_status("rejected")
@@ -228,16 +312,17 @@ class SliceProvisioningSimulator:
             if self.verbose and self.total_arrivals <= 10:
                 print(f"  -> REJECTED: {result.failure_reason}")
 
-    def _process_departure(self, slice_request: SliceRequest) -> None:
+    def _process_departure(self, slice_request: SliceRequest, idx: int) -> None:
         """
         Process a slice departure event.
 
         Args:
             slice_request: Departing slice request
+            idx: Simulator index of the slice
         """
         self.total_departures += 1
 
-        if slice_request.slice_id not in self.active_slices:
+        if not self.active_mask[idx]:
             # Slice was never accepted or already departed
             return
 
@@ -252,14 +337,86 @@ class SliceProvisioningSimulator:
         slice_request.set_status("completed")
 
         # Remove from active slices
-        del self.active_slices[slice_request.slice_id]
+        self.active_mask[idx] = False
+        self.departure_times[idx] = np.inf
+        del self.result_by_idx[idx]
+
+    def _grow_slice_arrays(self, min_size: int) -> None:
+        """
+        Grow the per-slice arrays to hold at least min_size slices.
+
+        Args:
+            min_size: Required array length
+        """
+        size = len(self.active_mask)
+        while size < min_size:
+            size *= 2
+
+        extra = size - len(self.active_mask)
+        self.active_mask = np.concatenate([self.active_mask, np.zeros(extra, dtype=bool)])
+        self.departure_times = np.concatenate([self.departure_times, np.full(extra, np.inf)])
+        self.request_arrival_times = np.concatenate([self.request_arrival_times, np.zeros(extra)])
+        self.request_lifetimes = np.concatenate([self.request_lifetimes, np.zeros(extra)])
+        self.request_revenues = np.concatenate([self.request_revenues, np.zeros(extra)])
+        self.request_accepted = np.concatenate([self.request_accepted, np.zeros(extra, dtype=bool)])
+
+    def num_active_slices(self) -> int:
+        """Get the number of currently active slices."""
+        return len(self.result_by_idx)
+
+    def next_departure_time(self) -> float:
+        """
+        Get the earliest departure time among active slices.
+
+        Returns:
+            Earliest departure time, or inf if no slice is active
+        """
+        return float(self.departure_times.min()) if self.result_by_idx else np.inf
+
+    def get_request_records(self) -> Dict[str, np.ndarray]:
+        """
+        Get the outcome of every request processed so far, in arrival order.
+
+        Returns:
+            Dictionary of equal-length arrays: 'arrival_time', 'lifetime',
+            'revenue' (0 for rejected requests) and 'accepted' (bool).
+            The arrays are copies and safe to hand to other threads
+        """
+        n = self.total_arrivals
+
+        return {
+            'arrival_time': self.request_arrival_times[:n].copy(),
+            'lifetime': self.request_lifetimes[:n].copy(),
+            'revenue': self.request_revenues[:n].copy(),
+            'accepted': self.request_accepted[:n].copy()
+        }
+
+    def get_progress(self) -> Dict:
+        """
+        Get a snapshot of the running simulation's headline metrics.
+
+        Returns:
+            Dictionary with current time, arrival/active counts, acceptance
+            ratio, revenue and resource utilization
+        """
+        util = self.physical_network.get_resource_utilization()
+
+        return {
+            'time': self.current_time,
+            'arrivals': self.total_arrivals,
+            'active_slices': self.num_active_slices(),
+            'acceptance_ratio': self.metrics.get_acceptance_ratio(),
+            'total_revenue': self.metrics.get_summary()['total_revenue'],
+            'cpu_utilization_percent': util['cpu_utilization_percent'],
+            'bandwidth_utilization_percent': util['bandwidth_utilization_percent']
+        }
 
     def _log_progress(self) -> None:
         """Log simulation progress."""
         util = self.physical_network.get_resource_utilization()
         print(f"[{self.current_time:.1f}] "
               f"Arrivals: {self.total_arrivals}, "
-              f"Active: {len(self.active_slices)}, "
+              f"Active: {self.num_active_slices()}, "
               f"Acceptance: {self.metrics.get_acceptance_ratio():.2%}, "
               f"CPU Util: {util['cpu_utilization_percent']:.1f}%, "
               f"BW Util: {util['bandwidth_utilization_percent']:.1f}%")
@@ -317,11 +474,20 @@ class SliceProvisioningSimulator:
 
     def reset(self) -> None:
         """Reset the simulator to initial state."""
-        self.event_queue.clear()
-        self.active_slices.clear()
+        self._arrival_source = iter(())
+        self._next_arrival = None
+        self.departure_heap.clear()
+        self.active_mask = np.zeros(self._INITIAL_CAPACITY, dtype=bool)
+        self.departure_times = np.full(self._INITIAL_CAPACITY, np.inf)
+        self.result_by_idx.clear()
+        self.request_arrival_times = np.zeros(self._INITIAL_CAPACITY)
+        self.request_lifetimes = np.zeros(self._INITIAL_CAPACITY)
+        self.request_revenues = np.zeros(self._INITIAL_CAPACITY)
+        self.request_accepted = np.zeros(self._INITIAL_CAPACITY, dtype=bool)
         self.metrics.reset()
         self.physical_network.reset_resources()
         self.current_time = 0.0
+        self._next_sample = 0
         self.total_arrivals = 0
         self.total_departures = 0
 
@@ -359,8 +525,8 @@ def run_single_simulation(
         random_seed=random_seed
     )
 
-    # Generate slice requests
-    slice_requests = generate_slice_requests(
+    # Slice requests are generated lazily as the simulation advances
+    slice_requests = generate_slice_requests_iter(
         num_requests=num_requests,
         arrival_rate=arrival_rate,
         random_seed=random_seed,
@@ -374,8 +540,8 @@ def run_single_simulation(
         verbose=verbose
     )
 
-    # Add requests and run
-    simulator.add_slice_requests(slice_requests)
+    # Stream requests and run
+    simulator.set_arrival_source(slice_requests)
     results = simulator.run()
 
     return results
@@ -383,26 +549,54 @@ def run_single_simulation(
 
 def run_comparison(
     algorithms: List[str] = ["RT-CSP", "RT-CSP+"],
+    workers: Optional[int] = None,
     **kwargs
 ) -> Dict[str, Dict]:
     """
     Run simulation comparing multiple algorithms.
 
+    Each algorithm runs an independent simulation, so they are executed in
+    separate worker processes.
+
     Args:
         algorithms: List of algorithm names
+        workers: Number of worker processes (None for one per algorithm,
+            capped at the CPU count; 1 runs sequentially in-process)
         **kwargs: Parameters for simulation
 
     Returns:
         Dictionary mapping algorithm_name -> results
+
+    Note:
+        Verbose runs are always sequential so their progress output does
+        not interleave.
     """
-    comparison_results = {}
+    if kwargs.get('verbose'):
+        workers = 1
+    elif workers is None:
+        workers = min(len(algorithms), os.cpu_count() or 1)
+
+    if workers <= 1:
+        comparison_results = {}
 
-    for algorithm in algorithms:
-        print(f"\nRunning {algorithm}...")
-        results = run_single_simulation(algorithm=algorithm, **kwargs)
-        comparison_results[algorithm] = results
+        for algorithm in algorithms:
+            print(f"\nRunning {algorithm}...")
+            results = run_single_simulation(algorithm=algorithm, **kwargs)
+            comparison_results[algorithm] = results
+
+        return comparison_results
+
+    print(f"\nRunning {', '.join(algorithms)} in {workers} processes...")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(run_single_simulation, algorithm=algorithm, **kwargs): algorithm
+            for algorithm in algorithms
+        }
+        completed = {futures[future]: future.result() for future in as_completed(futures)}
 
-    return comparison_results
+    # Keep the order of the requested algorithms
+    return {algorithm: completed[algorithm] for algorithm in algorithms}
 
 
 def main():
@@ -5,11 +5,21 @@ Generates physical network topologies using Waxman and BA models.
 Based on Table 2 parameters from the paper.
 """
 
+import hashlib
+import os
+import pickle
 import random
 import math
-from typing import Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple, Optional
 import networkx as nx
+import numpy as np
+from scipy.spatial import Delaunay, QhullError
+from scipy.spatial.distance import cdist
 from ..core.graph.physical_network import PhysicalNetwork
+from ..core.graph.csr_cache import NUMBA_AVAILABLE, njit, get_csr_adjacency, bfs_distances
+from ..utils.cache_keys import freeze_kwargs
 
 
 def generate_waxman_topology(
@@ -49,47 +59,59 @@ def generate_waxman_topology(
         - cpu_range: (50, 100)
         - bandwidth_range: (50, 100)
     """
-    if random_seed is not None:
-        random.seed(random_seed)
-
-    physical_network = PhysicalNetwork()
+    rng = np.random.default_rng(random_seed)
 
     # Step 1: Place nodes randomly in the area
-    node_positions = {}
-    for i in range(num_nodes):
-        node_id = f"PN{i}"
-        x = random.uniform(0, area_size[0])
-        y = random.uniform(0, area_size[1])
-        cpu = random.uniform(cpu_range[0], cpu_range[1])
-
-        node_positions[node_id] = (x, y)
-        physical_network.add_physical_node(node_id, cpu, (x, y))
+    physical_network, node_ids, positions = _place_physical_nodes(
+        num_nodes, area_size, cpu_range, rng
+    )
 
     # Step 2: Calculate maximum distance (L)
-    max_distance = math.sqrt(area_size[0]**2 + area_size[1]**2)
-
-    # Step 3: Add links based on Waxman probability
-    node_list = list(node_positions.keys())
-    for i in range(len(node_list)):
-        for j in range(i + 1, len(node_list)):
-            node1, node2 = node_list[i], node_list[j]
-            pos1, pos2 = node_positions[node1], node_positions[node2]
-
-            # Calculate Euclidean distance
-            distance = math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
-
-            # Waxman probability
-            probability = beta * math.exp(-distance / (alpha * max_distance))
+    max_distance = _diagonal(tuple(area_size))
+    scale = alpha * max_distance
+    log_beta = math.log(beta) if beta > 0 else -math.inf
+
+    # Step 3: Work through the pairs (i < j) in bands of source rows, so only
+    # O(band * N) draws and distances are held at a time. Each pair gets a
+    # standard exponential draw E (= -ln U for a uniform U); U < P(u,v) is
+    # then E > d / (α·L) - ln β, so a pair is kept when its distance is
+    # below α·L·(ln β + E). Squared distances are compared against that
+    # reach, which needs no exp, log or sqrt per pair. The selection has the
+    # Waxman distribution but not the stream of a uniform-draw comparison
+    source_chunks = []
+    target_chunks = []
+
+    for start in range(0, num_nodes, _WAXMAN_BAND_ROWS):
+        stop = min(start + _WAXMAN_BAND_ROWS, num_nodes)
+        num_pairs = (stop - start) * (2 * num_nodes - start - stop - 1) // 2
+        exponentials = rng.standard_exponential(num_pairs)
+
+        # Step 4: Keep the pairs within their reach. Both paths select the
+        # same pairs; the Numba kernel streams over the pairs instead of
+        # materializing band arrays
+        if NUMBA_AVAILABLE:
+            sources, targets = _select_waxman_pairs(
+                positions, start, stop, log_beta, scale, exponentials
+            )
+        else:
+            sources, targets = _select_waxman_band(
+                positions, start, stop, log_beta, scale, exponentials
+            )
+        source_chunks.append(sources)
+        target_chunks.append(targets)
+
+    if source_chunks:
+        sources, targets = np.concatenate(source_chunks), np.concatenate(target_chunks)
+    else:
+        sources = targets = np.empty(0, dtype=np.int64)
 
-            # Add link with probability
-            if random.random() < probability:
-                bandwidth = random.uniform(bandwidth_range[0], bandwidth_range[1])
-                physical_network.add_physical_link(node1, node2, bandwidth)
+    _add_links(physical_network, node_ids, sources, targets, bandwidth_range, rng)
 
     # Ensure connectivity (add minimum spanning tree if disconnected)
-    if not physical_network.is_connected():
+    components = physical_network.connected_components()
+    if len(components) > 1:
         physical_network = _ensure_connectivity(
-            physical_network, node_positions, bandwidth_range
+            physical_network, node_ids, positions, bandwidth_range, rng, components
         )
 
     return physical_network
@@ -122,91 +144,375 @@ def generate_erdos_renyi_topology(
     Paper Parameters (Table 2):
         - connection_probability: 0.5
     """
-    if random_seed is not None:
-        random.seed(random_seed)
-
-    physical_network = PhysicalNetwork()
+    rng = np.random.default_rng(random_seed)
 
     # Step 1: Place nodes randomly
-    node_positions = {}
-    for i in range(num_nodes):
-        node_id = f"PN{i}"
-        x = random.uniform(0, area_size[0])
-        y = random.uniform(0, area_size[1])
-        cpu = random.uniform(cpu_range[0], cpu_range[1])
-
-        node_positions[node_id] = (x, y)
-        physical_network.add_physical_node(node_id, cpu, (x, y))
+    physical_network, node_ids, positions = _place_physical_nodes(
+        num_nodes, area_size, cpu_range, rng
+    )
 
-    # Step 2: Add links with probability p
-    node_list = list(node_positions.keys())
-    for i in range(len(node_list)):
-        for j in range(i + 1, len(node_list)):
-            if random.random() < connection_probability:
-                node1, node2 = node_list[i], node_list[j]
-                bandwidth = random.uniform(bandwidth_range[0], bandwidth_range[1])
-                physical_network.add_physical_link(node1, node2, bandwidth)
+    # Step 2: Add links with probability p (geometric skipping over the pairs)
+    sources, targets = _sample_gnp_pairs(num_nodes, connection_probability, rng)
+    _add_links(physical_network, node_ids, sources, targets, bandwidth_range, rng)
 
     # Ensure connectivity
-    if not physical_network.is_connected():
+    components = physical_network.connected_components()
+    if len(components) > 1:
         physical_network = _ensure_connectivity(
-            physical_network, node_positions, bandwidth_range
+            physical_network, node_ids, positions, bandwidth_range, rng, components
         )
 
     return physical_network
 
 
+@lru_cache(maxsize=16)
+def _diagonal(area_size: Tuple[float, float]) -> float:
+    """Length of the deployment area's diagonal (the Waxman L)."""
+    return math.sqrt(area_size[0]**2 + area_size[1]**2)
+
+
+def _place_nodes(
+    num_nodes: int,
+    area_size: Tuple[float, float],
+    cpu_range: Tuple[float, float],
+    rng: np.random.Generator
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Draw node positions and CPU capacities in bulk.
+
+    Args:
+        num_nodes: Number of physical nodes
+        area_size: (width, height) of the deployment area
+        cpu_range: (min, max) CPU capacity for nodes
+        rng: Random number generator
+
+    Returns:
+        Tuple of (node IDs by index, (N, 2) position array, CPU capacities)
+    """
+    xs = rng.uniform(0, area_size[0], num_nodes)
+    ys = rng.uniform(0, area_size[1], num_nodes)
+    cpus = rng.uniform(cpu_range[0], cpu_range[1], num_nodes)
+
+    return [f"PN{i}" for i in range(num_nodes)], np.column_stack((xs, ys)), cpus
+
+
+def _place_physical_nodes(
+    num_nodes: int,
+    area_size: Tuple[float, float],
+    cpu_range: Tuple[float, float],
+    rng: np.random.Generator
+) -> Tuple[PhysicalNetwork, List[str], np.ndarray]:
+    """
+    Create a physical network with randomly placed nodes and CPU capacities.
+
+    Nodes are handled by integer index internally; the PN<index> names are
+    formatted once in _place_nodes and looked up by index afterwards.
+
+    Args:
+        num_nodes: Number of physical nodes
+        area_size: (width, height) of the deployment area
+        cpu_range: (min, max) CPU capacity for nodes
+        rng: Random number generator
+
+    Returns:
+        Tuple of (physical_network, node IDs by index, (N, 2) position array)
+    """
+    node_ids, positions, cpus = _place_nodes(num_nodes, area_size, cpu_range, rng)
+
+    physical_network = PhysicalNetwork()
+    for node_id, (x, y), cpu in zip(node_ids, positions.tolist(), cpus.tolist()):
+        physical_network.add_physical_node(node_id, cpu, (x, y))
+
+    return physical_network, node_ids, positions
+
+
+def _sample_gnp_pairs(
+    num_nodes: int,
+    probability: float,
+    rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample node pairs (i < j) independently with a fixed probability.
+
+    Instead of one Bernoulli trial per pair, the gaps between selected
+    pairs are drawn from a geometric distribution (the skipping method of
+    Batagelj & Brandes, as used by networkx.fast_gnp_random_graph), so time
+    and memory are O(N + M) rather than O(N²) for sparse graphs.
+
+    Args:
+        num_nodes: Number of nodes
+        probability: Probability of selecting each pair
+        rng: Random number generator
+
+    Returns:
+        Tuple of (source indices, target indices) in row-major pair order
+    """
+    num_pairs = num_nodes * (num_nodes - 1) // 2
+
+    if probability <= 0 or num_pairs == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    if probability >= 1:
+        return np.triu_indices(num_nodes, k=1)
+
+    # Linear indices of the selected pairs; draw gaps in blocks until the
+    # last selected index runs past the final pair
+    block = int(num_pairs * probability * 1.1) + 16
+    chunks = []
+    last = -1
+
+    while last < num_pairs:
+        selected = last + np.cumsum(rng.geometric(probability, block))
+        chunks.append(selected)
+        last = selected[-1]
+
+    linear = np.concatenate(chunks)
+    linear = linear[linear < num_pairs]
+
+    # Row i starts at linear index i * (2N - i - 1) / 2; invert it, then
+    # correct any off-by-one from floating point
+    two_n = 2 * num_nodes - 1
+    sources = ((two_n - np.sqrt(two_n * two_n - 8.0 * linear)) // 2).astype(np.int64)
+    sources -= (sources * (two_n - sources) // 2) > linear
+    sources += ((sources + 1) * (two_n - sources - 1) // 2) <= linear
+    targets = linear - sources * (two_n - sources) // 2 + sources + 1
+
+    return sources, targets
+
+
+def _add_links(
+    physical_network: PhysicalNetwork,
+    node_ids: List[str],
+    sources: np.ndarray,
+    targets: np.ndarray,
+    bandwidth_range: Tuple[float, float],
+    rng: np.random.Generator
+) -> None:
+    """
+    Add links between node index pairs with random bandwidths.
+
+    Args:
+        physical_network: Physical network
+        node_ids: Node IDs by index
+        sources: Source node index of each link
+        targets: Target node index of each link
+        bandwidth_range: (min, max) bandwidth for links
+        rng: Random number generator
+    """
+    bandwidths = rng.uniform(bandwidth_range[0], bandwidth_range[1], len(sources)).tolist()
+
+    for i, j, bandwidth in zip(sources.tolist(), targets.tolist(), bandwidths):
+        physical_network.add_physical_link(node_ids[i], node_ids[j], bandwidth)
+
+
+# Source rows per band when selecting Waxman pairs
+_WAXMAN_BAND_ROWS = 64
+
+
+def _select_waxman_band(
+    positions: np.ndarray,
+    start: int,
+    stop: int,
+    log_beta: float,
+    scale: float,
+    exponentials: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Select pairs (i < j) with start <= i < stop whose distance is below
+    scale * (log_beta + E), using NumPy over the (band, N) distance block.
+
+    Args:
+        positions: (N, 2) node coordinates
+        start: First source row of the band
+        stop: End (exclusive) of the band's source rows
+        log_beta: ln β (-inf when β <= 0)
+        scale: Distance scale α·L
+        exponentials: One standard exponential draw E per pair of the band,
+            in row-major order
+
+    Returns:
+        Tuple of (source indices, target indices) of the selected pairs
+    """
+    # SciPy's C kernel, without a (band, N, 2) difference temporary
+    squared_distances = cdist(positions[start:stop], positions, 'sqeuclidean')
+
+    # Row-major (i, j) with j > i, matching the order of the draws
+    rows, targets = np.nonzero(
+        np.arange(len(positions))[None, :] > np.arange(start, stop)[:, None]
+    )
+    reach = scale * (log_beta + exponentials)
+    selected = (reach > 0) & (squared_distances[rows, targets] < reach * reach)
+
+    return rows[selected] + start, targets[selected]
+
+
+@njit(cache=True)
+def _select_waxman_pairs(
+    positions: np.ndarray,
+    start: int,
+    stop: int,
+    log_beta: float,
+    scale: float,
+    exponentials: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Select pairs (i < j) with start <= i < stop whose distance is below
+    scale * (log_beta + E).
+
+    Args:
+        positions: (N, 2) node coordinates
+        start: First source row of the band
+        stop: End (exclusive) of the band's source rows
+        log_beta: ln β (-inf when β <= 0)
+        scale: Distance scale α·L
+        exponentials: One standard exponential draw E per pair of the band,
+            in row-major order
+
+    Returns:
+        Tuple of (source indices, target indices) of the selected pairs
+    """
+    num_nodes = positions.shape[0]
+    sources = np.empty(exponentials.shape[0], dtype=np.int64)
+    targets = np.empty(exponentials.shape[0], dtype=np.int64)
+    count = 0
+    k = 0
+
+    for i in range(start, stop):
+        for j in range(i + 1, num_nodes):
+            reach = scale * (log_beta + exponentials[k])
+            if reach > 0.0:
+                dx = positions[i, 0] - positions[j, 0]
+                dy = positions[i, 1] - positions[j, 1]
+                if dx * dx + dy * dy < reach * reach:
+                    sources[count] = i
+                    targets[count] = j
+                    count += 1
+            k += 1
+
+    return sources[:count], targets[:count]
+
+
 def _ensure_connectivity(
     physical_network: PhysicalNetwork,
-    node_positions: dict,
-    bandwidth_range: Tuple[float, float]
+    node_ids: List[str],
+    positions: np.ndarray,
+    bandwidth_range: Tuple[float, float],
+    rng: Optional[np.random.Generator] = None,
+    components: Optional[List[Set[str]]] = None
 ) -> PhysicalNetwork:
     """
     Ensure network connectivity by adding links between components.
 
-    Uses minimum spanning tree to connect disconnected components.
+    Uses minimum spanning tree to connect disconnected components: Kruskal's
+    algorithm over candidate node pairs that cross components, with a
+    disjoint-set union over component labels. Candidates are all pairs for
+    small networks and the Delaunay triangulation edges otherwise (these
+    contain the shortest link across any split of the nodes).
 
     Args:
         physical_network: Physical network (may be disconnected)
-        node_positions: Dictionary mapping node_id -> (x, y)
+        node_ids: Node IDs by index
+        positions: (N, 2) node coordinates, rows aligned with node_ids
         bandwidth_range: (min, max) bandwidth for new links
+        rng: Random number generator (None uses the random module)
+        components: Connected components if the caller already has them
 
     Returns:
         Connected physical network
     """
+    uniform = rng.uniform if rng is not None else random.uniform
+
     # Get connected components
-    components = list(physical_network.connected_components())
+    if components is None:
+        components = physical_network.connected_components()
 
     if len(components) <= 1:
         return physical_network  # Already connected
 
-    # Connect components
-    main_component = components[0]
+    # Component label of each node row
+    node_rows = {node_id: row for row, node_id in enumerate(node_ids)}
+    labels = np.empty(len(node_ids), dtype=np.int64)
+    for label, component in enumerate(components):
+        labels[[node_rows[node] for node in component]] = label
+
+    # Candidate links between different components, shortest first
+    sources, targets = _candidate_pairs(positions)
+    crossing = labels[sources] != labels[targets]
+    sources, targets = sources[crossing], targets[crossing]
+    deltas = positions[sources] - positions[targets]
+    order = np.argsort(np.einsum('ij,ij->i', deltas, deltas), kind='stable')
+    sources, targets = sources[order], targets[order]
+
+    # Kruskal: accept a candidate when it joins two separate trees. The
+    # candidates are walked as plain lists so the loop does no array indexing
+    parent = list(range(len(components)))
+    rank = [0] * len(components)
+    remaining = len(components) - 1
+
+    for source, target, source_label, target_label in zip(
+        sources.tolist(), targets.tolist(),
+        labels[sources].tolist(), labels[targets].tolist()
+    ):
+        a = _find_root(parent, source_label)
+        b = _find_root(parent, target_label)
+        if a == b:
+            continue
+
+        if rank[a] < rank[b]:
+            a, b = b, a
+        parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+
+        # Add link between the closest nodes of the two trees
+        bandwidth = uniform(bandwidth_range[0], bandwidth_range[1])
+        physical_network.add_physical_link(node_ids[source], node_ids[target], bandwidth)
+
+        remaining -= 1
+        if remaining == 0:
+            break
 
-    for component in components[1:]:
-        # Find closest pair of nodes between main_component and this component
-        min_distance = float('inf')
-        best_pair = None
+    return physical_network
 
-        for node1 in main_component:
-            for node2 in component:
-                pos1 = node_positions[node1]
-                pos2 = node_positions[node2]
-                distance = math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
 
-                if distance < min_distance:
-                    min_distance = distance
-                    best_pair = (node1, node2)
+# Above this many nodes, MST candidates come from a Delaunay triangulation
+_DELAUNAY_MIN_NODES = 256
 
-        # Add link between closest nodes
-        if best_pair:
-            bandwidth = random.uniform(bandwidth_range[0], bandwidth_range[1])
-            physical_network.add_physical_link(best_pair[0], best_pair[1], bandwidth)
 
-        # Merge component into main component
-        main_component.update(component)
+def _candidate_pairs(positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Node index pairs (i < j) that may belong to the Euclidean MST.
+
+    Args:
+        positions: (N, 2) node coordinates
+
+    Returns:
+        Tuple of (source indices, target indices)
+    """
+    num_nodes = len(positions)
+
+    if num_nodes >= _DELAUNAY_MIN_NODES:
+        try:
+            simplices = Delaunay(positions).simplices
+        except QhullError:
+            # Degenerate layouts (e.g. all nodes collinear) have no triangulation
+            pass
+        else:
+            edges = np.concatenate(
+                (simplices[:, [0, 1]], simplices[:, [1, 2]], simplices[:, [0, 2]])
+            )
+            edges = np.unique(np.sort(edges, axis=1), axis=0)
+            return edges[:, 0], edges[:, 1]
+
+    return np.triu_indices(num_nodes, k=1)
 
-    return physical_network
+
+def _find_root(parent: List[int], x: int) -> int:
+    """Find the root of x in a disjoint-set forest, halving the path."""
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
 
 
 def generate_barabasi_albert_topology(
@@ -233,30 +539,19 @@ def generate_barabasi_albert_topology(
     Returns:
         PhysicalNetwork instance
     """
-    if random_seed is not None:
-        random.seed(random_seed)
-
-    # Generate BA graph structure using NetworkX
-    ba_graph = nx.barabasi_albert_graph(num_nodes, m, seed=random_seed)
+    rng = np.random.default_rng(random_seed)
 
-    physical_network = PhysicalNetwork()
+    # Generate BA graph structure using NetworkX, drawing from the same
+    # generator as the attributes so one seed determines the whole topology
+    ba_graph = nx.barabasi_albert_graph(num_nodes, m, seed=rng)
 
     # Add nodes with random positions and CPU
-    for i in range(num_nodes):
-        node_id = f"PN{i}"
-        x = random.uniform(0, area_size[0])
-        y = random.uniform(0, area_size[1])
-        cpu = random.uniform(cpu_range[0], cpu_range[1])
-
-        physical_network.add_physical_node(node_id, cpu, (x, y))
-
-    # Add links from BA graph with random bandwidth
-    for edge in ba_graph.edges():
-        node1 = f"PN{edge[0]}"
-        node2 = f"PN{edge[1]}"
-        bandwidth = random.uniform(bandwidth_range[0], bandwidth_range[1])
+    physical_network, node_ids, _ = _place_physical_nodes(num_nodes, area_size, cpu_range, rng)
 
-        physical_network.add_physical_link(node1, node2, bandwidth)
+    # Add links from BA graph with random bandwidth; the networkx nodes are
+    # already the integer indices into node_ids
+    edges = np.array(ba_graph.edges(), dtype=np.int64).reshape(-1, 2)
+    _add_links(physical_network, node_ids, edges[:, 0], edges[:, 1], bandwidth_range, rng)
 
     return physical_network
 
@@ -274,43 +569,38 @@ def get_topology_statistics(physical_network: PhysicalNetwork) -> dict:
     num_nodes = physical_network.num_nodes()
     num_links = physical_network.num_links()
 
-    # Average degree
-    total_degree = sum(physical_network.degree(node) for node in physical_network.get_all_nodes())
-    avg_degree = total_degree / num_nodes if num_nodes > 0 else 0
+    # Average degree (every link adds one to the degree of both ends)
+    avg_degree = (2 * num_links) / num_nodes if num_nodes > 0 else 0
 
-    # Average path length
-    if physical_network.is_connected():
+    # One (cached) component count answers both connectivity questions
+    num_components = physical_network.num_connected_components()
+    is_connected = num_components == 1
+
+    # Average path length: one BFS per source over the CSR adjacency. Each
+    # unordered pair is seen from both ends, hence the halving
+    if is_connected:
+        csr = get_csr_adjacency(physical_network)
         total_distance = 0
-        count = 0
-        for node1 in physical_network.get_all_nodes():
-            for node2 in physical_network.get_all_nodes():
-                if node1 < node2:  # Avoid counting twice
-                    distance = physical_network.shortest_path_length(node1, node2)
-                    if distance != float('inf'):
-                        total_distance += distance
-                        count += 1
-        avg_path_length = total_distance / count if count > 0 else 0
+        for source in range(num_nodes):
+            distances = bfs_distances(csr.indptr, csr.indices, source)
+            total_distance += int(distances[distances > 0].sum())
+        count = num_nodes * (num_nodes - 1) // 2
+        avg_path_length = (total_distance // 2) / count if count > 0 else 0
     else:
         avg_path_length = float('inf')
 
-    # Resource statistics
-    total_cpu = sum(
-        physical_network.get_node_cpu_initial(node)
-        for node in physical_network.get_all_nodes()
-    )
-
-    total_bandwidth = sum(
-        physical_network.get_link_bandwidth_initial(u, v)
-        for u, v in physical_network.get_all_links()
-    )
+    # Resource statistics, from the network's maintained capacity totals
+    utilization = physical_network.get_resource_utilization()
+    total_cpu = utilization['total_cpu_initial']
+    total_bandwidth = utilization['total_bandwidth_initial']
 
     return {
         'num_nodes': num_nodes,
         'num_links': num_links,
         'avg_degree': avg_degree,
         'avg_path_length': avg_path_length,
-        'is_connected': physical_network.is_connected(),
-        'num_components': len(list(physical_network.connected_components())),
+        'is_connected': is_connected,
+        'num_components': num_components,
         'total_cpu_capacity': total_cpu,
         'total_bandwidth_capacity': total_bandwidth,
         'avg_cpu_per_node': total_cpu / num_nodes if num_nodes > 0 else 0,
@@ -350,3 +640,197 @@ def generate_physical_network(
     else:
         raise ValueError(f"Unknown topology model: {topology_model}. "
                         f"Use 'waxman', 'erdos_renyi', or 'barabasi_albert'")
+
+
+# On-disk cache of generated networks (see generate_physical_network_cached)
+NETWORK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'sliceprov', 'networks')
+
+# Sources whose contents decide what a seeded generator call builds
+_NETWORK_SOURCE_FILES = (
+    __file__,
+    os.path.join(os.path.dirname(__file__), '..', 'core', 'graph', 'physical_network.py'),
+    os.path.join(os.path.dirname(__file__), '..', 'core', 'graph', 'network_graph.py'),
+)
+
+
+@lru_cache(maxsize=1)
+def _generator_fingerprint() -> str:
+    """
+    Fingerprint the generator code and the libraries its output depends on.
+
+    Returns:
+        Hex digest that changes whenever a seeded topology could change
+    """
+    digest = hashlib.sha256()
+    for path in _NETWORK_SOURCE_FILES:
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(path.encode())
+    digest.update(np.__version__.encode())
+    digest.update(nx.__version__.encode())
+    return digest.hexdigest()
+
+
+def network_cache_key(num_nodes: int, topology_model: str = "waxman", **kwargs) -> str:
+    """
+    Get the cache key of a seeded generate_physical_network call.
+
+    Args:
+        num_nodes: Number of physical nodes
+        topology_model: Topology model name
+        **kwargs: Additional parameters for the topology model
+
+    Returns:
+        Hex digest identifying the generated network
+
+    Note:
+        List arguments are keyed like the equivalent tuples. The key also
+        covers the generator source and the numpy/networkx versions, so
+        cached networks are not served after either changes.
+    """
+    params = (_generator_fingerprint(), topology_model.lower(), num_nodes, list(freeze_kwargs(kwargs)))
+    return hashlib.sha256(repr(params).encode()).hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _load_network_pickle(
+    key: str,
+    cache_dir: Optional[str],
+    num_nodes: int,
+    topology_model: str,
+    frozen_kwargs: Tuple
+) -> bytes:
+    """
+    Pickled network for a cache key, from disk or freshly generated.
+
+    A disk entry that cannot be read back as a PhysicalNetwork (truncated,
+    corrupt, or written by an incompatible class) is deleted and the
+    network is regenerated.
+    """
+    path = os.path.join(cache_dir, f"{key}.pkl") if cache_dir is not None else None
+
+    if path is not None and os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            if isinstance(pickle.loads(data), PhysicalNetwork):
+                return data
+        except Exception:
+            pass
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    data = pickle.dumps(
+        generate_physical_network(num_nodes, topology_model, **dict(frozen_kwargs)),
+        protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+    if path is not None:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write-then-rename so concurrent readers never see a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # Disk layer is best effort; the in-memory layer still applies
+
+    return data
+
+
+def generate_physical_network_cached(
+    num_nodes: int = 100,
+    topology_model: str = "waxman",
+    cache_dir: Optional[str] = None,
+    **kwargs
+) -> PhysicalNetwork:
+    """
+    Generate a physical network, reusing earlier results for the same seeded
+    parameters.
+
+    Networks are cached as pickles in memory (LRU, 64 entries) and, when
+    cache_dir is given (e.g. NETWORK_CACHE_DIR), on disk. Every call returns a fresh copy, so simulations
+    allocating resources on it never affect the cached network.
+
+    Args:
+        num_nodes: Number of physical nodes
+        topology_model: "waxman", "erdos_renyi", or "barabasi_albert"
+        cache_dir: Directory of the on-disk cache (default None keeps it in memory)
+        **kwargs: Additional parameters for the topology model
+
+    Returns:
+        PhysicalNetwork instance
+
+    Note:
+        Calls without a random_seed are not reproducible and bypass the cache.
+    """
+    if kwargs.get('random_seed') is None:
+        return generate_physical_network(num_nodes, topology_model, **kwargs)
+
+    frozen_kwargs = freeze_kwargs(kwargs)
+    try:
+        hash(frozen_kwargs)
+    except TypeError:
+        # Unhashable arguments (e.g. nested lists): no cache
+        return generate_physical_network(num_nodes, topology_model, **kwargs)
+
+    key = network_cache_key(num_nodes, topology_model, **dict(frozen_kwargs))
+    data = _load_network_pickle(key, cache_dir, num_nodes, topology_model, frozen_kwargs)
+
+    return pickle.loads(data)
+
+
+def clear_network_cache(cache_dir: Optional[str] = NETWORK_CACHE_DIR) -> None:
+    """
+    Drop all cached networks, in memory and on disk.
+
+    Args:
+        cache_dir: Directory of the on-disk cache
+    """
+    _load_network_pickle.cache_clear()
+
+    if cache_dir is None or not os.path.isdir(cache_dir):
+        return
+
+    for name in os.listdir(cache_dir):
+        if name.endswith('.pkl'):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+
+def _generate_from_config(config: Dict) -> PhysicalNetwork:
+    """Generate one network from a generate_physical_network keyword dict."""
+    return generate_physical_network(**config)
+
+
+def generate_many(
+    configs: List[Dict],
+    workers: Optional[int] = None
+) -> List[PhysicalNetwork]:
+    """
+    Generate several physical networks in parallel, e.g. for parameter sweeps.
+
+    Each generation is independent (seeded through its own config), so the
+    configs are spread over worker processes.
+
+    Args:
+        configs: Keyword arguments for generate_physical_network, one dict
+            per network (e.g. {'num_nodes': 100, 'random_seed': 3})
+        workers: Number of worker processes (None for one per CPU,
+            1 runs sequentially in-process)
+
+    Returns:
+        Physical networks in the order of configs
+    """
+    if workers == 1 or len(configs) <= 1:
+        return [_generate_from_config(config) for config in configs]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_generate_from_config, configs))
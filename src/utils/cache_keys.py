@@ -0,0 +1,25 @@
+"""
+Cache Key Utilities
+
+Helpers for turning generator arguments into hashable cache keys.
+"""
+
+from typing import Dict, Tuple
+
+
+def freeze_kwargs(kwargs: Dict) -> Tuple:
+    """
+    Sorted (name, value) pairs of keyword arguments, for use as a cache key.
+
+    List values become tuples, so [1, 20] and (1, 20) share a cache entry.
+
+    Args:
+        kwargs: Keyword arguments of a generator call
+
+    Returns:
+        Tuple of (name, value) pairs
+    """
+    return tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in kwargs.items()
+    ))
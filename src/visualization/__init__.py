@@ -2,40 +2,45 @@
 Visualization Module
 
 Provides plotting and visualization tools for simulation results.
+
+The plotting helpers are imported on first use, so importing the dashboard
+subpackage does not load matplotlib or networkx.
 """
 
-from .static_plots import (
-    plot_acceptance_ratio_over_time,
-    plot_revenue_comparison,
-    plot_revenue_cost_ratio,
-    plot_varying_link_probability,
-    plot_varying_arrival_rate,
-    plot_varying_network_size,
-    create_all_paper_figures,
-    save_figure
-)
-
-from .network_viz import (
-    visualize_physical_network,
-    visualize_slice_request,
-    visualize_slice_mapping,
-    create_network_layout
-)
-
-__all__ = [
+from importlib import import_module
+
+# Exported name -> submodule defining it
+_LAZY_EXPORTS = {
     # Static plots
-    'plot_acceptance_ratio_over_time',
-    'plot_revenue_comparison',
-    'plot_revenue_cost_ratio',
-    'plot_varying_link_probability',
-    'plot_varying_arrival_rate',
-    'plot_varying_network_size',
-    'create_all_paper_figures',
-    'save_figure',
+    'plot_acceptance_ratio_over_time': 'static_plots',
+    'plot_revenue_comparison': 'static_plots',
+    'plot_revenue_cost_ratio': 'static_plots',
+    'plot_varying_link_probability': 'static_plots',
+    'plot_varying_arrival_rate': 'static_plots',
+    'plot_varying_network_size': 'static_plots',
+    'create_all_paper_figures': 'static_plots',
+    'save_figure': 'static_plots',
 
     # Network visualization
-    'visualize_physical_network',
-    'visualize_slice_request',
-    'visualize_slice_mapping',
-    'create_network_layout'
-]
+    'visualize_physical_network': 'network_viz',
+    'visualize_slice_request': 'network_viz',
+    'visualize_slice_mapping': 'network_viz',
+    'create_network_layout': 'network_viz'
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    """Import plotting helpers from their submodule on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{_LAZY_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazy exports alongside the loaded module attributes."""
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,6 @@ Provides a web-based interface for:
 - Network topology visualization
 """
 
-from .app import app, run_dashboard
+from .app import app, run_dashboard, main
 
-__all__ = ['app', 'run_dashboard']
+__all__ = ['app', 'run_dashboard', 'main']
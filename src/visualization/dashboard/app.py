@@ -5,25 +5,25 @@ Provides real-time visualization, parameter tuning, and performance analysis.
 """
 
 import dash
-from dash import dcc, html, Input, Output, State
+from dash import dcc, html
 import dash_bootstrap_components as dbc
-import plotly.graph_objs as go
-import plotly.express as px
-from typing import Dict, List, Optional
+from typing import List, Optional
 import sys
 import os
 
 # Add parent directories to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
-from src.simulation import (
-    generate_physical_network,
-    generate_slice_requests,
-    SliceProvisioningSimulator
-)
+# Import callbacks (the simulation stack is imported on the first run)
+from .callbacks import EMPTY_NETWORK_FIGURE, EMPTY_RESULT_FIGURES, EMPTY_STATS, register_callbacks
+from .streaming import register_event_stream
 
-# Import callbacks
-from .callbacks import register_callbacks
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    Compress = None
+    COMPRESS_AVAILABLE = False
 
 # Initialize the Dash app with Bootstrap theme
 app = dash.Dash(
@@ -34,162 +34,26 @@ app = dash.Dash(
 
 app.title = "5G Network Slice Provisioning Dashboard"
 
-# Custom CSS for animations and improved UX
-app.index_string = '''
-<!DOCTYPE html>
-<html>
-    <head>
-        {%metas%}
-        <title>{%title%}</title>
-        {%favicon%}
-        {%css%}
-        <style>
-            /* Button animations */
-            .btn {
-                transition: all 0.3s ease;
-                position: relative;
-                overflow: hidden;
-            }
-
-            .btn:hover {
-                transform: translateY(-2px);
-                box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-            }
-
-            .btn:active {
-                transform: translateY(0);
-                box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-            }
-
-            .btn:disabled {
-                opacity: 0.6;
-                cursor: not-allowed;
-                transform: none !important;
-            }
-
-            /* Card animations */
-            .card {
-                transition: all 0.3s ease;
-            }
-
-            .metric-card:hover {
-                transform: translateY(-5px);
-                box-shadow: 0 8px 16px rgba(0,0,0,0.1);
-            }
-
-            /* Loading overlay */
-            .loading-overlay {
-                position: fixed;
-                top: 0;
-                left: 0;
-                width: 100%;
-                height: 100%;
-                background: rgba(0,0,0,0.7);
-                display: flex;
-                justify-content: center;
-                align-items: center;
-                z-index: 9999;
-                backdrop-filter: blur(4px);
-            }
-
-            .loading-content {
-                background: white;
-                padding: 30px;
-                border-radius: 10px;
-                text-align: center;
-                box-shadow: 0 10px 40px rgba(0,0,0,0.3);
-            }
-
-            /* Spinner animation */
-            @keyframes spin {
-                0% { transform: rotate(0deg); }
-                100% { transform: rotate(360deg); }
-            }
-
-            .spinner-custom {
-                border: 4px solid #f3f3f3;
-                border-top: 4px solid #007bff;
-                border-radius: 50%;
-                width: 50px;
-                height: 50px;
-                animation: spin 1s linear infinite;
-                margin: 0 auto 20px;
-            }
-
-            /* Fade in animation */
-            @keyframes fadeIn {
-                from { opacity: 0; transform: translateY(20px); }
-                to { opacity: 1; transform: translateY(0); }
-            }
-
-            .fade-in {
-                animation: fadeIn 0.5s ease;
-            }
-
-            /* Progress bar */
-            .progress {
-                height: 25px;
-                border-radius: 10px;
-                overflow: hidden;
-            }
-
-            .progress-bar {
-                transition: width 0.4s ease;
-            }
-
-            /* Status badge animations */
-            .status-badge {
-                transition: all 0.3s ease;
-                display: inline-block;
-            }
-
-            .status-badge.pulse {
-                animation: pulse 2s infinite;
-            }
-
-            @keyframes pulse {
-                0%, 100% { opacity: 1; }
-                50% { opacity: 0.6; }
-            }
-
-            /* Smooth transitions for all interactive elements */
-            input[type="range"] {
-                transition: all 0.2s ease;
-            }
-
-            input[type="range"]:hover {
-                cursor: pointer;
-            }
-
-            /* Alert animations */
-            .alert {
-                animation: slideIn 0.3s ease;
-            }
-
-            @keyframes slideIn {
-                from { transform: translateX(-100%); opacity: 0; }
-                to { transform: translateX(0); opacity: 1; }
-            }
-        </style>
-    </head>
-    <body>
-        {%app_entry%}
-        <footer>
-            {%config%}
-            {%scripts%}
-            {%renderer%}
-        </footer>
-    </body>
-</html>
-'''
-
-# Global state for storing simulation results
-simulation_state = {
-    'physical_network': None,
-    'simulator': None,
-    'results': None,
-    'is_running': False
-}
+# Compress the layout, callback and figure JSON on the wire (optional
+# dependency). The event stream is left out so frames are not buffered.
+if COMPRESS_AVAILABLE:
+    app.server.config.update(
+        COMPRESS_MIMETYPES=['application/json', 'text/html', 'text/css', 'application/javascript'],
+        COMPRESS_LEVEL=6,
+        COMPRESS_ALGORITHM=['br', 'gzip']
+    )
+    Compress(app.server)
+
+# Slider marks, built once. Plain dicts (not MappingProxyType) because Dash
+# must JSON-serialize them; treat them as read-only.
+_NODE_MARKS = {i: str(i) for i in range(20, 201, 40)}
+_REQ_MARKS = {i: str(i) for i in range(100, 2001, 500)}
+_RATE_MARKS = {i/100: f"{i/100:.2f}" for i in range(2, 11, 2)}
+_LINK_MARKS = {i/10: f"{i/10:.1f}" for i in range(2, 9, 2)}
+
+# Custom CSS for animations lives in assets/animations.css, which Dash serves
+# with a modification-time query string; let browsers cache it for a year
+app.server.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
 
 
 def create_header():
@@ -253,6 +117,17 @@ def create_control_panel():
                 ], md=6)
             ], className="mb-3"),
 
+            # Head-to-head comparison
+            dbc.Row([
+                dbc.Col([
+                    dbc.Switch(
+                        id='compare-mode',
+                        label="Compare RT-CSP and RT-CSP+ (runs in parallel)",
+                        value=False
+                    )
+                ])
+            ], className="mb-3"),
+
             # Network size
             dbc.Row([
                 dbc.Col([
@@ -263,8 +138,9 @@ def create_control_panel():
                         max=200,
                         step=10,
                         value=100,
-                        marks={i: str(i) for i in range(20, 201, 40)},
-                        tooltip={"placement": "bottom", "always_visible": False}
+                        marks=_NODE_MARKS,
+                        tooltip={"placement": "bottom", "always_visible": False},
+                        updatemode='mouseup'
                     )
                 ], md=12)
             ], className="mb-3"),
@@ -279,8 +155,9 @@ def create_control_panel():
                         max=2000,
                         step=100,
                         value=500,
-                        marks={i: str(i) for i in range(100, 2001, 500)},
-                        tooltip={"placement": "bottom", "always_visible": False}
+                        marks=_REQ_MARKS,
+                        tooltip={"placement": "bottom", "always_visible": False},
+                        updatemode='mouseup'
                     )
                 ], md=12)
             ], className="mb-3"),
@@ -295,8 +172,9 @@ def create_control_panel():
                         max=0.1,
                         step=0.02,
                         value=0.04,
-                        marks={i/100: f"{i/100:.2f}" for i in range(2, 11, 2)},
-                        tooltip={"placement": "bottom", "always_visible": False}
+                        marks=_RATE_MARKS,
+                        tooltip={"placement": "bottom", "always_visible": False},
+                        updatemode='mouseup'
                     )
                 ], md=12)
             ], className="mb-3"),
@@ -311,8 +189,9 @@ def create_control_panel():
                         max=0.8,
                         step=0.1,
                         value=0.5,
-                        marks={i/10: f"{i/10:.1f}" for i in range(2, 9, 2)},
-                        tooltip={"placement": "bottom", "always_visible": False}
+                        marks=_LINK_MARKS,
+                        tooltip={"placement": "bottom", "always_visible": False},
+                        updatemode='mouseup'
                     )
                 ], md=12)
             ], className="mb-3"),
@@ -320,15 +199,13 @@ def create_control_panel():
             # Control buttons
             dbc.Row([
                 dbc.Col([
-                    dcc.Loading(
-                        id="loading-run-button",
-                        type="default",
-                        children=dbc.Button(
-                            [html.I(className="fas fa-play me-2"), "Run Simulation"],
-                            id='run-button',
-                            color="success",
-                            className="w-100"
-                        )
+                    # Runs execute on a background thread (see streaming.py),
+                    # so the button is only disabled while one is in flight
+                    dbc.Button(
+                        [html.I(className="fas fa-play me-2"), "Run Simulation"],
+                        id='run-button',
+                        color="success",
+                        className="w-100"
                     )
                 ], md=6),
                 dbc.Col([
@@ -339,7 +216,20 @@ def create_control_panel():
                         className="w-100"
                     )
                 ], md=6)
-            ])
+            ]),
+
+            # Draws a new topology seed for the following runs
+            dbc.Row([
+                dbc.Col([
+                    dbc.Button(
+                        [html.I(className="fas fa-project-diagram me-2"), "Regenerate Network"],
+                        id='regenerate-button',
+                        color="outline-secondary",
+                        size="sm",
+                        className="w-100"
+                    )
+                ], md=12)
+            ], className="mt-2")
         ])
     ])
 
@@ -402,9 +292,6 @@ def create_main_layout():
         # Toast notifications container
         html.Div(id='toast-container', style={'position': 'fixed', 'top': 80, 'right': 20, 'zIndex': 9999}),
 
-        # Loading overlay
-        html.Div(id='loading-overlay', style={'display': 'none'}),
-
         # Confirmation modal for reset
         dbc.Modal([
             dbc.ModalHeader(dbc.ModalTitle([
@@ -454,7 +341,7 @@ def create_main_layout():
                                 dcc.Loading(
                                     id="loading-acceptance",
                                     type="circle",
-                                    children=dcc.Graph(id='acceptance-ratio-plot', style={'height': '400px'})
+                                    children=dcc.Graph(id='acceptance-ratio-plot', figure=EMPTY_RESULT_FIGURES[0], style={'height': '400px'})
                                 ),
                             ])
                         ], className="mt-3 shadow-sm")
@@ -466,7 +353,7 @@ def create_main_layout():
                                 dcc.Loading(
                                     id="loading-revenue",
                                     type="circle",
-                                    children=dcc.Graph(id='revenue-plot', style={'height': '400px'})
+                                    children=dcc.Graph(id='revenue-plot', figure=EMPTY_RESULT_FIGURES[1], style={'height': '400px'})
                                 ),
                             ])
                         ], className="mt-3 shadow-sm")
@@ -478,7 +365,7 @@ def create_main_layout():
                                 dcc.Loading(
                                     id="loading-utilization",
                                     type="circle",
-                                    children=dcc.Graph(id='utilization-plot', style={'height': '400px'})
+                                    children=dcc.Graph(id='utilization-plot', figure=EMPTY_RESULT_FIGURES[2], style={'height': '400px'})
                                 ),
                             ])
                         ], className="mt-3 shadow-sm")
@@ -490,7 +377,7 @@ def create_main_layout():
                                 dcc.Loading(
                                     id="loading-network",
                                     type="circle",
-                                    children=dcc.Graph(id='network-topology-plot', style={'height': '500px'})
+                                    children=dcc.Graph(id='network-topology-plot', figure=EMPTY_NETWORK_FIGURE, style={'height': '500px'})
                                 ),
                             ])
                         ], className="mt-3 shadow-sm")
@@ -502,7 +389,7 @@ def create_main_layout():
                                 dcc.Loading(
                                     id="loading-stats",
                                     type="circle",
-                                    children=html.Div(id='detailed-stats')
+                                    children=html.Div(id='detailed-stats', children=EMPTY_STATS)
                                 ),
                             ])
                         ], className="mt-3 shadow-sm")
@@ -511,10 +398,18 @@ def create_main_layout():
             ], md=9)
         ]),
 
-        # Hidden div to store simulation data
+        # Hidden stores: the run ID of the displayed results (the results
+        # themselves stay on the server) and the run's network data
         dcc.Store(id='simulation-data'),
         dcc.Store(id='network-data'),
-        dcc.Store(id='is-running', data=False)
+
+        # Seed of the generated physical network (Regenerate Network draws
+        # a new one)
+        dcc.Store(id='network-seed', data=42),
+
+        # Current background run and its failure message, if any
+        dcc.Store(id='run-id'),
+        dcc.Store(id='run-error')
 
     ], fluid=True)
 
@@ -522,8 +417,9 @@ def create_main_layout():
 # Set the layout
 app.layout = create_main_layout()
 
-# Register callbacks
+# Register callbacks and the simulation event stream
 register_callbacks(app)
+register_event_stream(app)
 
 
 def run_dashboard(host='127.0.0.1', port=8050, debug=True):
@@ -550,5 +446,40 @@ def run_dashboard(host='127.0.0.1', port=8050, debug=True):
     app.run(host=host, port=port, debug=debug)
 
 
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Command-line entry point (slice-dashboard and run_dashboard.py).
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Launch the 5G Network Slice Provisioning Dashboard"
+    )
+    parser.add_argument(
+        '--host',
+        type=str,
+        default='127.0.0.1',
+        help='Host address (default: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8050,
+        help='Port number (default: 8050)'
+    )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Enable debug mode'
+    )
+
+    args = parser.parse_args(argv)
+
+    run_dashboard(host=args.host, port=args.port, debug=args.debug)
+
+
 if __name__ == '__main__':
-    run_dashboard()
+    main()
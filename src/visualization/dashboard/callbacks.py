@@ -4,72 +4,586 @@ Dashboard Callbacks
 Handles all interactive callbacks for the Dash dashboard.
 """
 
-from dash import Input, Output, State, callback
+from dash import Input, Output, State, callback, no_update
 from dash import html
 import dash_bootstrap_components as dbc
-import plotly.graph_objs as go
-import plotly.express as px
+import plotly.io as pio
+from plotly.subplots import make_subplots
+import base64
+import copy
 import json
 import sys
 import os
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+import numpy as np
 
 # Add parent directories to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
-from src.simulation import (
-    generate_physical_network,
-    generate_slice_requests,
-    SliceProvisioningSimulator
+from .streaming import SimSnapshot, registry
+
+
+# Algorithms run side by side in comparison mode
+COMPARE_ALGORITHMS = ('RT-CSP', 'RT-CSP+')
+
+# Line colors of the compared algorithms
+_ALGORITHM_COLORS = {'RT-CSP': '#fd7e14', 'RT-CSP+': '#28a745'}
+
+# Template of every dashboard figure, resolved once (shared, do not mutate)
+_TEMPLATE = pio.templates['plotly_white'].to_plotly_json()
+
+# Axes and subplot titles of the revenue figure with its cumulative curve,
+# laid out once by make_subplots
+_REVENUE_SUBPLOTS = {
+    key: value
+    for key, value in make_subplots(
+        rows=1, cols=2, column_widths=[0.35, 0.65],
+        subplot_titles=("Totals", "Cumulative Revenue")
+    ).update_xaxes(title_text="Simulation Time", row=1, col=2).to_dict()['layout'].items()
+    if key != 'template'
+}
+
+# Detailed statistics table: (label, format string over results r and metrics m)
+_STAT_ROWS = (
+    ("Algorithm", "{r[algorithm]}"),
+    ("Simulation Time", "{r[simulation_time]:.2f}"),
+    ("Total Arrivals", "{r[total_arrivals]}"),
+    ("Total Departures", "{r[total_departures]}"),
+    ("Accepted Requests", "{m[accepted_requests]}"),
+    ("Rejected Requests", "{m[rejected_requests]}"),
+    ("Acceptance Ratio", "{m[acceptance_ratio]:.2%}"),
+    ("Total Revenue", "${m[total_revenue]:.2f}"),
+    ("Total Cost", "${m[total_cost]:.2f}"),
+    ("Revenue/Cost Ratio", "{m[revenue_cost_ratio]:.3f}"),
+    ("Average Revenue per Slice", "${m[average_revenue]:.2f}"),
+    ("Physical Nodes", "{r[physical_network_stats][num_nodes]}"),
+    ("Physical Links", "{r[physical_network_stats][num_links]}"),
+    ("CPU Utilization", "{r[final_utilization][cpu_utilization_percent]:.2f}%"),
+    ("Bandwidth Utilization", "{r[final_utilization][bandwidth_utilization_percent]:.2f}%"),
 )
 
+# Points per decimated trace sent to the browser
+_MAX_CURVE_POINTS = 800
 
-def register_callbacks(app):
-    """Register all dashboard callbacks."""
 
-    # Update slider labels
-    @app.callback(
+def lttb_downsample(x: np.ndarray, y: np.ndarray, n_out: int = _MAX_CURVE_POINTS):
+    """
+    Downsample a curve with largest-triangle-three-buckets (LTTB).
+
+    Keeps the first and last points, and from each of the n_out - 2 equal
+    buckets in between the point forming the largest triangle with the
+    previously kept point and the mean of the next bucket.
+
+    Args:
+        x: Sorted x values
+        y: y values
+        n_out: Number of points to keep
+
+    Returns:
+        Tuple of (x, y) arrays of at most n_out points
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        # Mean of the next bucket (the last point for the final bucket)
+        nxt_lo, nxt_hi = hi, edges[b + 2] if b + 2 < len(edges) else n
+        mean_x = x[nxt_lo:nxt_hi].mean()
+        mean_y = y[nxt_lo:nxt_hi].mean()
+
+        px_, py_ = x[keep[b]], y[keep[b]]
+        areas = np.abs((px_ - mean_x) * (y[lo:hi] - py_) - (px_ - x[lo:hi]) * (mean_y - py_))
+        keep[b + 1] = lo + int(np.argmax(areas))
+
+    return x[keep], y[keep]
+
+
+def minmax_downsample(x: np.ndarray, y: np.ndarray, n_out: int = _MAX_CURVE_POINTS):
+    """
+    Downsample a curve keeping the minimum and maximum of each bucket.
+
+    Preserves the envelope of noisy curves such as the running acceptance
+    ratio, whose early spikes LTTB can smooth away.
+
+    Args:
+        x: Sorted x values
+        y: y values
+        n_out: Number of points to keep (about n_out / 2 buckets)
+
+    Returns:
+        Tuple of (x, y) arrays of at most n_out points
+    """
+    n = len(x)
+    if n <= n_out or n_out < 2:
+        return x, y
+
+    edges = np.linspace(0, n, n_out // 2 + 1).astype(np.int64)
+    starts = edges[:-1]
+    bucket = np.repeat(np.arange(len(starts)), np.diff(edges))
+
+    # Per-bucket argmin/argmax via a lexicographic sort on (bucket, y)
+    order = np.lexsort((y, bucket))
+    ends = edges[1:] - 1
+    keep = np.unique(np.concatenate([order[starts], order[ends]]))
+
+    return x[keep], y[keep]
+
+
+# Figure dicts already built, keyed by (figure kind, payload digest)
+_FIGURE_CACHE_SIZE = 16
+_figure_cache: 'OrderedDict[Tuple[str, str], Dict]' = OrderedDict()
+_figure_cache_lock = threading.Lock()
+
+
+def _cached_figure(kind: str, source: str, build: Callable[[], Dict]) -> Dict:
+    """
+    Get a figure, building it only on a cache miss.
+
+    Args:
+        kind: Figure kind (one cache slot per kind and source)
+        source: Identifies the data the figure is drawn from (a run ID or
+            a payload digest)
+        build: Builds the figure dict
+
+    Returns:
+        Figure dict (shared, do not mutate)
+    """
+    key = (kind, source)
+
+    with _figure_cache_lock:
+        figure = _figure_cache.get(key)
+        if figure is not None:
+            _figure_cache.move_to_end(key)
+            return figure
+
+    figure = build()
+
+    with _figure_cache_lock:
+        _figure_cache[key] = figure
+        while len(_figure_cache) > _FIGURE_CACHE_SIZE:
+            _figure_cache.popitem(last=False)
+
+    return figure
+
+
+# Finished runs keyed by (network cache key, request parameters, algorithm):
+# the network and requests are seeded, so the same key gives the same run
+_RUN_CACHE_SIZE = 16
+_run_cache: 'OrderedDict[Tuple, Tuple[Dict, Dict]]' = OrderedDict()
+_run_cache_lock = threading.Lock()
+
+
+def _get_cached_run(key: Tuple) -> Optional[Tuple[Dict, Dict]]:
+    """
+    Get a finished run's results and per-request records.
+
+    Args:
+        key: (network cache key, sorted request parameters, algorithm)
+
+    Returns:
+        Tuple of (results, records) (shared, do not mutate), or None
+    """
+    with _run_cache_lock:
+        run = _run_cache.get(key)
+        if run is not None:
+            _run_cache.move_to_end(key)
+        return run
+
+
+def _store_run(key: Tuple, results: Dict, records: Dict) -> None:
+    """Keep a finished run for later runs with the same inputs."""
+    with _run_cache_lock:
+        _run_cache[key] = (results, records)
+        while len(_run_cache) > _RUN_CACHE_SIZE:
+            _run_cache.popitem(last=False)
+
+
+def acceptance_curve(accepted_count: np.ndarray) -> np.ndarray:
+    """
+    Running acceptance ratio after each request.
+
+    Args:
+        accepted_count: Running number of accepted requests, in arrival
+            order (np.cumsum of the accepted flags)
+
+    Returns:
+        Array where element i is the fraction of requests 0..i accepted
+    """
+    return accepted_count / np.arange(1, accepted_count.size + 1, dtype=np.float64)
+
+
+def revenue_curve(revenue: np.ndarray) -> np.ndarray:
+    """
+    Cumulative revenue after each request.
+
+    Args:
+        revenue: Revenue per request (0 for rejected), in arrival order
+
+    Returns:
+        Running sum of revenue
+    """
+    return np.cumsum(revenue)
+
+
+def _typed_array(values: np.ndarray) -> Dict:
+    """
+    Encode a numeric array as a plotly typed array spec.
+
+    Figures below are built as plain dicts, which skips graph_objs
+    validation; the arrays still reach the browser as base64 like they
+    would through graph_objs.
+    """
+    values = np.ascontiguousarray(values)
+    return {'dtype': values.dtype.str[1:], 'bdata': base64.b64encode(values).decode()}
+
+
+def _layout(title: str, **layout) -> Dict:
+    """Figure layout with the dashboard template and a title."""
+    return dict(template=_TEMPLATE, title={'text': title}, **layout)
+
+
+def build_acceptance_figure(results: Dict, snapshot: Optional[SimSnapshot] = None) -> Dict:
+    """
+    Acceptance ratio over time figure for simulation results.
+
+    The curve is computed per request from the run's snapshot when given,
+    otherwise taken from the sampled time series in the results.
+    """
+    time_series = results['time_series']
+    traces = []
+
+    # Comparison runs: one curve per algorithm
+    for name, run in results.get('comparison', {}).items():
+        times, ratios = minmax_downsample(run.arrival_time, acceptance_curve(run.accepted_count) * 100)
+        traces.append({
+            'type': 'scattergl',
+            'x': _typed_array(times.astype(np.float32)),
+            'y': _typed_array(ratios.astype(np.float32)),
+            'mode': 'lines',
+            'name': name,
+            'line': {'color': _ALGORITHM_COLORS.get(name), 'width': 2}
+        })
+
+    # float32 arrays are sent to the browser as base64 typed arrays
+    if 'comparison' in results:
+        times = ratios = None
+    elif snapshot is not None and snapshot.num_requests:
+        times, ratios = minmax_downsample(snapshot.arrival_time, acceptance_curve(snapshot.accepted_count) * 100)
+        times, ratios = times.astype(np.float32), ratios.astype(np.float32)
+    elif time_series.get('time') and time_series.get('acceptance_ratio'):
+        times = np.asarray(time_series['time'], dtype=np.float32)
+        ratios = np.asarray(time_series['acceptance_ratio'], dtype=np.float32) * 100
+    else:
+        times = ratios = None
+
+    # Add time series line
+    if times is not None:
+        traces.append({
+            'type': 'scattergl',
+            'x': _typed_array(times),
+            'y': _typed_array(ratios),
+            'mode': 'lines',
+            'name': 'Acceptance Ratio',
+            'line': {'color': '#28a745', 'width': 2}
+        })
+
+    if 'comparison' in results:
+        title = f"Acceptance Ratio Over Time ({' vs '.join(results['comparison'])})"
+    else:
+        title = f"Acceptance Ratio Over Time ({results['algorithm']})"
+
+    return {'data': traces, 'layout': _layout(
+        title,
+        xaxis={'title': {'text': "Simulation Time"}},
+        yaxis={'title': {'text': "Acceptance Ratio (%)"}},
+        hovermode='x unified'
+    )}
+
+
+def build_revenue_figure(results: Dict, snapshot: Optional[SimSnapshot] = None) -> Dict:
+    """
+    Revenue and cost bar figure for simulation results.
+
+    With the run's snapshot, the cumulative revenue curve is drawn next to
+    the bars.
+    """
+    metrics = results['metrics']
+    with_curve = snapshot is not None and snapshot.num_requests > 0
+
+    # Bar chart with revenue and cost
+    traces = [{
+        'type': 'bar',
+        'x': ['Total Revenue', 'Total Cost'],
+        'y': _typed_array(np.array([metrics['total_revenue'], metrics['total_cost']], dtype=np.float32)),
+        'marker': {'color': ['#007bff', '#dc3545']},
+        'text': [f"${metrics['total_revenue']:.0f}", f"${metrics['total_cost']:.0f}"],
+        'textposition': 'auto'
+    }]
+    layout = _layout(
+        f"Revenue and Cost ({results['algorithm']})",
+        yaxis={'title': {'text': "Amount ($)"}},
+        showlegend=False
+    )
+
+    if with_curve:
+        times, revenue = lttb_downsample(snapshot.arrival_time, revenue_curve(snapshot.revenue))
+        traces[0].update(xaxis='x', yaxis='y')
+        traces.append({
+            'type': 'scattergl',
+            'x': _typed_array(times.astype(np.float32)),
+            'y': _typed_array(revenue.astype(np.float32)),
+            'mode': 'lines',
+            'name': 'Cumulative Revenue',
+            'line': {'color': '#007bff', 'width': 2},
+            'xaxis': 'x2',
+            'yaxis': 'y2'
+        })
+        layout.update(copy.deepcopy(_REVENUE_SUBPLOTS))
+        layout['yaxis']['title'] = {'text': "Amount ($)"}
+
+    return {'data': traces, 'layout': layout}
+
+
+def build_utilization_figure(results: Dict) -> Dict:
+    """Final CPU/bandwidth utilization bar figure for simulation results."""
+    util = results['final_utilization']
+    percents = np.clip(
+        [util['cpu_utilization_percent'], util['bandwidth_utilization_percent']], 0, 100
+    )
+
+    # Bar chart for CPU and bandwidth utilization; bar heights only need
+    # whole-percent resolution, so they are sent as uint8 (the labels keep
+    # one decimal). Clipping also hides float residue such as -0.0%.
+    return {
+        'data': [{
+            'type': 'bar',
+            'x': ['CPU Utilization', 'Bandwidth Utilization'],
+            'y': _typed_array(np.rint(percents).astype(np.uint8)),
+            'marker': {'color': ['#17a2b8', '#ffc107']},
+            'text': [f"{p:.1f}%" for p in percents],
+            'textposition': 'auto'
+        }],
+        'layout': _layout(
+            "Final Resource Utilization",
+            yaxis={'range': [0, 100], 'title': {'text': "Utilization (%)"}},
+            showlegend=False
+        )
+    }
+
+
+# Clientside network figure; node_locations is an (N, 2) array and links
+# an (L, 2) array of node rows. All links form one trace, broken into
+# segments by null gaps. __TEMPLATE__ is replaced by the plotly_white template.
+_NETWORK_FIGURE_JS = """
+function(data) {
+    const layout = {template: __TEMPLATE__};
+    if (!data) {
+        layout.title = {text: 'Run a simulation to see network topology'};
+        return {data: [], layout: layout};
+    }
+
+    const locations = data.node_locations;
+    const links = data.links;
+    const edgeX = new Array(3 * links.length).fill(null);
+    const edgeY = new Array(3 * links.length).fill(null);
+    links.forEach(function(link, i) {
+        const source = locations[link[0]];
+        const target = locations[link[1]];
+        edgeX[3 * i] = source[0];
+        edgeX[3 * i + 1] = target[0];
+        edgeY[3 * i] = source[1];
+        edgeY[3 * i + 1] = target[1];
+    });
+
+    const avgDegree = data.num_nodes > 0 ? 2 * data.num_links / data.num_nodes : 0;
+
+    return {
+        data: [
+            {
+                type: 'scattergl', x: edgeX, y: edgeY, mode: 'lines',
+                line: {color: '#adb5bd', width: 1}, hoverinfo: 'skip', name: 'Links'
+            },
+            {
+                type: 'scattergl',
+                x: locations.map(function(row) { return row[0]; }),
+                y: locations.map(function(row) { return row[1]; }),
+                mode: 'markers', marker: {size: 8, color: '#007bff'},
+                customdata: data.node_ids,
+                hovertemplate: '%{customdata}<br>(%{x:.1f}, %{y:.1f})<extra></extra>',
+                name: 'Nodes'
+            }
+        ],
+        layout: Object.assign(layout, {
+            title: {
+                text: 'Network Topology (' + data.num_nodes + ' nodes, ' + data.num_links +
+                      ' links, avg degree ' + avgDegree.toFixed(2) + ')'
+            },
+            showlegend: false,
+            xaxis: {showgrid: false, zeroline: false},
+            yaxis: {showgrid: false, zeroline: false, scaleanchor: 'x'},
+            // Keep the user's pan/zoom across updates
+            uirevision: 'topology'
+        })
+    };
+}
+"""
+
+
+def _run_algorithm(algorithm: str, network_params: Dict, request_params: Dict):
+    """
+    Run one algorithm on the dashboard's network and requests (worker process).
+
+    Args:
+        algorithm: "RT-CSP" or "RT-CSP+"
+        network_params: generate_physical_network_cached arguments
+        request_params: generate_slice_requests arguments
+
+    Returns:
+        Tuple of (results, per-request records)
+    """
+    from src.simulation import (
+        generate_physical_network_cached,
+        generate_slice_requests_cached,
+        SliceProvisioningSimulator
+    )
+    from src.simulation.topology_generator import NETWORK_CACHE_DIR
+
+    simulator = SliceProvisioningSimulator(
+        physical_network=generate_physical_network_cached(
+            cache_dir=NETWORK_CACHE_DIR, **network_params
+        ),
+        algorithm=algorithm,
+        verbose=False
+    )
+    simulator.add_slice_requests(generate_slice_requests_cached(**request_params))
+    results = simulator.run()
+
+    return results, simulator.get_request_records()
+
+
+def compare_algorithms(network_params: Dict, request_params: Dict,
+                       algorithms: Tuple[str, ...] = COMPARE_ALGORITHMS) -> Dict[str, Tuple[Dict, Dict]]:
+    """
+    Run several algorithms on the same network and requests in parallel.
+
+    Args:
+        network_params: generate_physical_network_cached arguments
+        request_params: generate_slice_requests arguments
+        algorithms: Algorithm names
+
+    Returns:
+        Dictionary mapping algorithm -> (results, per-request records)
+    """
+    workers = min(len(algorithms), os.cpu_count() or 1)
+
+    if workers <= 1:
+        return {
+            algorithm: _run_algorithm(algorithm, network_params, request_params)
+            for algorithm in algorithms
+        }
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            algorithm: executor.submit(_run_algorithm, algorithm, network_params, request_params)
+            for algorithm in algorithms
+        }
+        return {algorithm: future.result() for algorithm, future in futures.items()}
+
+
+def _empty_figure(title: str, **layout) -> Dict:
+    """Placeholder figure shown before a run has produced data."""
+    return {'data': [], 'layout': _layout(title, **layout)}
+
+
+# Placeholders shown before a run, built once at import and also used as
+# the initial layout values (shared, do not mutate)
+EMPTY_RESULT_FIGURES = (
+    _empty_figure("Run a simulation to see results",
+                  xaxis={'title': {'text': "Simulation Time"}},
+                  yaxis={'title': {'text': "Acceptance Ratio (%)"}}),
+    _empty_figure("Run a simulation to see results"),
+    _empty_figure("Run a simulation to see results")
+)
+EMPTY_NETWORK_FIGURE = _empty_figure("Run a simulation to see network topology")
+EMPTY_STATS = html.P("Run a simulation to see detailed statistics.", className="text-muted")
+
+
+def card_metrics(snapshot: SimSnapshot) -> Dict:
+    """
+    Values of the four metric cards, computed from a run's snapshot.
+
+    Args:
+        snapshot: Final snapshot of the run
+
+    Returns:
+        Dictionary with acceptance_ratio, total_revenue, revenue_cost_ratio
+        and accepted_requests
+    """
+    return {
+        'acceptance_ratio': snapshot.acceptance_ratio,
+        'total_revenue': snapshot.total_revenue,
+        'revenue_cost_ratio': snapshot.metrics.get('revenue_cost_ratio', 0.0),
+        'accepted_requests': snapshot.num_accepted
+    }
+
+
+def register_callbacks(app):
+    """Register all dashboard callbacks (once per app, safe to call again)."""
+    if getattr(app, '_callbacks_registered', False):
+        return
+    app._callbacks_registered = True
+
+    # Update slider labels in the browser (pure formatting, no server round
+    # trip); the layout already renders the initial labels
+    app.clientside_callback(
+        "function(value) { return 'Physical Nodes: ' + value; }",
         Output('nodes-label', 'children'),
-        Input('num-nodes-slider', 'value')
+        Input('num-nodes-slider', 'value'),
+        prevent_initial_call=True
     )
-    def update_nodes_label(value):
-        return f"Physical Nodes: {value}"
 
-    @app.callback(
+    app.clientside_callback(
+        "function(value) { return 'Slice Requests: ' + value; }",
         Output('requests-label', 'children'),
-        Input('num-requests-slider', 'value')
+        Input('num-requests-slider', 'value'),
+        prevent_initial_call=True
     )
-    def update_requests_label(value):
-        return f"Slice Requests: {value}"
 
-    @app.callback(
+    app.clientside_callback(
+        "function(value) { return 'Arrival Rate: ' + value.toFixed(2); }",
         Output('arrival-rate-label', 'children'),
-        Input('arrival-rate-slider', 'value')
+        Input('arrival-rate-slider', 'value'),
+        prevent_initial_call=True
     )
-    def update_arrival_rate_label(value):
-        return f"Arrival Rate: {value:.2f}"
 
-    @app.callback(
+    app.clientside_callback(
+        "function(value) { return 'Link Probability: ' + value.toFixed(1); }",
         Output('link-prob-label', 'children'),
-        Input('link-prob-slider', 'value')
+        Input('link-prob-slider', 'value'),
+        prevent_initial_call=True
     )
-    def update_link_prob_label(value):
-        return f"Link Probability: {value:.1f}"
 
-    # Run simulation with enhanced UX
+    # Start the simulation on a background thread; progress and results
+    # arrive through the /events stream (see streaming.py)
     @app.callback(
         [
-            Output('simulation-data', 'data'),
-            Output('network-data', 'data'),
+            Output('run-id', 'data'),
             Output('simulation-status', 'children'),
-            Output('loading-overlay', 'style'),
-            Output('loading-overlay', 'children'),
             Output('run-button', 'disabled'),
             Output('reset-button', 'disabled'),
-            Output('toast-container', 'children'),
             Output('progress-container', 'style'),
             Output('simulation-progress', 'value'),
-            Output('progress-text', 'children'),
-            Output('run-button', 'children')
+            Output('progress-text', 'children')
         ],
         [Input('run-button', 'n_clicks')],
         [
@@ -78,325 +592,373 @@ def register_callbacks(app):
             State('num-nodes-slider', 'value'),
             State('num-requests-slider', 'value'),
             State('arrival-rate-slider', 'value'),
-            State('link-prob-slider', 'value')
+            State('link-prob-slider', 'value'),
+            State('compare-mode', 'value'),
+            State('network-seed', 'data')
         ],
-        prevent_initial_call=True,
-        running=[
-            (Output('run-button', 'disabled'), True, False),
-            (Output('run-button', 'children'), [html.I(className="fas fa-spinner fa-spin me-2"), "Running..."], [html.I(className="fas fa-play me-2"), "Run Simulation"])
-        ]
+        prevent_initial_call=True
     )
-    def run_simulation(n_clicks, algorithm, topology, num_nodes, num_requests, arrival_rate, link_prob):
+    def run_simulation(n_clicks, algorithm, topology, num_nodes, num_requests, arrival_rate, link_prob,
+                       compare, network_seed):
         if n_clicks is None:
-            return None, None, "", {'display': 'none'}, None, False, False, None, {'display': 'none'}, 0, "", [html.I(className="fas fa-play me-2"), "Run Simulation"]
-
-        try:
-            # Show loading overlay
-            loading_overlay = html.Div([
-                html.Div([
-                    html.Div(className="spinner-custom"),
-                    html.H4("Running Simulation...", className="text-primary"),
-                    html.P(f"Provisioning {num_requests} slice requests on {num_nodes} nodes", className="text-muted"),
-                    html.P(f"Algorithm: {algorithm}", className="small text-muted")
-                ], className="loading-content")
-            ], className="loading-overlay")
-
-            # Progress indication
-            progress_style = {'display': 'block'}
-
-            # Step 1: Generate physical network (20% progress)
-            physical_network = generate_physical_network(
-                num_nodes=num_nodes,
-                topology_model=topology,
-                random_seed=42
+            return None, "", False, False, {'display': 'none'}, 0, ""
+
+        def simulate(publish, run_id):
+            # The simulation stack (networkx, scipy, numba) is imported on
+            # the first run rather than at dashboard start-up
+            from src.simulation import (
+                generate_physical_network_cached,
+                generate_slice_requests_cached,
+                SliceProvisioningSimulator
+            )
+            from src.simulation.topology_generator import (
+                NETWORK_CACHE_DIR,
+                network_cache_key
             )
-            progress_val = 20
-            progress_msg = f"Generated physical network with {physical_network.num_nodes()} nodes"
+
+            # Step 1: Generate physical network (20% progress); repeated
+            # parameter sets come from the network cache, which the dashboard
+            # keeps on disk across restarts. The seed changes only when the
+            # user regenerates the network
+            network_params = {
+                'num_nodes': num_nodes,
+                'topology_model': topology,
+                'random_seed': 42 if network_seed is None else network_seed
+            }
+            physical_network = generate_physical_network_cached(
+                cache_dir=NETWORK_CACHE_DIR, **network_params
+            )
+            publish({
+                'percent': 20,
+                'message': f"Generated physical network with {physical_network.num_nodes()} nodes"
+            })
 
             # Store network data
+            node_ids, locations = physical_network.get_location_array()
+            node_rows = {node_id: row for row, node_id in enumerate(node_ids)}
             network_data = {
                 'num_nodes': physical_network.num_nodes(),
-                'num_links': physical_network.num_links()
+                'num_links': physical_network.num_links(),
+                'cache_key': network_cache_key(**network_params),
+                'node_ids': node_ids,
+                # numpy arrays; the event stream encodes them natively
+                'node_locations': locations,
+                'links': np.array(
+                    [(node_rows[u], node_rows[v]) for u, v in physical_network.get_all_links()],
+                    dtype=np.int32
+                ).reshape(-1, 2)
             }
 
-            # Step 2: Generate slice requests (40% progress)
-            slice_requests = generate_slice_requests(
-                num_requests=num_requests,
-                arrival_rate=arrival_rate,
-                connection_probability=link_prob,
-                random_seed=42
-            )
-            progress_val = 40
-            progress_msg = f"Generated {len(slice_requests)} slice requests"
+            request_params = {
+                'num_requests': num_requests,
+                'arrival_rate': arrival_rate,
+                'connection_probability': link_prob,
+                'random_seed': 42
+            }
+            request_key = tuple(sorted(request_params.items()))
+
+            def run_key(name):
+                return (network_data['cache_key'], request_key, name)
+
+            if compare:
+                # Both algorithms on the same network and requests, one
+                # process each; the selected one feeds the cards and stats.
+                # Algorithms already run on these inputs are not rerun
+                runs = {name: _get_cached_run(run_key(name)) for name in COMPARE_ALGORITHMS}
+                missing = tuple(name for name, run in runs.items() if run is None)
+                if missing:
+                    publish({'percent': 40, 'message': f"Running {' and '.join(missing)}"
+                                                       + (" in parallel" if len(missing) > 1 else "")})
+                    for name, run in compare_algorithms(network_params, request_params, missing).items():
+                        _store_run(run_key(name), *run)
+                        runs[name] = run
+
+                results, records = runs[algorithm] if algorithm in runs else runs[COMPARE_ALGORITHMS[-1]]
+                # Cached results are shared; the comparison goes on a copy
+                results = dict(results)
+                results['comparison'] = {
+                    name: SimSnapshot.from_records(run_records, run_results['metrics'])
+                    for name, (run_results, run_records) in runs.items()
+                }
+                snapshot = SimSnapshot.from_records(records, results['metrics'])
+                registry.swap(run_id, snapshot)
+                registry.set_results(run_id, results)
+
+                return {'network': network_data, 'metrics': card_metrics(snapshot)}
+
+            cached = _get_cached_run(run_key(algorithm))
+            if cached is not None:
+                # Same network, requests and algorithm as an earlier run
+                results, records = cached
+                publish({'percent': 100, 'message': "Reused the results of an identical run"})
+                snapshot = SimSnapshot.from_records(records, results['metrics'])
+                registry.swap(run_id, snapshot)
+                registry.set_results(run_id, results)
+
+                return {'network': network_data, 'metrics': card_metrics(snapshot)}
+
+            # Step 2: Generate slice requests (40% progress); repeated
+            # parameter sets come from the request cache
+            slice_requests = generate_slice_requests_cached(**request_params)
+            publish({'percent': 40, 'message': f"Generated {len(slice_requests)} slice requests"})
+
+            # Step 3: Run simulation (40-100% progress, streamed live)
+            def report(frame):
+                registry.swap(run_id, SimSnapshot.from_records(simulator.get_request_records(), frame))
+                publish(dict(
+                    frame,
+                    percent=40 + 60 * frame['arrivals'] / max(num_requests, 1),
+                    message=f"Provisioned {frame['arrivals']}/{num_requests} requests "
+                            f"({frame['acceptance_ratio']:.1%} accepted)"
+                ))
 
-            # Step 3: Run simulation (80% progress)
             simulator = SliceProvisioningSimulator(
                 physical_network=physical_network,
                 algorithm=algorithm,
-                verbose=False
+                verbose=False,
+                progress_callback=report
             )
             simulator.add_slice_requests(slice_requests)
-            progress_val = 60
-            progress_msg = "Running provisioning simulation..."
-
             results = simulator.run()
-            progress_val = 100
-            progress_msg = "Simulation complete!"
-
-            # Success status
-            status = dbc.Alert([
-                html.I(className="fas fa-check-circle me-2"),
-                html.Span([
-                    html.Strong("Success! "),
-                    f"Accepted {results['metrics']['accepted_requests']}/{num_requests} requests ",
-                    f"({results['metrics']['acceptance_ratio']:.1%} acceptance ratio)"
-                ])
-            ], color="success", className="fade-in")
-
-            # Toast notification
-            toast = dbc.Toast([
-                html.I(className="fas fa-check-circle me-2 text-success"),
-                f"Simulation completed successfully!"
-            ], header=f"{algorithm} Results", icon="success", duration=4000, is_open=True,
-               style={"position": "fixed", "top": 80, "right": 20, "minWidth": 350})
-
-            # Hide loading overlay, enable buttons, reset button text
-            return (json.dumps(results, default=str), json.dumps(network_data), status,
-                    {'display': 'none'}, None, False, False, toast,
-                    {'display': 'none'}, 100, "Complete",
-                    [html.I(className="fas fa-play me-2"), "Run Simulation"])
-
-        except Exception as e:
-            # Error status
-            status = dbc.Alert([
-                html.I(className="fas fa-exclamation-triangle me-2"),
-                html.Span([
-                    html.Strong("Error: "),
-                    str(e)
-                ])
-            ], color="danger", className="fade-in")
-
-            # Error toast
-            toast = dbc.Toast([
-                html.I(className="fas fa-exclamation-triangle me-2 text-danger"),
-                "Simulation failed. Please check parameters."
-            ], header="Error", icon="danger", duration=4000, is_open=True,
-               style={"position": "fixed", "top": 80, "right": 20, "minWidth": 350})
+            records = simulator.get_request_records()
+            _store_run(run_key(algorithm), results, records)
+            snapshot = SimSnapshot.from_records(records, results['metrics'])
+            registry.swap(run_id, snapshot)
+            registry.set_results(run_id, results)
+
+            # Results stay on the server; the browser stores only the run ID
+            # and the four card values
+            return {'network': network_data, 'metrics': card_metrics(snapshot)}
+
+        run_id = registry.start(simulate)
+
+        status = dbc.Alert([
+            html.I(className="fas fa-spinner fa-spin me-2"),
+            html.Span([
+                html.Strong("Running... "),
+                f"Provisioning {num_requests} slice requests on {num_nodes} nodes ({algorithm})"
+            ])
+        ], color="info", className="fade-in")
+
+        return run_id, status, True, True, {'display': 'block'}, 0, "Starting simulation..."
+
+    # Follow the run's event stream in the browser and write its frames
+    # straight into the progress bar and the result stores
+    app.clientside_callback(
+        """
+        function(runId) {
+            const dc = window.dash_clientside;
+            if (window._simulationEvents) {
+                window._simulationEvents.close();
+                window._simulationEvents = null;
+            }
+            if (!runId) {
+                return null;
+            }
 
-            return (None, None, status, {'display': 'none'}, None, False, False, toast,
-                    {'display': 'none'}, 0, "",
-                    [html.I(className="fas fa-play me-2"), "Run Simulation"])
+            const source = new EventSource('/events?run=' + encodeURIComponent(runId));
+            window._simulationEvents = source;
+
+            const finish = function() {
+                source.close();
+                dc.set_props('run-button', {disabled: false});
+                dc.set_props('reset-button', {disabled: false});
+            };
+
+            source.onmessage = function(event) {
+                const frame = JSON.parse(event.data);
+                if (frame.type === 'progress') {
+                    dc.set_props('simulation-progress', {value: frame.percent});
+                    dc.set_props('progress-text', {children: frame.message});
+                } else if (frame.type === 'done') {
+                    const m = frame.metrics;
+                    dc.set_props('acceptance-ratio-card', {children: (m.acceptance_ratio * 100).toFixed(1) + '%'});
+                    dc.set_props('total-revenue-card', {children: '$' + m.total_revenue.toFixed(0)});
+                    dc.set_props('revenue-cost-card', {children: m.revenue_cost_ratio.toFixed(3)});
+                    dc.set_props('accepted-requests-card', {children: String(m.accepted_requests)});
+                    dc.set_props('simulation-data', {data: runId});
+                    dc.set_props('network-data', {data: frame.network});
+                    finish();
+                } else if (frame.type === 'error') {
+                    dc.set_props('run-error', {data: frame.message});
+                    finish();
+                }
+            };
+            source.onerror = function() {
+                if (source.readyState === EventSource.CLOSED) {
+                    dc.set_props('run-error', {data: 'Lost connection to the simulation'});
+                    finish();
+                }
+            };
+
+            return null;
+        }
+        """,
+        Output('run-error', 'data'),
+        Input('run-id', 'data'),
+        prevent_initial_call=True
+    )
 
-    # Update metric cards
+    # Report a finished run
     @app.callback(
         [
-            Output('acceptance-ratio-card', 'children'),
-            Output('total-revenue-card', 'children'),
-            Output('revenue-cost-card', 'children'),
-            Output('accepted-requests-card', 'children')
+            Output('simulation-status', 'children', allow_duplicate=True),
+            Output('toast-container', 'children', allow_duplicate=True),
+            Output('progress-container', 'style', allow_duplicate=True)
         ],
-        Input('simulation-data', 'data')
+        Input('simulation-data', 'data'),
+        State('algorithm-select', 'value'),
+        prevent_initial_call=True
     )
-    def update_metric_cards(data):
-        if data is None:
-            return "--", "--", "--", "--"
+    def report_simulation_done(run_id, algorithm):
+        results = registry.get_results(run_id)
+        if results is None:
+            return no_update, no_update, no_update
 
-        results = json.loads(data)
         metrics = results['metrics']
 
-        acceptance = f"{metrics['acceptance_ratio']:.1%}"
-        revenue = f"${metrics['total_revenue']:.0f}"
-        revenue_cost = f"{metrics['revenue_cost_ratio']:.3f}"
-        accepted = f"{metrics['accepted_requests']}"
-
-        return acceptance, revenue, revenue_cost, accepted
+        # Success status
+        status = dbc.Alert([
+            html.I(className="fas fa-check-circle me-2"),
+            html.Span([
+                html.Strong("Success! "),
+                f"Accepted {metrics['accepted_requests']}/{results['total_arrivals']} requests ",
+                f"({metrics['acceptance_ratio']:.1%} acceptance ratio)"
+            ])
+        ], color="success", className="fade-in")
 
-    # Update acceptance ratio plot
-    @app.callback(
-        Output('acceptance-ratio-plot', 'figure'),
-        Input('simulation-data', 'data')
-    )
-    def update_acceptance_plot(data):
-        if data is None:
-            # Empty plot
-            fig = go.Figure()
-            fig.update_layout(
-                title="Run a simulation to see results",
-                xaxis_title="Simulation Time",
-                yaxis_title="Acceptance Ratio (%)",
-                template="plotly_white"
-            )
-            return fig
-
-        results = json.loads(data)
-        time_series = results['time_series']
-
-        fig = go.Figure()
-
-        # Add time series line
-        if 'time' in time_series and 'acceptance_ratio' in time_series:
-            times = time_series['time']
-            ratios = [r * 100 for r in time_series['acceptance_ratio']]
-
-            fig.add_trace(go.Scatter(
-                x=times,
-                y=ratios,
-                mode='lines+markers',
-                name='Acceptance Ratio',
-                line=dict(color='#28a745', width=2),
-                marker=dict(size=6)
-            ))
-
-        fig.update_layout(
-            title=f"Acceptance Ratio Over Time ({results['algorithm']})",
-            xaxis_title="Simulation Time",
-            yaxis_title="Acceptance Ratio (%)",
-            template="plotly_white",
-            hovermode='x unified'
-        )
+        # Toast notification
+        toast = dbc.Toast([
+            html.I(className="fas fa-check-circle me-2 text-success"),
+            f"Simulation completed successfully!"
+        ], header=f"{results['algorithm']} Results", icon="success", duration=4000, is_open=True,
+           style={"position": "fixed", "top": 80, "right": 20, "minWidth": 350})
 
-        return fig
+        return status, toast, {'display': 'none'}
 
-    # Update revenue plot
+    # Report a failed run
     @app.callback(
-        Output('revenue-plot', 'figure'),
-        Input('simulation-data', 'data')
+        [
+            Output('simulation-status', 'children', allow_duplicate=True),
+            Output('toast-container', 'children', allow_duplicate=True),
+            Output('progress-container', 'style', allow_duplicate=True)
+        ],
+        Input('run-error', 'data'),
+        prevent_initial_call=True
     )
-    def update_revenue_plot(data):
-        if data is None:
-            fig = go.Figure()
-            fig.update_layout(
-                title="Run a simulation to see results",
-                template="plotly_white"
-            )
-            return fig
-
-        results = json.loads(data)
-        metrics = results['metrics']
+    def report_simulation_error(message):
+        if message is None:
+            return no_update, no_update, no_update
+
+        # Error status
+        status = dbc.Alert([
+            html.I(className="fas fa-exclamation-triangle me-2"),
+            html.Span([
+                html.Strong("Error: "),
+                message
+            ])
+        ], color="danger", className="fade-in")
 
-        fig = go.Figure()
-
-        # Bar chart with revenue and cost
-        fig.add_trace(go.Bar(
-            x=['Total Revenue', 'Total Cost'],
-            y=[metrics['total_revenue'], metrics['total_cost']],
-            marker_color=['#007bff', '#dc3545'],
-            text=[f"${metrics['total_revenue']:.0f}", f"${metrics['total_cost']:.0f}"],
-            textposition='auto'
-        ))
-
-        fig.update_layout(
-            title=f"Revenue and Cost ({results['algorithm']})",
-            yaxis_title="Amount ($)",
-            template="plotly_white",
-            showlegend=False
-        )
+        # Error toast
+        toast = dbc.Toast([
+            html.I(className="fas fa-exclamation-triangle me-2 text-danger"),
+            "Simulation failed. Please check parameters."
+        ], header="Error", icon="danger", duration=4000, is_open=True,
+           style={"position": "fixed", "top": 80, "right": 20, "minWidth": 350})
 
-        return fig
+        return status, toast, {'display': 'none'}
 
-    # Update utilization plot
+    # Draw a new topology seed for the following runs; networks and runs of
+    # other seeds stay cached, since the seed is part of their cache keys
     @app.callback(
-        Output('utilization-plot', 'figure'),
-        Input('simulation-data', 'data')
+        [
+            Output('network-seed', 'data'),
+            Output('toast-container', 'children', allow_duplicate=True)
+        ],
+        Input('regenerate-button', 'n_clicks'),
+        prevent_initial_call=True
+    )
+    def regenerate_network(n_clicks):
+        toast = dbc.Toast([
+            html.I(className="fas fa-project-diagram me-2 text-info"),
+            "New network seed drawn; the next run generates a new topology."
+        ], header="Network", icon="info", duration=3000, is_open=True,
+           style={"position": "fixed", "top": 80, "right": 20, "minWidth": 350})
+
+        return random.randrange(2 ** 31), toast
+
+    # Metric cards are filled in the browser from the run's 'done' frame
+    # (above); here they are only cleared when the results are reset.
+    # The layout already holds every placeholder, so none of the result
+    # callbacks below run on page load
+    app.clientside_callback(
+        """
+        function(runId) {
+            if (runId) {
+                throw window.dash_clientside.PreventUpdate;
+            }
+            return ['--', '--', '--', '--'];
+        }
+        """,
+        [
+            Output('acceptance-ratio-card', 'children'),
+            Output('total-revenue-card', 'children'),
+            Output('revenue-cost-card', 'children'),
+            Output('accepted-requests-card', 'children')
+        ],
+        Input('simulation-data', 'data'),
+        prevent_initial_call=True
     )
-    def update_utilization_plot(data):
-        if data is None:
-            fig = go.Figure()
-            fig.update_layout(
-                title="Run a simulation to see results",
-                template="plotly_white"
-            )
-            return fig
-
-        results = json.loads(data)
-        util = results['final_utilization']
-
-        fig = go.Figure()
-
-        # Bar chart for CPU and bandwidth utilization
-        fig.add_trace(go.Bar(
-            x=['CPU Utilization', 'Bandwidth Utilization'],
-            y=[util['cpu_utilization_percent'], util['bandwidth_utilization_percent']],
-            marker_color=['#17a2b8', '#ffc107'],
-            text=[f"{util['cpu_utilization_percent']:.1f}%",
-                  f"{util['bandwidth_utilization_percent']:.1f}%"],
-            textposition='auto'
-        ))
-
-        fig.update_layout(
-            title="Final Resource Utilization",
-            yaxis_title="Utilization (%)",
-            template="plotly_white",
-            showlegend=False,
-            yaxis=dict(range=[0, 100])
-        )
-
-        return fig
 
-    # Update network topology plot
+    # Update the acceptance, revenue and utilization plots together: one
+    # request and one results lookup per run instead of three
     @app.callback(
-        Output('network-topology-plot', 'figure'),
-        Input('network-data', 'data')
+        [
+            Output('acceptance-ratio-plot', 'figure'),
+            Output('revenue-plot', 'figure'),
+            Output('utilization-plot', 'figure')
+        ],
+        Input('simulation-data', 'data'),
+        prevent_initial_call=True
     )
-    def update_network_plot(data):
-        if data is None:
-            fig = go.Figure()
-            fig.update_layout(
-                title="Run a simulation to see network topology",
-                template="plotly_white"
-            )
-            return fig
-
-        network_data = json.loads(data)
-
-        # Create a simple network visualization
-        fig = go.Figure()
-
-        # For now, just show network statistics
-        fig.add_trace(go.Indicator(
-            mode="number+delta",
-            value=network_data['num_nodes'],
-            title={'text': "Physical Nodes"},
-            domain={'x': [0, 0.5], 'y': [0.5, 1]}
-        ))
-
-        fig.add_trace(go.Indicator(
-            mode="number",
-            value=network_data['num_links'],
-            title={'text': "Physical Links"},
-            domain={'x': [0.5, 1], 'y': [0.5, 1]}
-        ))
-
-        # Calculate average degree
-        avg_degree = (2 * network_data['num_links']) / network_data['num_nodes'] if network_data['num_nodes'] > 0 else 0
-
-        fig.add_trace(go.Indicator(
-            mode="number",
-            value=avg_degree,
-            title={'text': "Average Node Degree"},
-            domain={'x': [0.25, 0.75], 'y': [0, 0.5]}
-        ))
-
-        fig.update_layout(
-            title="Network Statistics",
-            template="plotly_white"
+    def update_result_plots(run_id):
+        results = registry.get_results(run_id)
+        if results is None:
+            return EMPTY_RESULT_FIGURES
+
+        snapshot = registry.get_snapshot(run_id)
+        suffix = '' if snapshot is None else '-requests'
+
+        return (
+            _cached_figure('acceptance' + suffix, run_id, lambda: build_acceptance_figure(results, snapshot)),
+            _cached_figure('revenue' + suffix, run_id, lambda: build_revenue_figure(results, snapshot)),
+            _cached_figure('utilization', run_id, lambda: build_utilization_figure(results))
         )
 
-        return fig
+    # Draw the network topology in the browser: the network-data store is
+    # already client-side, so the figure needs no server round trip
+    app.clientside_callback(
+        _NETWORK_FIGURE_JS.replace('__TEMPLATE__', json.dumps(_TEMPLATE)),
+        Output('network-topology-plot', 'figure'),
+        Input('network-data', 'data'),
+        prevent_initial_call=True
+    )
 
     # Update detailed stats
     @app.callback(
         Output('detailed-stats', 'children'),
-        Input('simulation-data', 'data')
+        Input('simulation-data', 'data'),
+        prevent_initial_call=True
     )
-    def update_detailed_stats(data):
-        if data is None:
-            return html.P("Run a simulation to see detailed statistics.", className="text-muted")
+    def update_detailed_stats(run_id):
+        results = registry.get_results(run_id)
+        if results is None:
+            return EMPTY_STATS
 
-        results = json.loads(data)
-        metrics = results['metrics']
+        # Older results may lack average_revenue
+        metrics = {'average_revenue': 0, **results['metrics']}
 
-        stats_table = dbc.Table([
+        return dbc.Table([
             html.Thead([
                 html.Tr([
                     html.Th("Metric"),
@@ -404,26 +966,11 @@ def register_callbacks(app):
                 ])
             ]),
             html.Tbody([
-                html.Tr([html.Td("Algorithm"), html.Td(results['algorithm'])]),
-                html.Tr([html.Td("Simulation Time"), html.Td(f"{results['simulation_time']:.2f}")]),
-                html.Tr([html.Td("Total Arrivals"), html.Td(str(results['total_arrivals']))]),
-                html.Tr([html.Td("Total Departures"), html.Td(str(results['total_departures']))]),
-                html.Tr([html.Td("Accepted Requests"), html.Td(str(metrics['accepted_requests']))]),
-                html.Tr([html.Td("Rejected Requests"), html.Td(str(metrics['rejected_requests']))]),
-                html.Tr([html.Td("Acceptance Ratio"), html.Td(f"{metrics['acceptance_ratio']:.2%}")]),
-                html.Tr([html.Td("Total Revenue"), html.Td(f"${metrics['total_revenue']:.2f}")]),
-                html.Tr([html.Td("Total Cost"), html.Td(f"${metrics['total_cost']:.2f}")]),
-                html.Tr([html.Td("Revenue/Cost Ratio"), html.Td(f"{metrics['revenue_cost_ratio']:.3f}")]),
-                html.Tr([html.Td("Average Revenue per Slice"), html.Td(f"${metrics.get('average_revenue', 0):.2f}")]),
-                html.Tr([html.Td("Physical Nodes"), html.Td(str(results['physical_network_stats']['num_nodes']))]),
-                html.Tr([html.Td("Physical Links"), html.Td(str(results['physical_network_stats']['num_links']))]),
-                html.Tr([html.Td("CPU Utilization"), html.Td(f"{results['final_utilization']['cpu_utilization_percent']:.2f}%")]),
-                html.Tr([html.Td("Bandwidth Utilization"), html.Td(f"{results['final_utilization']['bandwidth_utilization_percent']:.2f}%")]),
+                html.Tr([html.Td(label), html.Td(fmt.format(r=results, m=metrics))])
+                for label, fmt in _STAT_ROWS
             ])
         ], bordered=True, hover=True, striped=True)
 
-        return stats_table
-
     # Reset simulation (simplified - direct reset)
     @app.callback(
         [
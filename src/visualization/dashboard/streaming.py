@@ -0,0 +1,394 @@
+"""
+Simulation Streaming
+
+Runs dashboard simulations on background threads and pushes their progress
+to the browser over Server-Sent Events (SSE).
+
+Each run publishes JSON frames into the run registry; the /events endpoint
+on the Dash Flask server replays and follows a run's frames, so several
+browser tabs can observe the same run without re-computing it. Alongside
+the frames, a run holds its latest SimSnapshot and its final results, which
+server callbacks read directly; the browser only stores the run ID.
+
+With flask-caching installed (pip install .[cache]), finished results are
+also kept in a filesystem cache shared by all server processes. With
+orjson installed (pip install .[json]), frames and their numpy arrays are
+encoded by orjson instead of the stdlib json module.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+from flask import Response, abort, request
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    from flask_caching import Cache
+    CACHING_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    Cache = None
+    CACHING_AVAILABLE = False
+
+# Seconds finished results stay in the shared results cache
+RESULTS_TIMEOUT = 3600
+
+# Number of set bits in each byte value
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+@dataclass(frozen=True)
+class SimSnapshot:
+    """
+    Immutable view of a run's per-request outcomes.
+
+    The simulation thread builds a new snapshot from fresh array copies and
+    swaps it into the registry; readers never see arrays being written.
+
+    Accepted flags are packed one bit per request (np.packbits); counts
+    come from a byte popcount table instead of unpacking.
+
+    Attributes:
+        arrival_time: Arrival time of each processed request
+        revenue: Revenue of each request (0 if rejected)
+        accepted_bits: Packed accepted flags, big-endian bit order
+        num_requests: Number of requests (the bitmap is padded to bytes)
+        metrics: Scalar metrics at snapshot time
+    """
+    arrival_time: np.ndarray
+    revenue: np.ndarray
+    accepted_bits: np.ndarray
+    num_requests: int
+    metrics: Dict = field(default_factory=dict)
+
+    @classmethod
+    def from_records(cls, records: Dict[str, np.ndarray], metrics: Optional[Dict] = None) -> 'SimSnapshot':
+        """
+        Build a snapshot from SliceProvisioningSimulator.get_request_records().
+
+        The arrays are marked read-only so a shared snapshot cannot be
+        modified in place.
+        """
+        arrays = {
+            'arrival_time': records['arrival_time'],
+            'revenue': records['revenue'],
+            'accepted_bits': np.packbits(records['accepted'])
+        }
+        for array in arrays.values():
+            array.setflags(write=False)
+
+        return cls(num_requests=len(records['accepted']), metrics=dict(metrics or {}), **arrays)
+
+    @property
+    def accepted(self) -> np.ndarray:
+        """Accepted flag of each request, unpacked to a bool array."""
+        return np.unpackbits(self.accepted_bits, count=self.num_requests).view(bool)
+
+    @cached_property
+    def accepted_count(self) -> np.ndarray:
+        """Running number of accepted requests (built once per snapshot)."""
+        return np.cumsum(self.accepted, dtype=np.uint32)
+
+    @property
+    def num_accepted(self) -> int:
+        # Padding bits of the last byte are zero
+        return int(_POPCOUNT[self.accepted_bits].sum())
+
+    @property
+    def total_revenue(self) -> float:
+        return float(self.revenue.sum())
+
+    @property
+    def acceptance_ratio(self) -> float:
+        return self.num_accepted / self.num_requests if self.num_requests else 0.0
+
+
+class _Run:
+    """Frames and completion state of one simulation run."""
+
+    __slots__ = ('frames', 'done', 'snapshot', 'results')
+
+    def __init__(self):
+        self.frames: List[Dict] = []
+        self.done = False
+        self.snapshot: Optional[SimSnapshot] = None
+        self.results: Optional[Dict] = None
+
+
+class RunRegistry:
+    """
+    Thread-safe registry of simulation runs, keyed by run ID.
+
+    A run's target is called on a daemon thread with a publish function for
+    progress frames. Its return value is published as the final 'done'
+    frame, an exception as an 'error' frame.
+    """
+
+    def __init__(self, max_runs: int = 16):
+        """
+        Initialize the registry.
+
+        Args:
+            max_runs: Number of runs kept; the oldest finished runs are
+                dropped beyond this
+        """
+        self.max_runs = max_runs
+        self._runs: 'OrderedDict[str, _Run]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        # Optional flask_caching.Cache; keeps results beyond max_runs and
+        # shares them between server processes
+        self.results_cache = None
+
+    def start(self, target: Callable[[Callable[[Dict], None], str], Dict]) -> str:
+        """
+        Start a run on a background thread.
+
+        Args:
+            target: Function taking a publish(frame) callback and the run ID
+                (for swap) and returning the final results frame
+
+        Returns:
+            Run ID
+        """
+        run_id = uuid.uuid4().hex
+
+        with self._lock:
+            self._runs[run_id] = _Run()
+            self._evict()
+
+        def publish(frame: Dict) -> None:
+            self.publish(run_id, dict(frame, type='progress'))
+
+        def work() -> None:
+            try:
+                final = dict(target(publish, run_id), type='done')
+            except Exception as e:
+                final = {'type': 'error', 'message': str(e)}
+            self.publish(run_id, final, done=True)
+
+        threading.Thread(target=work, name=f"simulation-{run_id[:8]}", daemon=True).start()
+
+        return run_id
+
+    def publish(self, run_id: str, frame: Dict, done: bool = False) -> None:
+        """
+        Append a frame to a run and wake its observers.
+
+        Args:
+            run_id: Run ID
+            frame: JSON-serializable frame
+            done: Whether this is the run's final frame
+        """
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is None:
+                return
+            run.frames.append(frame)
+            run.done = run.done or done
+            self._changed.notify_all()
+
+    def swap(self, run_id: str, snapshot: SimSnapshot) -> None:
+        """
+        Replace a run's snapshot.
+
+        Args:
+            run_id: Run ID
+            snapshot: New snapshot; the previous one stays valid for readers
+                still holding it
+        """
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is not None:
+                run.snapshot = snapshot
+
+    def set_results(self, run_id: str, results: Dict) -> None:
+        """
+        Store a run's final results server-side.
+
+        Args:
+            run_id: Run ID
+            results: Simulation results dictionary
+        """
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is not None:
+                run.results = results
+
+        if self.results_cache is not None:
+            self.results_cache.set(f"results:{run_id}", results, timeout=RESULTS_TIMEOUT)
+
+    def get_results(self, run_id: Optional[str]) -> Optional[Dict]:
+        """
+        Get a run's final results.
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            Results dictionary (shared, do not mutate), or None if the run
+            is unknown, unfinished or expired
+        """
+        if not run_id:
+            return None
+
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is not None and run.results is not None:
+                return run.results
+
+        if self.results_cache is not None:
+            return self.results_cache.get(f"results:{run_id}")
+
+        return None
+
+    def get_snapshot(self, run_id: Optional[str]) -> Optional[SimSnapshot]:
+        """
+        Get a run's latest snapshot.
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            Latest snapshot, or None if the run is unknown or has none yet
+        """
+        with self._lock:
+            run = self._runs.get(run_id)
+            return run.snapshot if run is not None else None
+
+    def stream(self, run_id: str, timeout: float = 15.0) -> Iterator[Optional[Dict]]:
+        """
+        Yield a run's frames from the first one, following it until done.
+
+        Args:
+            run_id: Run ID
+            timeout: Seconds to wait for a new frame before yielding None
+                (lets the caller send a keep-alive)
+
+        Yields:
+            Frames in publish order, or None after an idle timeout
+        """
+        position = 0
+
+        while True:
+            with self._lock:
+                run = self._runs.get(run_id)
+                if run is None:
+                    return
+                if position == len(run.frames) and not run.done:
+                    self._changed.wait(timeout)
+                frames = run.frames[position:]
+                done = run.done
+
+            if not frames and not done:
+                yield None
+            for frame in frames:
+                yield frame
+            position += len(frames)
+
+            if done and position == len(run.frames):
+                return
+
+    def __contains__(self, run_id: str) -> bool:
+        with self._lock:
+            return run_id in self._runs
+
+    def _evict(self) -> None:
+        """Drop the oldest finished runs beyond max_runs (lock held)."""
+        for run_id in [run_id for run_id, run in self._runs.items() if run.done]:
+            if len(self._runs) <= self.max_runs:
+                break
+            del self._runs[run_id]
+
+
+# Runs shared by all dashboard sessions of this server process
+registry = RunRegistry()
+
+
+def _json_default(value):
+    """Fallback encoder for the stdlib json path: numpy to Python, else str."""
+    if isinstance(value, np.ndarray):
+        # Non-finite values become null, as with orjson
+        if value.dtype.kind == 'f':
+            return np.where(np.isfinite(value), value, None).tolist()
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def encode_frame(frame: Dict) -> str:
+    """
+    Encode a frame as JSON, with orjson when it is installed.
+
+    Numpy arrays are serialized natively by orjson (in C, without a
+    tolist() copy); the stdlib fallback converts them in _json_default.
+
+    Args:
+        frame: Frame dictionary (may contain numpy arrays and scalars)
+
+    Returns:
+        JSON text
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            frame,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    return json.dumps(frame, default=_json_default)
+
+
+def register_event_stream(app) -> None:
+    """
+    Mount the /events SSE endpoint on the Dash app's Flask server.
+
+    Clients connect with /events?run=<run_id> and receive each frame as a
+    'data:' line of JSON. Calling this again for the same app is a no-op.
+
+    With flask-caching installed, finished results are also kept in a
+    filesystem cache so they outlive the registry and are visible to every
+    server process.
+    """
+    if 'simulation_events' in app.server.view_functions:
+        return
+
+    if CACHING_AVAILABLE and registry.results_cache is None:
+        registry.results_cache = Cache(app.server, config={
+            'CACHE_TYPE': 'FileSystemCache',
+            'CACHE_DIR': os.path.join(tempfile.gettempdir(), 'slice-dashboard-results'),
+            'CACHE_DEFAULT_TIMEOUT': RESULTS_TIMEOUT
+        })
+
+    @app.server.route('/events')
+    def simulation_events():
+        run_id = request.args.get('run', '')
+        if run_id not in registry:
+            abort(404)
+
+        def events() -> Iterator[str]:
+            for frame in registry.stream(run_id):
+                if frame is None:
+                    yield ": keep-alive\n\n"
+                else:
+                    yield f"data: {encode_frame(frame)}\n\n"
+
+        return Response(
+            events(),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
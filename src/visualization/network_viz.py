@@ -9,7 +9,8 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import networkx as nx
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Set
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Tuple, Optional, Set
 from pathlib import Path
 
 from ..core.graph.physical_network import PhysicalNetwork
@@ -33,6 +34,20 @@ EDGE_COLORS = {
 FIGURE_SIZE = (12, 8)
 DPI = 150
 
+# Seed for force-directed layouts, so repeated plots of a graph match
+LAYOUT_SEED = 42
+
+# Computed layouts, keyed by (layout type, nodes, edges, layout kwargs)
+_LAYOUT_CACHE_SIZE = 64
+_layout_cache: 'OrderedDict[Tuple, Dict]' = OrderedDict()
+
+_LAYOUT_FUNCTIONS = {
+    'spring': nx.spring_layout,
+    'circular': nx.circular_layout,
+    'kamada_kawai': nx.kamada_kawai_layout,
+    'spectral': nx.spectral_layout,
+}
+
 
 def create_network_layout(
     graph: nx.Graph,
@@ -51,6 +66,11 @@ def create_network_layout(
 
     Returns:
         Dictionary mapping node_id -> (x, y) position
+
+    Note:
+        Spring layouts are seeded with LAYOUT_SEED unless a seed is given,
+        and computed layouts are memoized per graph structure, so drawing
+        the same topology again skips the force simulation.
     """
     # Try to use existing positions from node attributes
     if use_positions and layout_type == 'positions':
@@ -63,18 +83,30 @@ def create_network_layout(
         if pos and len(pos) == len(graph.nodes()):
             return pos
 
-    # Otherwise, use NetworkX layout algorithms
+    # Otherwise, use NetworkX layout algorithms (default to spring layout)
+    if layout_type not in _LAYOUT_FUNCTIONS:
+        layout_type = 'spring'
     if layout_type == 'spring':
-        return nx.spring_layout(graph, **kwargs)
-    elif layout_type == 'circular':
-        return nx.circular_layout(graph, **kwargs)
-    elif layout_type == 'kamada_kawai':
-        return nx.kamada_kawai_layout(graph, **kwargs)
-    elif layout_type == 'spectral':
-        return nx.spectral_layout(graph, **kwargs)
+        kwargs.setdefault('seed', LAYOUT_SEED)
+
+    try:
+        key = (layout_type, tuple(graph.nodes()), tuple(graph.edges()),
+               tuple(sorted(kwargs.items())))
+        hash(key)
+    except TypeError:
+        # Unhashable layout arguments (e.g. an initial pos dict): no memo
+        return _LAYOUT_FUNCTIONS[layout_type](graph, **kwargs)
+
+    pos = _layout_cache.get(key)
+    if pos is None:
+        pos = _LAYOUT_FUNCTIONS[layout_type](graph, **kwargs)
+        _layout_cache[key] = pos
+        while len(_layout_cache) > _LAYOUT_CACHE_SIZE:
+            _layout_cache.popitem(last=False)
     else:
-        # Default to spring layout
-        return nx.spring_layout(graph, **kwargs)
+        _layout_cache.move_to_end(key)
+
+    return dict(pos)
 
 
 def visualize_physical_network(
@@ -320,8 +352,8 @@ def visualize_slice_request(
 def visualize_slice_mapping(
     physical_network: PhysicalNetwork,
     slice_request: SliceRequest,
-    node_mapping: Dict[str, str],
-    link_mapping: Dict[Tuple[str, str], List[str]],
+    node_mapping: Dict[Hashable, str],
+    link_mapping: Dict[Tuple[Hashable, Hashable], List[str]],
     layout_type: str = 'positions',
     title: Optional[str] = None,
     output_path: Optional[str] = None,